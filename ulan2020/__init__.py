@@ -4,56 +4,26 @@ class MatchException(Exception):
     def __init__(self, value):
         self.value = value
 
-class New:
-    def __init__(self, cell):
-        self.cell = cell
-
-    def __umatch__(self, other):
-        self.cell.cell_contents = other
-        return True
-
-class GlobalNew:
-    def __init__(self, globals, name):
-        self.globals = globals
-        self.name = name
-
-    def __umatch__(self, other):
-        self.globals[self.name] = other
-        return True
-
-
-class GlobalVar:
-    def __init__(self, globals, name):
-        self.globals = globals
-        self.name = name
-
-    def __umatch__(self, other):
-        return self.globals[self.name] == other
-
-class Var:
-    def __init__(self, cell):
-        self.cell = cell
-
-    def __umatch__(self, other):
-        return self.cell.cell_contents == other
-
-class Value:
-    def __init__(self, value):
-        self.value = value
-
-    def __umatch__(self, other):
-        return self.value == other
-
 _exec = exec
 
+def case(table, value):
+    # the index of the first key equal to value, len(table) if none is.
+    # for these types a lookup finds the same key
+    if type(value) in (int, float, str, bool):
+        return table.get(value, len(table))
+    for key, index in table.items():
+        if key == value:
+            return index
+    return len(table)
+
 builtins = {
-    ".gnew": GlobalNew,
-    ".gvar": GlobalVar,
-    ".globals": globals,
-    ".new": New,
-    ".var": Var,
-    ".value": Value,
     ".MatchException": MatchException,
+    ".isinstance": isinstance,
+    ".len": len,
+    ".tuple": tuple,
+    ".list": list,
+    ".case": case,
+    ".globals": globals,
     "__import__": __import__
 }
 
@@ -65,3 +35,6 @@ def exec(code, globals=None, locals=None):
     if locals is None:
         locals = {}
     _exec(code, globals, locals)
+
+from .importer import install
+install()
@@ -1,7 +1,9 @@
 import sys
+from argparse import ArgumentParser, REMAINDER
 from types import ModuleType
 from code import InteractiveConsole
 from . import compile, exec
+from .cache import compile_file
 
 
 class InteractiveShell(InteractiveConsole):
@@ -25,14 +27,20 @@ class InteractiveShell(InteractiveConsole):
             self.showtraceback()
 
 
-if len(sys.argv) > 1:
-    del sys.argv[0]
+argparser = ArgumentParser(prog="python3 -mulan2020")
+group = argparser.add_mutually_exclusive_group()
+group.add_argument("--no-cache", action="store_true", help="neither read nor write cached bytecode")
+group.add_argument("--rebuild-cache", action="store_true", help="recompile and overwrite cached bytecode")
+argparser.add_argument("argv", nargs=REMAINDER, help="script and its arguments")
+args = argparser.parse_args()
+
+if args.argv:
+    sys.argv[:] = args.argv
     mod = ModuleType("__main__")
     sys.modules['__main__'] = mod.__dict__
     filename = sys.argv[0]
 
-    with open(filename, "r") as f:
-        code = compile(f.read(), filename)
+    code = compile_file(filename, not args.no_cache, args.rebuild_cache)
 
     exec(code, mod.__dict__)
 else:
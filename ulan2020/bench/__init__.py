@@ -0,0 +1,11 @@
+from timeit import timeit
+
+
+def best(calls, number, repeat):
+    # the least time one call of each function in calls takes. they take
+    # turns, as the machine may be busy
+    times = {name: [] for name in calls}
+    for _ in range(repeat):
+        for name, call in calls.items():
+            times[name].append(timeit(call, number=number))
+    return {name: min(runs) / number for name, runs in times.items()}
@@ -0,0 +1,52 @@
+import os
+from timeit import timeit
+from .. import compile, exec
+from ..compile import BACKENDS
+
+PROGRAMS = {
+    "let": (
+        "def f(a):\n" + "".join(f"  let x{i} = a; let x{i} = a;\n" for i in range(500)) + "end\n",
+        "f(1)"),
+    "tailcall": (
+        """
+let sub = ::int->__sub__;
+def f(n):
+  if let 0 = n: return 0; end
+  return f(sub(n, 1));
+end
+""",
+        "f(10000)"),
+    "for let": (
+        """
+def f(rows):
+  let out = [];
+  for let (k, 1) in rows: out->append(k); end
+  return out;
+end
+let rows = ::list(::zip(::range(10000), itertools::cycle((0, 1))));
+""",
+        "f(rows)"),
+    "learnxinyminutes": (
+        open(os.path.join(os.path.dirname(__file__), "..", "..", "learnxinyminutes.ul"), encoding="utf-8").read(),
+        None),
+}
+
+
+def main(number=20):
+    print(f"{'program':18} {'backend':8} {'compile':>12} {'run':>12}")
+    for name, (source, call) in PROGRAMS.items():
+        for backend in BACKENDS:
+            t = timeit(lambda: compile(source, "<bench>", backend=backend), number=number)
+            if call is None:
+                run = "-"
+            else:
+                d = {}
+                exec(compile(source, "<bench>", backend=backend), d)
+                code = compile(call + ";", "<bench>", tuple(d), backend=backend)
+                r = timeit(lambda: exec(code, d), number=number)
+                run = f"{r / number * 1e6:9.1f} us"
+            print(f"{name:18} {backend:8} {t / number * 1e6:9.1f} us {run:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+from .. import compile, exec
+from . import best
+
+
+def case_source(n):
+    arms = "".join(f"  when ({{[m{i}]}}, x): return ({i}, x);\n" for i in range(n))
+    return f"def route(msg):\n  case msg\n{arms}  else: return ();\n  end\nend\n"
+
+
+def chain_source(n):
+    arms = " else ".join(f"if let ({{[m{i}]}}, x) = msg: return ({i}, x);\n" for i in range(n))
+    return f"def route(msg):\n  {arms}  end\n  return ();\nend\n"
+
+
+def main(number=20, repeat=5):
+    print(f"{'arms':>4} {'router':12} {'run':>12}")
+    for n in (10, 100, 300):
+        msgs = [(f"m{i}", i) for i in range(n)] * (3000 // n)
+        routers = {}
+        for name, source, backend in (
+                ("case", case_source(n), "codegen"),
+                ("case pyast", case_source(n), "pyast"),
+                ("if let", chain_source(n), "codegen")):
+            d = {}
+            exec(compile(source, "<bench>", backend=backend), d)
+            routers[name] = d["route"]
+        times = best({
+            name: lambda route=route: [route(msg) for msg in msgs]
+            for name, route in routers.items()}, number, repeat)
+        for name, t in times.items():
+            print(f"{n:4} {name:12} {t / len(msgs) * 1e9:9.1f} ns")
+
+
+if __name__ == '__main__':
+    main()
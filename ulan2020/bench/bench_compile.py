@@ -0,0 +1,29 @@
+from time import perf_counter
+from ..compile import Lexer, Parser, ScopeVisitor, SymbolTable, CodegenVisitor
+
+
+def source(n):
+    # distinct names, attribute names and constants in every statement
+    return "".join(f"let x{i} = (x->a{i}, {i}, {{[s{i}]}});\n" if i else "let x = 0;\n" for i in range(n))
+
+
+def measure(n):
+    text = source(n)
+    start = perf_counter()
+    node = Parser("<bench>", text).parse(Lexer("<bench>").tokenize(text))
+    middle = perf_counter()
+    ScopeVisitor("<bench>", text).visit(node, SymbolTable())
+    CodegenVisitor("<bench>", text).visit(node)
+    end = perf_counter()
+    return middle - start, end - middle
+
+
+def main():
+    print(f"{'statements':>10} {'parse':>14} {'scope+codegen':>14}")
+    for n in (12500, 25000, 50000):
+        parse, codegen = measure(n)
+        print(f"{n:10} {parse / n * 1e6:8.1f} us/op {codegen / n * 1e6:8.1f} us/op")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+from time import perf_counter
+from .. import compile
+from .bench_visit import TEMPLATE
+from .bench_compile import source
+
+
+def corpus(n):
+    # functions with patterns, loops and calls, then flat statements
+    return "".join(TEMPLATE.format(i=i) for i in range(n)) + source(n * 5)
+
+
+def measure(text, number=3):
+    times = []
+    for _ in range(number):
+        start = perf_counter()
+        compile(text, "<bench>")
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{'lines':>8} {'source':>10} {'compile':>10} {'rate':>14}")
+    for n in (1000, 2000, 4000):
+        text = corpus(n)
+        lines = text.count("\n")
+        size = len(text.encode())
+        time = measure(text)
+        print(f"{lines:8} {size / 1e6:7.2f} MB {time:8.2f} s {lines / time / 1e3:8.1f} k lines/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+from time import perf_counter
+from ..compile.asm import get_assembler
+
+N = 200000
+
+
+def emit(asm, n):
+    for _ in range(n // 5):
+        asm.LOAD_FAST(0)
+        asm.LOAD_CONST(1)
+        asm.ROT_TWO()
+        asm.POP_TOP()
+        asm.POP_TOP()
+
+
+def main(number=5):
+    assembler = get_assembler()
+    emitted = built = 0
+    for _ in range(number):
+        asm = assembler()
+        start = perf_counter()
+        emit(asm, N)
+        middle = perf_counter()
+        asm.build(1, 0, 0, (), ("a",), "<bench>", "f", 1, (), ())
+        end = perf_counter()
+        emitted += middle - start
+        built += end - middle
+    print(f"emit  {N * number / emitted / 1e6:6.2f} M instructions/s")
+    print(f"build {N * number / built / 1e6:6.2f} M instructions/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from time import perf_counter
+from .. import compile, exec
+from .bench_corpus import corpus
+from .bench_peephole import count
+from . import best
+
+PROGRAMS = {
+    "table": (
+        """
+def table():
+  return ((0, {[zero]}, (0, 0)), (1, {[one]}, (0, 1)), (2, {[two]}, (1, 0)), (3, {[three]}, (1, 1)));
+end
+""",
+        "table()"),
+    "list": (
+        """
+def rows(): return [1, 2, 3, 4, 5, 6, 7, 8]; end
+""",
+        "rows()"),
+    "set": (
+        """
+def words(): return {{[a]}, {[b]}, {[c]}, {[d]}, {[e]}, {[f]}}; end
+""",
+        "words()"),
+    "for in set": (
+        """
+def f(n):
+  for let k in ::range(n):
+    for let x in {1, 2, 3, 4, 5, 6}: x; end
+  end
+end
+""",
+        "f(100)"),
+}
+
+
+def main(number=2000, repeat=5):
+    print(f"{'program':12} {'fold':4} {'insts':>6} {'run':>12}")
+    for name, (source, call) in PROGRAMS.items():
+        codes, calls = {}, {}
+        for fold in (False, True):
+            d = {}
+            codes[fold] = compile(source, "<bench>", fold=fold)
+            exec(codes[fold], d)
+            run = compile(call + ";", "<bench>", tuple(d), fold=fold)
+            calls[fold] = lambda run=run, d=d: exec(run, d)
+        times = best(calls, number, repeat)
+        for fold, code in codes.items():
+            print(f"{name:12} {'on' if fold else 'off':4} {count(code):6} {times[fold] * 1e6:9.2f} us")
+
+    text = corpus(500)
+    times = {fold: [] for fold in (False, True)}
+    for _ in range(3):
+        for fold in times:
+            start = perf_counter()
+            compile(text, "<bench>", fold=fold)
+            times[fold].append(perf_counter() - start)
+    for fold in times:
+        print(f"compile corpus, fold {'on' if fold else 'off'}: {min(times[fold]):.2f} s")
+
+
+if __name__ == '__main__':
+    main()
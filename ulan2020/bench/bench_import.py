@@ -0,0 +1,49 @@
+import builtins
+from .. import compile, exec
+from . import best
+
+SOURCE = """
+def lens(rows):
+  for let row in rows: ::len(row); end
+end
+
+def depth(n):
+  if let 0 = n: return ::len(::str(n)); end
+  return depth(::int->__sub__(n, 1));
+end
+"""
+
+PYTHON_SOURCE = """
+def lens(rows):
+    for row in rows:
+        len(row)
+"""
+
+N = 100000
+
+
+def main(number=5, repeat=5):
+    rows = [()] * N
+    cases = {}
+    for cache_imports in (False, True):
+        d = {}
+        exec(compile(SOURCE, "<bench>", cache_imports=cache_imports), d)
+        cases["cached" if cache_imports else "imported"] = d
+    d = {}
+    builtins.exec(PYTHON_SOURCE, d)
+    cases["python"] = d
+
+    calls = [
+        ("lens", lambda d: d["lens"](rows), N),
+        ("depth", lambda d: d["depth"](500), 500),
+    ]
+    for name, call, n in calls:
+        times = best({
+            case: lambda d=d: call(d)
+            for case, d in cases.items() if name in d}, number, repeat)
+        for case, t in times.items():
+            print(f"{name:6} {case:9} {t / n * 1e9:8.1f} ns per item")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import builtins
+from timeit import timeit
+from .. import compile, exec
+
+N = 1000
+
+
+def module_source():
+    return "".join(f"let x{i} = {i}; let x{i} = {i};\n" for i in range(N))
+
+
+def function_source():
+    return "def f(a):\n" + "".join(f"  let x{i} = a; let x{i} = a;\n" for i in range(N)) + "end\n"
+
+
+def python_module_source():
+    return "".join(f"x{i} = {i}\nassert x{i} == {i}\n" for i in range(N))
+
+
+def python_function_source():
+    return "def f(a):\n" + "".join(f"  x{i} = a\n  assert x{i} == a\n" for i in range(N))
+
+
+def report(name, seconds, number):
+    print(f"{name:24} {seconds / number / (2 * N) * 1e9:8.1f} ns/let")
+
+
+def main(number=200):
+    code = compile(module_source(), "<bench>")
+    report("module scope", timeit(lambda: exec(code, {}), number=number), number)
+    pycode = builtins.compile(python_module_source(), "<bench>", "exec")
+    report("module scope (python)", timeit(lambda: builtins.exec(pycode, {}), number=number), number)
+
+    d = {}
+    exec(compile(function_source(), "<bench>"), d)
+    f = d["f"]
+    report("function scope", timeit(lambda: f(1), number=number), number)
+    d = {}
+    builtins.exec(python_function_source(), d)
+    f = d["f"]
+    report("function scope (python)", timeit(lambda: f(1), number=number), number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+from time import perf_counter
+from ..compile import Lexer, Scanner
+from .bench_corpus import corpus
+
+
+def best(func, number=5):
+    times = []
+    for _ in range(number):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main(n=2000):
+    text = corpus(n)
+    tokens = len(Scanner("<bench>").scan(text))
+    cases = [
+        ("sly lexer", lambda: list(Lexer("<bench>").tokenize(text))),
+        ("scanner, arrays", lambda: Scanner("<bench>").scan(text)),
+        ("scanner, tokens", lambda: list(Scanner("<bench>").tokenize(text))),
+    ]
+    print(f"{tokens} tokens, {len(text.encode()) / 1e6:.2f} MB")
+    for name, func in cases:
+        print(f"{name:16} {tokens / best(func) / 1e6:6.2f} M tokens/s")
+
+
+if __name__ == '__main__':
+    main()
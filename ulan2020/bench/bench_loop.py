@@ -0,0 +1,64 @@
+import builtins
+from time import perf_counter
+from .. import compile, exec
+
+SOURCE = """
+let sub = ::int->__sub__;
+
+def count(n):
+  for let i in n: end
+end
+
+def count_tail(n):
+  if let 0 = n: return 0; end
+  return count_tail(sub(n, 1));
+end
+
+def filter_rows(rows):
+  for let (k, 1) in rows: end
+end
+"""
+
+PYTHON_SOURCE = """
+def count(n):
+    for i in n:
+        pass
+
+def filter_rows(rows):
+    for row in rows:
+        if isinstance(row, tuple) and len(row) == 2:
+            k, v = row
+            if v == 1:
+                pass
+"""
+
+N = 100000
+
+
+def measure(f, arg, number=20):
+    start = perf_counter()
+    for _ in range(number):
+        f(arg)
+    return (perf_counter() - start) / (N * number)
+
+
+def report(name, seconds):
+    print(f"{name:24} {seconds*1e9:8.1f} ns/item")
+
+
+def main():
+    d = {}
+    exec(compile(SOURCE, "<bench>"), d)
+    py = {}
+    builtins.exec(PYTHON_SOURCE, py)
+    rows = [(i, i & 1) for i in range(N)]
+
+    report("for", measure(d["count"], range(N)))
+    report("tail call", measure(d["count_tail"], N))
+    report("for (python)", measure(py["count"], range(N)))
+    report("for let (k, 1)", measure(d["filter_rows"], rows))
+    report("for let (k, 1) (python)", measure(py["filter_rows"], rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+import tracemalloc
+from .. import compile
+from .bench_compile import source
+
+
+def peak(text):
+    tracemalloc.start()
+    try:
+        compile(text, "<bench>")
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    print(f"{'statements':>10} {'source':>10} {'peak':>10} {'ratio':>6}")
+    for n in (2500, 5000, 10000):
+        text = source(n)
+        size = len(text.encode())
+        memory = peak(text)
+        print(f"{n:10} {size / 1e6:7.2f} MB {memory / 1e6:7.2f} MB {memory / size:6.1f}")
+
+
+if __name__ == '__main__':
+    main()
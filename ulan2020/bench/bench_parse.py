@@ -0,0 +1,63 @@
+import os
+import sys
+import subprocess
+from time import perf_counter
+from ..compile import Lexer, Parser, Scanner, DescentParser
+from .bench_corpus import corpus
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def best(func, number=3):
+    times = []
+    for _ in range(number):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def import_times(number=5):
+    # self time of each module, from python -X importtime
+    times = {}
+    for _ in range(number):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import ulan2020"],
+            cwd=os.path.dirname(ROOT),
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            us, _, name = line[len("import time:"):].split("|")
+            if us.strip().isdigit():
+                name = name.strip()
+                times[name] = min(times.get(name, float("inf")), int(us) / 1000)
+    return times
+
+
+def main(n=2000):
+    text = corpus(n)
+    lines = text.count("\n")
+    cases = [
+        ("sly", lambda: Parser("<bench>", text).parse(Lexer("<bench>").tokenize(text))),
+        ("sly, scanner", lambda: Parser("<bench>", text).parse(Scanner("<bench>").tokenize(text))),
+        ("descent", lambda: DescentParser("<bench>", text).parse(Scanner("<bench>").scan(text))),
+    ]
+    print(f"{lines} lines")
+    for name, func in cases:
+        time = best(func)
+        print(f"{name:14} {time:6.2f} s {lines / time / 1e3:8.1f} k lines/s")
+
+    times = import_times()
+    modules = [
+        ("sly", ["ulan2020.compile.parse", "ulan2020.compile.parsetab"]),
+        ("descent", ["ulan2020.compile.scan", "ulan2020.compile.descent"]),
+    ]
+    for name, names in modules:
+        print(f"import {name:8} {sum(times.get(m, 0) for m in names):6.1f} ms  ({' + '.join(names)})")
+
+
+if __name__ == '__main__':
+    main()
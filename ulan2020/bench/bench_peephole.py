@@ -0,0 +1,50 @@
+import dis
+from types import CodeType
+from .. import compile, exec
+from .bench_backend import PROGRAMS
+from . import best
+
+PROGRAMS = dict(PROGRAMS, **{
+    "else if loop": (
+        """
+def f(rows):
+  let out = [];
+  for let x in rows:
+    if let 0 = x: out->append(0);
+    else if let 1 = x: out->append(1);
+    else if let (k, 2) = x: out->append(k);
+    end
+  end
+  return out;
+end
+let rows = ::list(itertools::islice(itertools::cycle((0, 1, 2, (3, 2), 4)), 10000));
+""",
+        "f(rows)"),
+})
+
+
+def count(code):
+    n = sum(1 for inst in dis.get_instructions(code) if inst.opname not in ("CACHE", "EXTENDED_ARG"))
+    return n + sum(count(const) for const in code.co_consts if isinstance(const, CodeType))
+
+
+def main(number=20, repeat=5):
+    print(f"{'program':18} {'peephole':8} {'insts':>6} {'run':>12}")
+    for name, (source, call) in PROGRAMS.items():
+        codes = {peephole: compile(source, "<bench>", peephole=peephole) for peephole in (False, True)}
+        times = {}
+        if call is not None:
+            calls = {}
+            for peephole, code in codes.items():
+                d = {}
+                exec(code, d)
+                run = compile(call + ";", "<bench>", tuple(d), peephole=peephole)
+                calls[peephole] = lambda run=run, d=d: exec(run, d)
+            times = best(calls, number, repeat)
+        for peephole, code in codes.items():
+            run = f"{times[peephole] * 1e6:9.1f} us" if peephole in times else "-"
+            print(f"{name:18} {'on' if peephole else 'off':8} {count(code):6} {run:>12}")
+
+
+if __name__ == '__main__':
+    main()
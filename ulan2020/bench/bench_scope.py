@@ -0,0 +1,47 @@
+from time import perf_counter
+from ..compile import Lexer, Parser, ScopeVisitor, SymbolTable
+
+
+def else_if(n):
+    # each arm is in the else branch of the one before
+    return (
+        "let b = 0;\ndef f(a):\n  if let 0 = a: return b;\n" +
+        "".join(f"  else if let {i} = a: let y = a; return (y, b);\n" for i in range(1, n)) +
+        "  end\n  return b;\nend\n")
+
+
+def distinct(n):
+    # each arm of the chain binds a name of its own
+    return (
+        "let b = 0;\ndef f(a):\n  if let 0 = a: return b;\n" +
+        "".join(f"  else if let {i} = a: let x{i} = a; return (x{i}, b);\n" for i in range(1, n)) +
+        "  end\n  return b;\nend\n")
+
+
+def nested(n):
+    # each if is in the body of the one before
+    return (
+        "let b = 0;\ndef f(a):\n" +
+        "".join(f"if let {i} = a: let y = a; ::print(y, b);\n" for i in range(n)) +
+        "end\n" * n +
+        "return b;\nend\n")
+
+
+def measure(text, number=3):
+    times = []
+    for _ in range(number):
+        node = Parser("<bench>", text).parse(Lexer("<bench>").tokenize(text))
+        start = perf_counter()
+        ScopeVisitor("<bench>", text).visit(node, SymbolTable())
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{'depth':>6} {'else if':>14} {'distinct':>14} {'nested if':>14}")
+    for n in (1000, 2000, 4000):
+        times = [measure(source(n)) for source in (else_if, distinct, nested)]
+        print(f"{n:6}" + "".join(f" {t / n * 1e6:8.1f} us/op" for t in times))
+
+if __name__ == '__main__':
+    main()
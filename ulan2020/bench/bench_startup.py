@@ -0,0 +1,38 @@
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cold_import(path):
+    start = perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "import ulan2020"],
+        cwd=path,
+        check=True)
+    return perf_counter() - start
+
+
+def main(n=5):
+    with tempfile.TemporaryDirectory() as path:
+        shutil.copytree(ROOT, os.path.join(path, "ulan2020"))
+        tabfile = os.path.join(path, "ulan2020", "compile", "parsetab.py")
+        cold_import(path)
+
+        before = []
+        for _ in range(n):
+            os.remove(tabfile)
+            before.append(cold_import(path))
+
+        after = [cold_import(path) for _ in range(n)]
+
+    print(f"cold import without parsetab: {min(before)*1000:8.1f} ms")
+    print(f"cold import with parsetab:    {min(after)*1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import re
+from time import perf_counter
+from ..compile.parse import Lexer
+
+# the STRING token regex used before the string scanner
+LEGACY = re.compile(r'{(?P<b>=*)\[(?:(?!\](?P=b)}).|\n)*\](?P=b)}')
+
+MB = 1024 * 1024
+
+
+def template(size):
+    line = "<p>{{ name }} [ok] = {x} -- ]= }</p>\n"
+    return "{=[\n" + line * (size // len(line)) + "]=}"
+
+
+def lex(text):
+    start = perf_counter()
+    try:
+        for _ in Lexer("<bench>").tokenize(text):
+            pass
+    except SyntaxError:
+        pass
+    return perf_counter() - start
+
+
+def legacy(text):
+    start = perf_counter()
+    index = 0
+    while index < len(text):
+        m = LEGACY.match(text, index)
+        index = m.end() if m else index + 1
+    return perf_counter() - start
+
+
+def main():
+    cases = [
+        ("1 MB string", template(MB)),
+        ("10 MB string", template(10 * MB)),
+        ("unterminated 1 MB string", template(MB)[:-3]),
+        ("10k unterminated openers", "{=[a, " * 10000),
+    ]
+    for name, text in cases:
+        print(f"{name:28} scanner {lex(text)*1000:10.1f} ms    regex {legacy(text)*1000:10.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+from time import perf_counter
+from .. import compile, exec
+
+SOURCE = """
+let sub = ::int->__sub__;
+let add = ::int->__add__;
+
+def tail(n, acc):
+  if let 0 = n: return acc; end
+  return tail(sub(n, 1), add(acc, n));
+end
+
+def nontail(n, acc):
+  if let 0 = n: return acc; end
+  let result = nontail(sub(n, 1), add(acc, n));
+  return result;
+end
+"""
+
+
+def measure(f, n, number):
+    start = perf_counter()
+    for _ in range(number):
+        f(n, 0)
+    return (perf_counter() - start) / (n * number)
+
+
+def main():
+    d = {}
+    exec(compile(SOURCE, "<bench>"), d)
+    print(f"tail call, 1e6 steps:     {measure(d['tail'], 1000000, 1)*1e9:8.1f} ns/step")
+    print(f"tail call, 900 steps:     {measure(d['tail'], 900, 1000)*1e9:8.1f} ns/step")
+    print(f"non-tail call, 900 steps: {measure(d['nontail'], 900, 1000)*1e9:8.1f} ns/step")
+    try:
+        d['nontail'](1000000, 0)
+    except RecursionError:
+        print("non-tail call, 1e6 steps: RecursionError")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+from time import perf_counter
+from ..compile import Lexer, Parser, ScopeVisitor, SymbolTable, CodegenVisitor
+from ..compile import ast
+
+TEMPLATE = """
+def f{i}(rows, k=0):
+  let out = [];
+  for let (x, [y, *z]) in rows:
+    if let 1 = y: out->append((x, z, ::len(z))); else: out->append(k); end
+  end
+  return out;
+end
+"""
+
+
+def count(node, cls):
+    # nodes of the tree, each visited at least once per pass
+    if isinstance(node, list):
+        return sum(count(e, cls) for e in node)
+    if not isinstance(node, cls):
+        return 0
+    return 1 + sum(count(getattr(node, field), cls) for field in node._fields)
+
+
+def main(n=2000, number=5):
+    text = "".join(TEMPLATE.format(i=i) for i in range(n))
+    times = []
+    for _ in range(number):
+        start = perf_counter()
+        node = Parser("<bench>", text).parse(Lexer("<bench>").tokenize(text))
+        middle = perf_counter()
+        ScopeVisitor("<bench>", text).visit(node, SymbolTable())
+        end = perf_counter()
+        CodegenVisitor("<bench>", text).visit(node)
+        times.append((middle - start, end - middle, perf_counter() - end))
+    nodes = count(node, ast.Node)
+    parse_time, scope_time, codegen_time = map(min, zip(*times))
+    print(f"parse   {nodes / parse_time / 1e3:8.1f} k nodes/s")
+    print(f"scope   {nodes / scope_time / 1e3:8.1f} k nodes/s")
+    print(f"codegen {nodes / codegen_time / 1e3:8.1f} k nodes/s")
+
+
+if __name__ == '__main__':
+    main()
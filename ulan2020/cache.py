@@ -0,0 +1,78 @@
+import os
+import sys
+import marshal
+import hashlib
+from functools import lru_cache
+from importlib.util import MAGIC_NUMBER, source_hash, decode_source
+from .compile import compile
+
+COMPILE_DIR = os.path.join(os.path.dirname(__file__), "compile")
+
+
+@lru_cache(maxsize=None)
+def compiler_version():
+    h = hashlib.sha256()
+    for name in sorted(os.listdir(COMPILE_DIR)):
+        if name.endswith(".py"):
+            with open(os.path.join(COMPILE_DIR, name), "rb") as f:
+                h.update(name.encode())
+                h.update(f.read())
+    return h.digest()[:8]
+
+
+def cache_from_source(filename):
+    head, tail = os.path.split(filename)
+    return os.path.join(head, "__pycache__", f"{tail}.{sys.implementation.cache_tag}.pyc")
+
+
+def header(data):
+    return MAGIC_NUMBER + compiler_version() + source_hash(data)
+
+
+def load(cachename, data, filename):
+    try:
+        with open(cachename, "rb") as f:
+            cached = f.read()
+    except OSError:
+        return None
+
+    h = header(data)
+    if cached[:len(h)] != h:
+        return None
+    try:
+        code = marshal.loads(cached[len(h):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if code.co_filename != filename:
+        return None
+    return code
+
+
+def store(cachename, data, code):
+    tmpname = f"{cachename}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cachename), exist_ok=True)
+        with open(tmpname, "wb") as f:
+            f.write(header(data))
+            marshal.dump(code, f)
+        os.replace(tmpname, cachename)
+    except OSError:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+
+
+def compile_file(filename, use_cache=True, rebuild=False):
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    cachename = cache_from_source(filename)
+    if use_cache and not rebuild:
+        code = load(cachename, data, filename)
+        if code is not None:
+            return code
+
+    code = compile(decode_source(data), filename)
+    # python -B writes no bytecode, nor do we
+    if use_cache and not sys.dont_write_bytecode:
+        store(cachename, data, code)
+    return code
@@ -1,18 +1,50 @@
 from .parse import Lexer, Parser
-from .ast import TreeVisitor
+from .scan import Scanner
+from .descent import DescentParser
+from .fold import FoldVisitor
 from .scope import ScopeVisitor
 from .symbol import SymbolTable
 from .codegen import CodegenVisitor
+from .pyast import PyastVisitor
 
-def compile(text, filename, globals=()):
+LEXERS = {
+    "sly": Lexer,
+    "scan": Scanner,
+}
+
+PARSERS = {
+    "sly": Parser,
+    "descent": DescentParser,
+}
+
+BACKENDS = {
+    "codegen": CodegenVisitor,
+    "pyast": PyastVisitor,
+}
+
+def compile(text, filename, globals=(), backend="codegen", lexer="sly", parser="sly", peephole=True, fold=True, cache_imports=True):
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}")
+    if lexer not in LEXERS:
+        raise ValueError(f"unknown lexer {lexer!r}")
+    if parser not in PARSERS:
+        raise ValueError(f"unknown parser {parser!r}")
     try:
-        lexer = Lexer(filename)
-        parser = Parser(filename, text)
-        tree = TreeVisitor(filename, text)
+        if parser == "descent":
+            # it reads the scanner's arrays, not tokens
+            tokens = Scanner(filename).scan(text)
+        else:
+            tokens = LEXERS[lexer](filename).tokenize(text)
         scope = ScopeVisitor(filename, text)
-        codegen = CodegenVisitor(filename, text)
-        node = parser.parse(lexer.tokenize(text))
-        node = tree.visit(node)
+        codegen = BACKENDS[backend](filename, text)
+        if not peephole:
+            codegen.passes = codegen.block_passes = ()
+        if not cache_imports:
+            codegen.cache_imports = False
+        # the parser keeps its last symbols, so it goes with the tree
+        node = PARSERS[parser](filename, text).parse(tokens)
+        if fold:
+            node = FoldVisitor(filename, text).visit(node)
         symtable = SymbolTable()
         for name in globals:
             symtable[name] = symtable.get_global(name)
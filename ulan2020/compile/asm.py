@@ -1,15 +1,29 @@
+import sys
 from types import CodeType
-from dis import opmap
-from .bytecode import COMPILER_FLAGS, Instruction, LineNumber, Label, resolve_offsets, encode_code, encode_lnotab
+from dis import opmap, cmp_op
+from .bytecode import COMPILER_FLAGS, Pool, constant_key, Instruction, LineNumber, Label, resolve_offsets, encode_code, encode_lnotab, encode_linetable, encode_locations
+from .peephole import optimize
+from . import cfg
 
 
 class Assembler:
+    """CPython 3.7 bytecode
 
-    def __init__(self):
+    The code generator speaks the 3.7 instruction set. Assemblers for later
+    versions lower whatever has changed since, and build the code object
+    the way the running interpreter expects.
+    """
+
+    def __init__(self, passes=(), block_passes=()):
+        # passes over the basic blocks, then peephole passes over the
+        # instructions, before they are placed
+        self.passes = passes
+        self.block_passes = block_passes
         self.insts = []
-        self.constants = []
+        self.constants = Pool(constant_key)
+        # the depth at the end of what was emitted, None if control can't
+        # get there
         self._stacksize = 0
-        self.max_stacksize = 0
 
     def build(self, argcount, kwonlyargcount, flags, names, varnames, filename, name, firstlineno, freevars, cellvars):
         if self.stacksize is not None:
@@ -19,48 +33,146 @@ class Assembler:
         # flags = self.CO_VARARGS
         flags |= self.CO_OPTIMIZED | self.CO_NEWLOCALS
         if not freevars and not cellvars:
-            flags |= self.CO_NOFREE
+            flags |= COMPILER_FLAGS.get("CO_NOFREE", 0)
         elif freevars:
             flags |= self.CO_NESTED
 
-        resolve_offsets(self.insts)
-        lnotab = bytes(encode_lnotab(self.insts, firstlineno))
-        code = bytes(encode_code(self.insts))
-
-        return CodeType(
+        blocks = cfg.optimize(cfg.build(self.insts), self.block_passes)
+        insts = optimize(cfg.flatten(blocks), self.passes)
+        stacksize = cfg.max_stacksize(cfg.build(insts))
+        insts = self.prologue(varnames, freevars, cellvars) + insts
+        resolve_offsets(insts)
+        return self.code(
             argcount,
             kwonlyargcount,
-            len(varnames) + len(cellvars),
-            self.max_stacksize,
+            len(varnames),
+            stacksize,
             flags,
-            code,
+            bytes(encode_code(insts)),
             tuple(self.constants),
             names,
             varnames,
             filename,
             name,
             firstlineno,
-            lnotab,
+            bytes(self.encode_lines(insts, firstlineno)),
             freevars,
             cellvars)
 
+    def prologue(self, varnames, freevars, cellvars):
+        return []
+
+    code = CodeType
+
+    encode_lines = staticmethod(encode_lnotab)
+
     def emit(self, inst):
         inst.assign_constant_slot(self.constants)
-        self.stacksize = inst.apply_stack_effect(self.stacksize)
+        self._stacksize = inst.apply_stack_effect(self._stacksize)
         self.insts.append(inst)
 
     def set_lineno(self, node):
         self.emit(LineNumber(node.lineno))
 
-    def __getattribute__(self, name):
-        if name in opmap:
-            def emit(arg=0):
-                self.emit(Instruction(opmap[name], arg))
-            return emit
-        if name in COMPILER_FLAGS:
-            return COMPILER_FLAGS[name]
-        return super().__getattribute__(name)
+    # the helpers taking a visit callback are generators, and yield what
+    # it returns, so that the visitor running them can walk the values
+    def load_callable(self, visit):
+        yield visit()
+
+    def call_function(self, argc, names=()):
+        if names:
+            self.LOAD_CONST(names)
+            self.CALL_FUNCTION_KW(argc)
+        else:
+            self.CALL_FUNCTION(argc)
+
+    def call_without_null(self, argc):
+        # for a callable loaded below its arguments without load_callable,
+        # since 3.11 the first argument takes the place of self
+        self.CALL_FUNCTION(argc)
+
+    def make_function(self, code, name, flags):
+        self.LOAD_CONST(code)
+        self.LOAD_CONST(name)
+        self.MAKE_FUNCTION(flags)
+
+    def end_for(self, label):
+        self.emit(label)
+
+    def pop_jump_if_not_none(self, label):
+        self.LOAD_CONST(None)
+        self.COMPARE_OP(cmp_op.index("is not"))
+        self.POP_JUMP_IF_TRUE(label)
 
+    def load_cached(self, slot, load):
+        # the global at slot, unless it is None, in which case what load
+        # pushes is stored there first
+        label = Label()
+        self.LOAD_GLOBAL(slot)
+        self.DUP_TOP()
+        self.pop_jump_if_not_none(label)
+        self.POP_TOP()
+        load()
+        self.DUP_TOP()
+        self.STORE_GLOBAL(slot)
+        self.emit(label)
+
+    def build_unpack(self, kind, elts, visit, call=False):
+        # elts are (value, starred) pairs
+        build = getattr(self, f'BUILD_{kind}')
+        argcount = 0
+        partcount = 0
+        for value, starred in elts:
+            if starred:
+                if argcount:
+                    build(argcount)
+                    argcount = 0
+                    partcount += 1
+                yield visit(value)
+                partcount += 1
+            else:
+                yield visit(value)
+                argcount += 1
+
+        if not partcount:
+            build(argcount)
+            return
+        if argcount:
+            build(argcount)
+            partcount += 1
+        if call:
+            self.BUILD_TUPLE_UNPACK_WITH_CALL(partcount)
+        else:
+            getattr(self, f'BUILD_{kind}_UNPACK')(partcount)
+
+    def build_map_unpack(self, items, visit, call=False):
+        # items are (name, value) pairs, name is None for **value
+        names = ()
+        mapcount = 0
+        for name, value in items:
+            if name is None:
+                if names:
+                    self.LOAD_CONST(names)
+                    self.BUILD_CONST_KEY_MAP(len(names))
+                    names = ()
+                    mapcount += 1
+                yield visit(value)
+                mapcount += 1
+            else:
+                yield visit(value)
+                names += (name,)
+        if not mapcount:
+            self.LOAD_CONST(names)
+            self.BUILD_CONST_KEY_MAP(len(names))
+            return
+        if names:
+            self.LOAD_CONST(names)
+            self.BUILD_CONST_KEY_MAP(len(names))
+            mapcount += 1
+        if call:
+            self.BUILD_MAP_UNPACK_WITH_CALL(mapcount)
+        else:
+            self.BUILD_MAP_UNPACK(mapcount)
 
     @property
     def stacksize(self):
@@ -70,4 +182,296 @@ class Assembler:
     def stacksize(self, value):
         assert value is None or value >= 0
         self._stacksize = value
-        self.max_stacksize = max(self.max_stacksize, value or 0)
+
+
+def emitter(name, opcode):
+    def emit(self, arg=0):
+        self.emit(Instruction(opcode, arg))
+    emit.__name__ = emit.__qualname__ = name
+    return emit
+
+# one method per opcode of the running interpreter, and the CO_ flags
+for name, opcode in opmap.items():
+    setattr(Assembler, name, emitter(name, opcode))
+for name, flag in COMPILER_FLAGS.items():
+    setattr(Assembler, name, flag)
+
+
+class Assembler38(Assembler):
+
+    def code(self, argcount, kwonlyargcount, *args):
+        return CodeType(argcount, 0, kwonlyargcount, *args)
+
+
+class Assembler39(Assembler38):
+
+    def build_unpack(self, kind, elts, visit, call=False):
+        if not any(starred for value, starred in elts):
+            for value, starred in elts:
+                yield visit(value)
+            getattr(self, f'BUILD_{kind}')(len(elts))
+            return
+
+        if kind == 'SET':
+            build, add, update = self.BUILD_SET, self.SET_ADD, self.SET_UPDATE
+        else:
+            build, add, update = self.BUILD_LIST, self.LIST_APPEND, self.LIST_EXTEND
+
+        argcount = 0
+        for value, starred in elts:
+            if starred:
+                break
+            yield visit(value)
+            argcount += 1
+        build(argcount)
+        for value, starred in elts[argcount:]:
+            yield visit(value)
+            if starred:
+                update(1)
+            else:
+                add(1)
+        if kind == 'TUPLE':
+            self.list_to_tuple()
+
+    def list_to_tuple(self):
+        self.LIST_TO_TUPLE()
+
+    def pop_jump_if_not_none(self, label):
+        self.LOAD_CONST(None)
+        self.IS_OP(1)
+        self.POP_JUMP_IF_TRUE(label)
+
+    def build_map_unpack(self, items, visit, call=False):
+        merge = self.DICT_MERGE if call else self.DICT_UPDATE
+        names = ()
+        started = False
+        for name, value in items:
+            if name is None:
+                if names:
+                    self.LOAD_CONST(names)
+                    self.BUILD_CONST_KEY_MAP(len(names))
+                    if started:
+                        merge(1)
+                    names = ()
+                elif not started:
+                    self.BUILD_MAP(0)
+                started = True
+                yield visit(value)
+                merge(1)
+            else:
+                yield visit(value)
+                names += (name,)
+        if names or not started:
+            self.LOAD_CONST(names)
+            self.BUILD_CONST_KEY_MAP(len(names))
+            if started:
+                merge(1)
+
+
+class Assembler310(Assembler39):
+
+    encode_lines = staticmethod(encode_linetable)
+
+
+COMPARE_MASKS = {"<": 2, "<=": 10, "==": 8, "!=": 7, ">": 4, ">=": 12}
+
+
+class Assembler311(Assembler310):
+    """CPython 3.11
+
+    Cells and free variables share the frame's fast slots with the locals,
+    calls take a NULL below the callable, and jumps are relative in either
+    direction.
+    """
+
+    def __init__(self, passes=(), block_passes=()):
+        super().__init__(passes, block_passes)
+        self.placed = set()
+        # instructions whose argument is a cell or free slot
+        self.derefs = []
+
+    def emit(self, inst):
+        super().emit(inst)
+        if isinstance(inst, Label):
+            self.placed.add(inst)
+
+    def build(self, argcount, kwonlyargcount, flags, names, varnames, *args):
+        for inst in self.derefs:
+            inst._arg += len(varnames)
+        return super().build(argcount, kwonlyargcount, flags, names, varnames, *args)
+
+    def prologue(self, varnames, freevars, cellvars):
+        insts = [
+            Instruction(opmap["MAKE_CELL"], len(varnames) + i)
+            for i in range(len(cellvars))]
+        if freevars:
+            insts.append(Instruction(opmap["COPY_FREE_VARS"], len(freevars)))
+        insts.append(Instruction(opmap["RESUME"], 0))
+        return insts
+
+    def code(self, argcount, kwonlyargcount, nlocals, stacksize, flags, code, consts, names, varnames, filename, name, firstlineno, linetable, freevars, cellvars):
+        return CodeType(
+            argcount, 0, kwonlyargcount, nlocals, stacksize, flags, code,
+            consts, names, varnames, filename, name, name, firstlineno,
+            linetable, b'', freevars, cellvars)
+
+    encode_lines = staticmethod(encode_locations)
+
+    def emit_deref(self, name, slot):
+        inst = Instruction(opmap[name], slot)
+        self.derefs.append(inst)
+        self.emit(inst)
+
+    def LOAD_DEREF(self, slot):
+        self.emit_deref("LOAD_DEREF", slot)
+
+    def STORE_DEREF(self, slot):
+        self.emit_deref("STORE_DEREF", slot)
+
+    def LOAD_CLOSURE(self, slot):
+        self.emit_deref("LOAD_CLOSURE", slot)
+
+    def DUP_TOP(self):
+        self.COPY(1)
+
+    def ROT_TWO(self):
+        self.SWAP(2)
+
+    def jump(self, forward, backward, label):
+        name = backward if label in self.placed else forward
+        self.emit(Instruction(opmap[name], label))
+
+    def JUMP_FORWARD(self, label):
+        self.jump("JUMP_FORWARD", "JUMP_BACKWARD", label)
+
+    def JUMP_ABSOLUTE(self, label):
+        self.jump("JUMP_FORWARD", "JUMP_BACKWARD", label)
+
+    def POP_JUMP_IF_FALSE(self, label):
+        self.jump("POP_JUMP_FORWARD_IF_FALSE", "POP_JUMP_BACKWARD_IF_FALSE", label)
+
+    def pop_jump_if_not_none(self, label):
+        self.jump("POP_JUMP_FORWARD_IF_NOT_NONE", "POP_JUMP_BACKWARD_IF_NOT_NONE", label)
+
+    def LOAD_GLOBAL(self, slot):
+        self.emit(Instruction(opmap["LOAD_GLOBAL"], slot << 1))
+
+    def load_callable(self, visit):
+        self.PUSH_NULL()
+        start = len(self.insts)
+        yield visit()
+        # NULL + global in one instruction
+        if len(self.insts) == start + 1 and self.insts[start]._op == opmap["LOAD_GLOBAL"]:
+            self.insts[start]._arg |= 1
+            del self.insts[start - 1]
+
+    def CALL_FUNCTION(self, argc):
+        self.PRECALL(argc)
+        self.CALL(argc)
+
+    def call_function(self, argc, names=()):
+        if names:
+            self.KW_NAMES(names)
+        self.CALL_FUNCTION(argc)
+
+    def call_without_null(self, argc):
+        self.CALL_FUNCTION(argc - 1)
+
+    def make_function(self, code, name, flags):
+        self.LOAD_CONST(code)
+        self.MAKE_FUNCTION(flags)
+
+
+class Assembler312(Assembler311):
+
+    def jump(self, forward, backward, label):
+        if label not in self.placed or backward != "POP_JUMP_BACKWARD_IF_FALSE":
+            super().jump(forward.replace("_FORWARD_IF", "_IF"), backward, label)
+            return
+        # conditional jumps only go forward
+        skip = Label()
+        self.emit(Instruction(opmap["POP_JUMP_IF_TRUE"], skip))
+        self.emit(Instruction(opmap["JUMP_BACKWARD"], label))
+        self.emit(skip)
+
+    def LOAD_FAST(self, slot):
+        # a pattern may leave a local unbound, so loads are checked
+        self.LOAD_FAST_CHECK(slot)
+
+    def LOAD_ATTR(self, slot):
+        self.emit(Instruction(opmap["LOAD_ATTR"], slot << 1))
+
+    def COMPARE_OP(self, op):
+        self.emit(Instruction(opmap["COMPARE_OP"], op << 4 | COMPARE_MASKS[cmp_op[op]]))
+
+    def CALL_FUNCTION(self, argc):
+        self.CALL(argc)
+
+    def list_to_tuple(self):
+        # INTRINSIC_LIST_TO_TUPLE
+        self.CALL_INTRINSIC_1(6)
+
+    def end_for(self, label):
+        self.emit(label)
+        self.END_FOR()
+
+
+class Assembler313(Assembler312):
+
+    def load_callable(self, visit):
+        start = len(self.insts)
+        yield visit()
+        # global + NULL in one instruction
+        if len(self.insts) == start + 1 and self.insts[start]._op == opmap["LOAD_GLOBAL"]:
+            self.insts[start]._arg |= 1
+            self.stacksize += 1
+        else:
+            self.PUSH_NULL()
+
+    def POP_JUMP_IF_FALSE(self, label):
+        last = self.insts[-1] if self.insts else None
+        if not (isinstance(last, Instruction) and last._op == opmap["COMPARE_OP"]):
+            self.TO_BOOL()
+        super().POP_JUMP_IF_FALSE(label)
+
+    def COMPARE_OP(self, op):
+        # with the result converted to bool, as it is only ever jumped on
+        self.emit(Instruction(opmap["COMPARE_OP"], op << 5 | 16 | COMPARE_MASKS[cmp_op[op]]))
+
+    def LOAD_CLOSURE(self, slot):
+        self.emit_deref("LOAD_FAST", slot)
+
+    def call_function(self, argc, names=()):
+        if names:
+            self.LOAD_CONST(names)
+            self.CALL_KW(argc)
+        else:
+            self.CALL(argc)
+
+    def make_function(self, code, name, flags):
+        self.LOAD_CONST(code)
+        self.MAKE_FUNCTION()
+        for flag in (0x08, 0x04, 0x02, 0x01):
+            if flags & flag:
+                self.SET_FUNCTION_ATTRIBUTE(flag)
+
+    def end_for(self, label):
+        super().end_for(label)
+        self.POP_TOP()
+
+
+ASSEMBLERS = {
+    (3, 7): Assembler,
+    (3, 8): Assembler38,
+    (3, 9): Assembler39,
+    (3, 10): Assembler310,
+    (3, 11): Assembler311,
+    (3, 12): Assembler312,
+    (3, 13): Assembler313,
+}
+
+def get_assembler(version=sys.version_info[:2]):
+    try:
+        return ASSEMBLERS[version]
+    except KeyError:
+        raise RuntimeError(f"Python {version[0]}.{version[1]} is not supported") from None
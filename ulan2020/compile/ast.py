@@ -1,25 +1,10 @@
 import typing
-from .visit import Visitor
-from . import parse
+from .symbol import Symbol, SymbolTable, Global, Context
+from . import node
 
 
-class Node:
-
-    def __init__(self, *args, **kwargs):
-        if args:
-            p = args[0]
-            self.lineno = p.lineno
-            self.index = p.index
-        self.__dict__.update(kwargs)
-
-    def __str__(self):
-        return "<{} {}>".format(
-            self.__class__.__name__,
-            ", ".join(
-                f"{key}={getattr(self, key)}"
-                for key in self.__class__.__annotations__
-                if hasattr(self, key))
-        )
+class Node(node.Node):
+    pass
 
 class Pattern(Node):
     pass
@@ -32,12 +17,17 @@ class Condition(Statement):
 
 class File(Node):
     body: typing.List[Statement]
+    # set by the scope pass
+    symtable: typing.Optional[SymbolTable]
+    caches: typing.Optional[typing.List[Global]]
+    tables: typing.Optional[typing.List[Global]]
 
 class Expression(Condition):
     pass
 
 class Name(Expression):
     s: str
+    symbol: typing.Optional[Symbol]
 
 class Unpack(Node):
     value: Expression
@@ -56,14 +46,18 @@ class UnpackPattern(Node):
 
 class Arguments(Node):
     args: typing.List[Pattern]
-    vararg: typing.Optional[UnpackPattern]
+    vararg: typing.Optional[Pattern]
     kwonlyargs: typing.List[Pattern]
-    kwarg: typing.Optional[UnpackPattern]
+    kwarg: typing.Optional[Pattern]
 
 class Function(Statement):
     name: Name
     args: Arguments
     body: typing.List[Statement]
+    symtable: typing.Optional[SymbolTable]
+    exc: typing.Optional[Global]
+    vararg: typing.Optional[Symbol]
+    kwarg: typing.Optional[Symbol]
 
 class If(Statement):
     test: Condition
@@ -73,17 +67,47 @@ class If(Statement):
 class Return(Statement):
     value: Expression
 
+class For(Statement):
+    pattern: Pattern
+    iter: Expression
+    body: typing.List[Statement]
+
+class When(Node):
+    pattern: Pattern
+    body: typing.List[Statement]
+
+class Case(Statement):
+    value: Expression
+    arms: typing.List[When]
+    orelse: typing.List[Statement]
+    # set by the scope pass: the decision tree over the arms, a local for
+    # each value it looks at, one for the case a table finds, and the
+    # function looking it up
+    tree: typing.Optional[object]
+    temps: typing.Optional[typing.List[Symbol]]
+    found: typing.Optional[Symbol]
+    case: typing.Optional[Global]
+
+class While(Statement):
+    test: Condition
+    body: typing.List[Statement]
+
 class Module(Expression):
     level: int
     path: typing.List[str]
+    slot: typing.Optional[int]
 
 class ModuleAttribute(Expression):
     value: Module
     identifier: str
+    slot: typing.Optional[int]
+    # the global it is kept in once imported
+    cache: typing.Optional[Global]
 
 class Attribute(Expression):
     value: Expression
     identifier: str
+    slot: typing.Optional[int]
 
 class Subscript(Expression):
     value: Expression
@@ -93,156 +117,78 @@ class Keyword(Expression):
     arg: str
     value: Expression
 
+class Field(Node):
+    key: Expression
+    value: Expression
+
+class Dict(Expression):
+    elts: typing.List[typing.Union[Field, Unpack]]
+
 class Call(Expression):
     func: Expression
     args: typing.List[typing.Union[Expression, Unpack]]
     keywords: typing.List[typing.Union[Keyword, Unpack]]
 
+class BinOp(Expression):
+    left: Expression
+    op: typing.Union[Expression, str]
+    right: Expression
+
+class UnaryOp(Expression):
+    op: Expression
+    operand: Expression
+
 class Literal(Expression):
-    value: typing.Union[int, float, str]
+    # tuples and frozensets are made by the folding pass
+    value: typing.Union[int, float, str, None, tuple, frozenset]
 
 class Match(Condition):
     pattern: Pattern
     value: Expression
+    exc: typing.Optional[Global]
 
 class LiteralPattern(Pattern):
     value: typing.Union[int, float, str]
 
 class NamePattern(Pattern):
     s: str
+    ctx: typing.Optional[Context]
+    symbol: typing.Optional[Symbol]
+
+class TuplePattern(Pattern):
+    elts: typing.List[typing.Union[Pattern, UnpackPattern]]
+    isinstance: typing.Optional[Global]
+    len: typing.Optional[Global]
+    type: typing.Optional[Global]
+
+class ListPattern(Pattern):
+    elts: typing.List[typing.Union[Pattern, UnpackPattern]]
+    isinstance: typing.Optional[Global]
+    len: typing.Optional[Global]
+    type: typing.Optional[Global]
 
 class KeywordPattern(Pattern):
     arg: str
     value: Pattern
     default: typing.Optional[Expression]
+    symbol: typing.Optional[Symbol]
+
+class SetPattern(Pattern):
+    elts: typing.List[typing.Union[Pattern, UnpackPattern]]
+
+class FieldPattern(Node):
+    key: Expression
+    value: Pattern
+    default: typing.Optional[Expression]
+
+class DictPattern(Pattern):
+    elts: typing.List[typing.Union[FieldPattern, UnpackPattern]]
+
+class CallPattern(Pattern):
+    func: Expression
+    args: typing.List[typing.Union[Pattern, UnpackPattern]]
+    keywords: typing.List[typing.Union[KeywordPattern, UnpackPattern]]
 
-class TreeVisitor(Visitor):
-
-    @_(parse.File)
-    def visit(self, node):
-        return File(node, body=[self.visit(e) for e in node.body])
-
-    @_(parse.Submodule)
-    def visit(self, node):
-        name = node.name or "builtins"
-
-        if node.parent is None:
-            if name == "self":
-                return Module(node, level=1, path=[])
-            elif name == "super":
-                return Module(node, level=2, path=[])
-            else:
-                return Module(node, level=0, path=[name])
-
-        level = node.parent.level
-        path = node.parent.path
-        if name == "self":
-            self.error(node, "self not allowed")
-        elif name == "super":
-            if (level < 2) or path:
-                self.error(node, "super not allowed")
-            return Module(node, level=level+1, path=path)
-        return Module(node, level=level, path=path+[name])
-
-    @_(parse.Attribute)
-    def visit(self, node):
-        value = self.visit(node.value)
-        if isinstance(value, Module):
-            return ModuleAttribute(node, value=value, identifier=node.identifier)
-        return Attribute(node, value=value, identifier=node.identifier)
-
-    @_(parse.Subscript)
-    def visit(self, node):
-        return Subscript(
-            node,
-            value=self.visit(node.value),
-            slice=self.visit(node.slice))
-
-    @_(parse.Tuple)
-    def visit(self, node):
-        return Tuple(node, elts=[self.visit(e) for e in node.elts])
-
-    @_(parse.List)
-    def visit(self, node):
-        return List(node, elts=[self.visit(e) for e in node.elts])
-
-    @_(parse.Set)
-    def visit(self, node):
-        return Set(node, elts=[self.visit(e) for e in node.elts])
-
-    @_(parse.Call)
-    def visit(self, node):
-        return Call(
-            node,
-            func=self.visit(node.func),
-            args=[self.visit(e) for e in node.args],
-            keywords=[self.visit(e) for e in node.keywords])
-
-    @_(parse.Keyword)
-    def visit(self, node):
-        return Keyword(
-            node,
-            arg=node.arg,
-            value=self.visit(node.value))
-
-    @_(parse.Literal)
-    def visit(self, node):
-        return Literal(node, value=node.value)
-
-    @_(parse.Name)
-    def visit(self, node):
-        return Name(node, s=node.s)
-
-    @_(parse.Arguments)
-    def visit(self, node):
-        return Arguments(
-            node,
-            args=[self.visit_pattern(s) for s in node.args],
-            vararg=None if node.vararg is None else self.visit_pattern(node.vararg.value),
-            kwonlyargs=[self.visit_pattern(s) for s in node.kwonlyargs],
-            kwarg=None if node.kwarg is None else self.visit_pattern(node.kwarg.value))
-
-    @_(parse.Function)
-    def visit(self, node):
-        return Function(
-            node,
-            name=self.visit(node.name),
-            args=self.visit(node.args),
-            body=[self.visit(s) for s in node.body])
-
-    @_(parse.If)
-    def visit(self, node):
-        return If(
-            node,
-            test=self.visit(node.test),
-            body=[self.visit(s) for s in node.body],
-            orelse=[self.visit(s) for s in node.orelse])
-
-    @_(parse.Return)
-    def visit(self, node):
-        return Return(
-            node,
-            value=self.visit(node.value))
-
-    @_(parse.Match)
-    def visit(self, node):
-        return Match(
-            node,
-            pattern=self.visit_pattern(node.pattern),
-            value=self.visit(node.value))
-
-    @_(parse.Literal)
-    def visit_pattern(self, node):
-        return LiteralPattern(node, value=node.value)
-
-    @_(parse.Name)
-    def visit_pattern(self, node):
-        return NamePattern(node, s=node.s)
-
-    @_(parse.Keyword)
-    def visit_pattern(self, node):
-        return KeywordPattern(
-            node,
-            arg=node.arg,
-            value=self.visit_pattern(node.value),
-            default=None if getattr(node, 'default', None) is None else self.visit(node.default))
+class IsPattern(Pattern):
+    left: Pattern
+    right: Pattern
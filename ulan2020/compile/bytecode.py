@@ -1,7 +1,32 @@
-from dis import opmap, opname, COMPILER_FLAG_NAMES, hasconst, hasjabs, hasjrel, HAVE_ARGUMENT, stack_effect
+import sys
+import dis
+from dis import opmap, opname, COMPILER_FLAG_NAMES, hasjabs, hasjrel, HAVE_ARGUMENT, EXTENDED_ARG, stack_effect
+from itertools import islice
+from functools import lru_cache
 
 COMPILER_FLAGS = {f"CO_{v}":k for k, v in COMPILER_FLAG_NAMES.items()}
 
+# jump arguments count bytes up to 3.9, and code units since 3.10
+JUMP_UNIT = 2 if sys.version_info >= (3, 10) else 1
+
+hasconst = set(dis.hasconst)
+if "KW_NAMES" in opmap:
+    hasconst.add(opmap["KW_NAMES"])
+
+hasjback = {op for name, op in opmap.items() if "BACKWARD" in name}
+
+hasjump = set(hasjabs) | set(hasjrel)
+
+def _cache_entries():
+    entries = getattr(dis, "_inline_cache_entries", None)
+    if entries is None:
+        return {}
+    if isinstance(entries, dict):
+        return {opmap[name]: n for name, n in entries.items() if n and name in opmap}
+    return {op: n for op, n in enumerate(entries) if n}
+
+CACHE_ENTRIES = _cache_entries()
+
 def extended_length(n):
     count = 0
     while n > 0:
@@ -10,34 +35,102 @@ def extended_length(n):
     return count
 
 
-_stack_effects = {
-    opmap["BREAK_LOOP"]: (0, None, 0),
-    opmap["CONTINUE_LOOP"]: (0, None, 0),
-    opmap["JUMP_ABSOLUTE"]: (0, None, 0),
-    opmap["JUMP_FORWARD"]: (0, None, 0),
-    opmap["JUMP_IF_FALSE_OR_POP"]: (1, -1, 0),
-    opmap["JUMP_IF_TRUE_OR_POP"]: (1, -1, 0),
-    opmap["POP_JUMP_IF_FALSE"]: (1, -1, -1),
-    opmap["POP_JUMP_IF_TRUE"]: (1, -1, -1),
-    opmap["SETUP_EXCEPT"]: (0, 0, 3),
-    opmap["RETURN_VALUE"]: (1, None,),
-    opmap["RAISE_VARARGS"]: None
-}
-
-def _stack_effect(op, arg):
-    effect = _stack_effects[op]
-    if effect is not None:
-        return effect
-    if op == opmap["RAISE_VARARGS"]:
-        return (arg, None)
-    raise NotImplementedError
+# control never falls through these
+_no_fallthrough = {
+    opmap[name]
+    for name in (
+        "BREAK_LOOP", "CONTINUE_LOOP", "JUMP_ABSOLUTE", "JUMP_FORWARD",
+        "JUMP_BACKWARD", "JUMP_BACKWARD_NO_INTERRUPT",
+        "RETURN_VALUE", "RETURN_CONST", "RAISE_VARARGS")
+    if name in opmap}
+
+if sys.version_info >= (3, 8):
+    def _stack_effect(op, arg):
+        if op < HAVE_ARGUMENT:
+            arg = None
+        label_effect = None
+        if op in hasjrel or op in hasjabs:
+            label_effect = stack_effect(op, arg, jump=True)
+        if op in _no_fallthrough:
+            return None, label_effect
+        return stack_effect(op, arg, jump=False), label_effect
+
+else:
+    _stack_effects = {
+        opmap["BREAK_LOOP"]: (None, None),
+        opmap["CONTINUE_LOOP"]: (None, 0),
+        opmap["FOR_ITER"]: (1, -1),
+        opmap["JUMP_ABSOLUTE"]: (None, 0),
+        opmap["JUMP_FORWARD"]: (None, 0),
+        opmap["JUMP_IF_FALSE_OR_POP"]: (-1, 0),
+        opmap["JUMP_IF_TRUE_OR_POP"]: (-1, 0),
+        opmap["POP_JUMP_IF_FALSE"]: (-1, -1),
+        opmap["POP_JUMP_IF_TRUE"]: (-1, -1),
+        opmap["SETUP_EXCEPT"]: (0, 3),
+    }
+
+    def _stack_effect(op, arg):
+        if op in _stack_effects:
+            return _stack_effects[op]
+        if op == opmap["RAISE_VARARGS"] or op == opmap["RETURN_VALUE"]:
+            return None, None
+        if op < HAVE_ARGUMENT:
+            return stack_effect(op), None
+        return stack_effect(op, arg), None
+
+
+def constant_key(value):
+    # equal constants share a slot, unless their types differ (1, 1.0,
+    # True) or only the repr tells them apart (0.0, -0.0)
+    if isinstance(value, tuple):
+        return tuple, tuple(constant_key(v) for v in value)
+    if isinstance(value, frozenset):
+        return frozenset, frozenset(constant_key(v) for v in value)
+    if isinstance(value, (float, complex)):
+        return type(value), repr(value)
+    if value is None or isinstance(value, (int, str, bytes)):
+        return type(value), value
+    return type(value), id(value)
+
+
+class Pool:
+    """values in order of first use, with a slot for each distinct key"""
+
+    def __init__(self, key=None):
+        self.key = key
+        self.slots = {}
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def add(self, value):
+        key = value if self.key is None else self.key(value)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.values)
+            self.values.append(value)
+        return slot
+
+
+# cached per opcode and argument
+_stack_effect = lru_cache(maxsize=None)(_stack_effect)
+
 
 class Instruction:
-    offset = 0
+    # extended is the number of EXTENDED_ARG prefixes, it only ever grows
+    # while offsets are resolved
+    __slots__ = ("_op", "_arg", "caches", "offset", "extended", "slot")
 
     def __init__(self, opcode, arg):
         self._op = opcode
         self._arg = arg
+        self.caches = CACHE_ENTRIES.get(opcode, 0)
+        self.offset = 0
+        self.extended = 0
 
     def __repr__(self):
         return '{}({})'.format(opname[self._op], self._arg)
@@ -45,14 +138,14 @@ class Instruction:
     @property
     def arg(self):
         if self._op in hasjabs:
-            return self._arg.offset
+            return self._arg.offset // JUMP_UNIT
         elif self._op in hasjrel:
-            arg = self._arg.offset - self.offset
-            if arg < 0:
-                return 0
-            length = 2 * (extended_length(arg >> 8) + 1)
-            arg -= length
-            return 0 if arg < 0 else arg
+            end = self.offset + len(self)
+            if self._op in hasjback:
+                arg = end - self._arg.offset
+            else:
+                arg = self._arg.offset - end
+            return 0 if arg < 0 else arg // JUMP_UNIT
         elif self._op in hasconst:
             return self.slot
         elif self._op < HAVE_ARGUMENT:
@@ -61,41 +154,47 @@ class Instruction:
             return self._arg
 
     def __len__(self):
-        return 2 * (extended_length(self.arg >> 8) + 1)
+        return 2 * (self.extended + 1 + self.caches)
 
-    def __iter__(self):
-        length = len(self) // 2
-        if length == 0:
-            return
+    def resize(self):
+        extended = extended_length(self.arg >> 8)
+        if extended <= self.extended:
+            return False
+        self.extended = extended
+        return True
+
+    def encode(self, code):
+        # cache entries are left zero
         arg = self.arg
-        for i in range(length, 1, -1):
-            yield opmap["EXTENDED_ARG"]
-            yield (arg >> 8 * i) & 0xFF
-        yield self._op
-        yield arg & 0xFF
+        i = self.offset
+        for shift in range(8 * self.extended, 0, -8):
+            code[i] = EXTENDED_ARG
+            code[i+1] = (arg >> shift) & 0xFF
+            i += 2
+        code[i] = self._op
+        code[i+1] = arg & 0xFF
 
     def assign_constant_slot(self, consts):
-        if not self._op in hasconst:
-            return
-        for i, c in enumerate(consts):
-            if self._arg is c:
-                self.slot = i
-                return
-        self.slot = len(consts)
-        consts.append(self._arg)
+        if self._op in hasconst:
+            self.slot = consts.add(self._arg)
+
+    def stack_effects(self):
+        # falling through and jumping, None where control doesn't go.
+        # labels and constants do not change the stack effect
+        if type(self._arg) is not int or self._op in hasconst:
+            return _stack_effect(self._op, 0)
+        return _stack_effect(self._op, self._arg)
 
     def apply_stack_effect(self, stacksize):
-        if self._op not in _stack_effects:
-            assert stacksize is not None
-            if self._op < HAVE_ARGUMENT:
-                return stacksize + stack_effect(self._op)
-            else:
-                return stacksize + stack_effect(self._op, self.arg)
-        effect = _stack_effect(self._op, self.arg)
-        assert stacksize >= effect[0]
-        if len(effect) > 2:
-            self._arg.stacksize = stacksize + effect[2]
-        return None if effect[1] is None else stacksize + effect[1]
+        assert stacksize is not None
+        effect, label_effect = self.stack_effects()
+        if label_effect is not None:
+            assert stacksize + label_effect >= 0
+            self._arg.apply_stack_effect(stacksize + label_effect)
+        if effect is None:
+            return None
+        assert stacksize + effect >= 0
+        return stacksize + effect
 
 class Label:
     offset = 0
@@ -104,9 +203,11 @@ class Label:
     def __len__(self):
         return 0
 
-    def __iter__(self):
-        if False:
-            yield
+    def encode(self, code):
+        pass
+
+    def resize(self):
+        return False
 
     def assign_constant_slot(self, consts):
         pass
@@ -127,9 +228,11 @@ class LineNumber:
     def __len__(self):
         return 0
 
-    def __iter__(self):
-        if False:
-            yield
+    def encode(self, code):
+        pass
+
+    def resize(self):
+        return False
 
     def assign_constant_slot(self, consts):
         pass
@@ -138,19 +241,33 @@ class LineNumber:
         return stacksize
 
 def resolve_offsets(insts):
-    resolved = False
-    while not resolved:
-        resolved = True
-        offset = 0
-        for inst in insts:
-            if inst.offset != offset:
-                resolved = False
-                inst.offset = offset
+    # branch relaxation: only the size of a jump depends on offsets, so
+    # every jump starts short, and those that no longer fit are widened
+    # until none has to be. offsets are updated from the first jump
+    # widened on.
+    jumps = []
+    for i, inst in enumerate(insts):
+        if isinstance(inst, Instruction) and inst._op in hasjump:
+            jumps.append((i, inst))
+        else:
+            inst.resize()
+
+    start = 0
+    while start is not None:
+        offset = insts[start].offset if start else 0
+        for inst in islice(insts, start, None):
+            inst.offset = offset
             offset += len(inst)
+        start = None
+        for i, inst in jumps:
+            if inst.resize() and start is None:
+                start = i
 
 def encode_code(insts):
+    code = bytearray(insts[-1].offset + len(insts[-1]) if insts else 0)
     for inst in insts:
-        yield from inst
+        inst.encode(code)
+    return code
 
 def iter_lnotab(insts, firstlineno):
     last = firstlineno
@@ -200,3 +317,62 @@ def encode_lnotab(insts, firstlineno):
 
         lastoffset = offset
         lastlineno = lineno
+
+def iter_lines(insts, firstlineno):
+    # (start, end, lineno) of each run of code on the same line
+    start = 0
+    current = firstlineno
+    offset = 0
+    for inst in insts:
+        if isinstance(inst, LineNumber):
+            if inst.n != current:
+                if inst.offset > start:
+                    yield start, inst.offset, current
+                    start = inst.offset
+                current = inst.n
+        offset = inst.offset + len(inst)
+    if offset > start:
+        yield start, offset, current
+
+def encode_linetable(insts, firstlineno):
+    # 3.10 co_linetable: (length in bytes, line delta) pairs
+    lastlineno = firstlineno
+    for start, end, lineno in iter_lines(insts, firstlineno):
+        line_incr = lineno - lastlineno
+        while line_incr > 127:
+            yield 0
+            yield 127
+            line_incr -= 127
+        while line_incr < -127:
+            yield 0
+            yield 256 - 127
+            line_incr += 127
+        length = end - start
+        while length > 254:
+            yield 254
+            yield line_incr & 0xFF
+            line_incr = 0
+            length -= 254
+        yield length
+        yield line_incr & 0xFF
+        lastlineno = lineno
+
+def encode_varint(n):
+    while n >= 64:
+        yield 0x40 | (n & 0x3F)
+        n >>= 6
+    yield n
+
+def encode_locations(insts, firstlineno):
+    # 3.11 co_linetable: entries of at most 8 code units, without columns
+    lastlineno = firstlineno
+    for start, end, lineno in iter_lines(insts, firstlineno):
+        line_incr = lineno - lastlineno
+        length = (end - start) // 2
+        while length > 0:
+            n = min(length, 8)
+            yield 0x80 | (13 << 3) | (n - 1)
+            yield from encode_varint((-line_incr << 1) | 1 if line_incr < 0 else line_incr << 1)
+            line_incr = 0
+            length -= n
+        lastlineno = lineno
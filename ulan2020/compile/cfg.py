@@ -0,0 +1,172 @@
+from collections import Counter
+from dis import opmap
+from .bytecode import hasjump, _no_fallthrough, Instruction, Label
+
+# the instructions of an assembler as basic blocks, with the passes run
+# over them. a pass edits the blocks in place, and returns whether it
+# changed anything
+
+JUMPS = {opmap[name] for name in ("JUMP_FORWARD", "JUMP_ABSOLUTE", "JUMP_BACKWARD") if name in opmap}
+STORE_FAST = opmap["STORE_FAST"]
+POP_TOP = opmap["POP_TOP"]
+# whatever reads a fast slot
+READS = {op for name, op in opmap.items() if "FAST" in name and name != "STORE_FAST"}
+
+
+class Block:
+    """instructions run one after another, from any of its labels on
+
+    jump is the block its last instruction may jump to, next the block
+    control falls through to, None where there is none. blocks are kept
+    in the order they are laid out, so next is always the following one
+    """
+
+    def __init__(self, labels):
+        self.labels = labels
+        self.insts = []
+        self.jump = None
+        self.next = None
+
+    def __repr__(self):
+        return f'Block({self.insts!r})'
+
+    @property
+    def successors(self):
+        return [block for block in (self.next, self.jump) if block is not None]
+
+    @property
+    def last(self):
+        for inst in reversed(self.insts):
+            if isinstance(inst, Instruction):
+                return inst
+        return None
+
+
+def build(insts):
+    # a block starts at a label, and after a jump or a transfer
+    blocks = [Block([])]
+    for inst in insts:
+        block = blocks[-1]
+        if isinstance(inst, Label):
+            if block.insts:
+                block = Block([])
+                blocks.append(block)
+            block.labels.append(inst)
+            continue
+        block.insts.append(inst)
+        if isinstance(inst, Instruction) and (inst._op in hasjump or inst._op in _no_fallthrough):
+            blocks.append(Block([]))
+    if len(blocks) > 1 and not blocks[-1].labels and not blocks[-1].insts:
+        blocks.pop()
+
+    where = {label: block for block in blocks for label in block.labels}
+    for block, following in zip(blocks, blocks[1:] + [None]):
+        last = block.last
+        if last is not None and last._op in hasjump:
+            block.jump = where[last._arg]
+        if last is None or last._op not in _no_fallthrough:
+            block.next = following
+    return blocks
+
+
+def flatten(blocks):
+    return [inst for block in blocks for inst in block.labels + block.insts]
+
+
+def prune_unreachable(blocks):
+    # blocks no path from the entry goes through
+    reached = set()
+    todo = [blocks[0]]
+    while todo:
+        block = todo.pop()
+        if block not in reached:
+            reached.add(block)
+            todo.extend(block.successors)
+    changed = len(reached) != len(blocks)
+    blocks[:] = [block for block in blocks if block in reached]
+    return changed
+
+
+def merge_blocks(blocks):
+    # a block only entered from the one before it joins that one. a jump
+    # to the following block is dropped first
+    preds = Counter(successor for block in blocks for successor in block.successors)
+    changed = False
+    i = 0
+    while i < len(blocks) - 1:
+        block, following = blocks[i], blocks[i+1]
+        last = block.last
+        if block.jump is following and last._op in JUMPS:
+            block.insts.pop()
+            block.jump = None
+            block.next = following
+            changed = True
+        if block.next is following and block.jump is None and preds[following] == 1:
+            block.insts.extend(following.insts)
+            block.jump = following.jump
+            block.next = following.next
+            del blocks[i+1]
+            changed = True
+        else:
+            i += 1
+    return changed
+
+
+def remove_dead_stores(blocks):
+    # a pattern binding a local nothing reads only pops the value
+    reads = {
+        inst._arg
+        for block in blocks for inst in block.insts
+        if isinstance(inst, Instruction) and inst._op in READS}
+    changed = False
+    for block in blocks:
+        for i, inst in enumerate(block.insts):
+            if isinstance(inst, Instruction) and inst._op == STORE_FAST and inst._arg not in reads:
+                block.insts[i] = Instruction(POP_TOP, 0)
+                changed = True
+    return changed
+
+
+PASSES = (remove_dead_stores, prune_unreachable, merge_blocks)
+
+
+def optimize(blocks, passes=PASSES):
+    # until no pass changes anything
+    changed = True
+    while changed:
+        changed = False
+        for p in passes:
+            changed |= p(blocks)
+    return blocks
+
+
+def max_stacksize(blocks):
+    # the deepest the stack gets on any path from the entry. every block
+    # is entered at one depth, so each is walked once
+    depths = {blocks[0]: 0}
+    todo = [blocks[0]]
+    deepest = 0
+
+    def enter(block, depth):
+        if block not in depths:
+            depths[block] = depth
+            todo.append(block)
+
+    while todo:
+        block = todo.pop()
+        depth = depths[block]
+        for inst in block.insts:
+            if not isinstance(inst, Instruction):
+                continue
+            effect, jump_effect = inst.stack_effects()
+            if jump_effect is not None:
+                deepest = max(deepest, depth + jump_effect)
+                enter(block.jump, depth + jump_effect)
+            if effect is None:
+                break
+            depth += effect
+            deepest = max(deepest, depth)
+        else:
+            if block.next is not None:
+                enter(block.next, depth)
+    return deepest
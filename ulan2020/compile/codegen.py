@@ -1,10 +1,60 @@
 import os
+from dis import cmp_op
 from .visit import Visitor
-from .asm import Assembler, Label
+from .asm import get_assembler, Label
+from .peephole import PASSES
+from .cfg import PASSES as BLOCK_PASSES
 from .symbol import Load, Store, Global, Free, Local
+from .decision import FAIL, Leaf, Switch, TypeTest, LenTest, NameTest, PathTest
 from . import ast
 
+COMPARE_LT = cmp_op.index("<")
+COMPARE_EQ = cmp_op.index("==")
+COMPARE_GE = cmp_op.index(">=")
+
+
+def tailcall_args(function, cellnames, node):
+    # return f(...) inside f can jump back to the argument patterns, if
+    # the arguments can be bound without calling f.
+    # returns the arguments in evaluation order, then the literal
+    # defaults of those not given
+    if not isinstance(node, ast.Call):
+        return None
+    if not isinstance(node.func, ast.Name):
+        return None
+    symbol = node.func.symbol
+    if symbol != function.name.symbol and getattr(symbol, 'parent', None) is not function.name.symbol:
+        return None
+
+    # a new iteration must not share cells with closures of the old one
+    if cellnames:
+        return None
+    if function.args.vararg is not None or function.args.kwarg is not None:
+        return None
+    if len(node.args) > len(function.args.args):
+        return None
+    if any(isinstance(arg, ast.Unpack) for arg in node.args + node.keywords):
+        return None
+
+    args = list(zip(function.args.args, node.args))
+    params = {pat.arg: pat for pat in function.args.args[len(node.args):] + function.args.kwonlyargs}
+    for keyword in node.keywords:
+        if keyword.arg not in params:
+            return None
+        args.append((params.pop(keyword.arg), keyword.value))
+    for pat in params.values():
+        if not isinstance(pat.default, ast.Literal):
+            return None
+        args.append((pat, pat.default))
+    return args
+
+
 class CodegenVisitor(Visitor):
+    function = None
+    assembler = get_assembler()
+    passes = PASSES
+    block_passes = BLOCK_PASSES
+    cache_imports = True
 
     def visit_symbol(self, symbol, asm, context):
         context = {Load: 'LOAD', Store: 'STORE'}[context]
@@ -19,24 +69,21 @@ class CodegenVisitor(Visitor):
     @_(list)
     def visit(self, node, asm):
         for subnode in node:
-            self.visit(subnode, asm)
-            if isinstance(subnode, ast.Match):
-                label = Label()
-                asm.POP_JUMP_IF_TRUE(label)
-                asm.LOAD_GLOBAL(subnode.exc.slot)
-                asm.ROT_TWO()
-                asm.CALL_FUNCTION(1)
-                asm.RAISE_VARARGS(1)
-                asm.emit(label)
-                asm.POP_TOP()
-            elif isinstance(subnode, ast.Expression):
+            if asm.stacksize is None:
+                break
+            yield self.visit(subnode, asm)
+            if isinstance(subnode, ast.Expression):
                 asm.POP_TOP()
 
     @_(ast.File)
     def visit(self, node):
-        asm = Assembler()
+        asm = self.assembler(self.passes, self.block_passes)
         names, varnames, freenames, cellnames, freevars = node.symtable.get_slots()
-        self.visit(node.body, asm)
+        # nothing is imported or built until it is used
+        for symbol in (node.caches if self.cache_imports else []) + node.tables:
+            asm.LOAD_CONST(None)
+            asm.STORE_GLOBAL(symbol.slot)
+        yield from self.visit(node.body, asm)
 
         flags = 0
         return asm.build(
@@ -53,91 +100,270 @@ class CodegenVisitor(Visitor):
 
     @_(ast.If)
     def visit(self, node, asm):
-        self.visit(node.test, asm)
-        if isinstance(node.test, ast.Match):
-            asm.ROT_TWO()
-            asm.POP_TOP()
-
         label1 = Label()
         label2 = Label()
-        asm.POP_JUMP_IF_FALSE(label1)
-        self.visit(node.body, asm)
-        asm.JUMP_FORWARD(label2)
+
+        if isinstance(node.test, ast.Match):
+            yield self.visit(node.test.value, asm)
+            yield self.visit_match(node.test.pattern, asm, label1)
+        else:
+            yield self.visit(node.test, asm)
+            asm.POP_JUMP_IF_FALSE(label1)
+        yield from self.visit(node.body, asm)
+        if asm.stacksize is not None:
+            asm.JUMP_FORWARD(label2)
         asm.emit(label1)
-        self.visit(node.orelse, asm)
+        yield from self.visit(node.orelse, asm)
         asm.emit(label2)
 
+    @_(ast.For)
+    def visit(self, node, asm):
+        label_loop = Label()
+        label_end = Label()
+
+        yield self.visit(node.iter, asm)
+        asm.GET_ITER()
+        asm.emit(label_loop)
+        asm.FOR_ITER(label_end)
+        # items not matching the pattern are skipped
+        yield self.visit_match(node.pattern, asm, label_loop)
+        yield from self.visit(node.body, asm)
+        if asm.stacksize is not None:
+            asm.JUMP_ABSOLUTE(label_loop)
+        asm.end_for(label_end)
+
+    @_(ast.Case)
+    def visit(self, node, asm):
+        label_else = Label()
+        label_end = Label()
+        bodies = [Label() for _ in node.arms]
+
+        yield self.visit(node.value, asm)
+        self.visit_symbol(node.temps[0], asm, Store)
+
+        # each node of the tree is placed once, where it is first jumped
+        # to. the branch placed last is the one a test falls through to
+        labels = {FAIL: label_else}
+        todo = []
+        def label(tree):
+            if tree not in labels:
+                if isinstance(tree, Leaf) and not tree.binds:
+                    labels[tree] = bodies[tree.arm]
+                else:
+                    labels[tree] = Label()
+                    todo.append(tree)
+            return labels[tree]
+
+        asm.JUMP_ABSOLUTE(label(node.tree))
+        while todo:
+            tree = todo.pop()
+            asm.emit(labels[tree])
+            self.visit_tree(tree, node, asm, label, bodies)
+
+        for arm, label_body in zip(node.arms, bodies):
+            # an arm no value gets to
+            if label_body.stacksize is None:
+                continue
+            asm.emit(label_body)
+            yield from self.visit(arm.body, asm)
+            if asm.stacksize is not None:
+                asm.JUMP_FORWARD(label_end)
+        asm.emit(label_else)
+        yield from self.visit(node.orelse, asm)
+        asm.emit(label_end)
+
+    @_(Leaf)
+    def visit_tree(self, tree, node, asm, label, bodies):
+        for symbol, path in tree.binds:
+            self.visit_symbol(node.temps[path], asm, Load)
+            self.visit_symbol(symbol, asm, Store)
+        asm.JUMP_ABSOLUTE(bodies[tree.arm])
+
+    @_(Switch)
+    def visit_tree(self, tree, node, asm, label, bodies):
+        temp = node.temps[tree.path]
+        if tree.table is None:
+            for value, case in tree.cases:
+                label_next = Label()
+                asm.LOAD_CONST(value)
+                self.visit_symbol(temp, asm, Load)
+                asm.COMPARE_OP(COMPARE_EQ)
+                asm.POP_JUMP_IF_FALSE(label_next)
+                asm.JUMP_ABSOLUTE(label(case))
+                asm.emit(label_next)
+            asm.JUMP_ABSOLUTE(label(tree.default))
+            return
+
+        # the index of the case from a dict, then a binary search on it.
+        # the dict is built where it is first run and kept in a global, as
+        # a constant must be hashable
+        targets = [case for value, case in tree.cases] + [tree.default]
+        self.visit_symbol(node.case, asm, Load)
+        asm.load_cached(tree.table.slot, lambda: self.build_table(tree, asm))
+        self.visit_symbol(temp, asm, Load)
+        asm.call_without_null(2)
+        self.visit_symbol(node.found, asm, Store)
+        ranges = [(0, len(targets), None)]
+        while ranges:
+            lo, hi, label_range = ranges.pop()
+            if label_range is not None:
+                asm.emit(label_range)
+            if hi - lo == 1:
+                asm.JUMP_ABSOLUTE(label(targets[lo]))
+                continue
+            mid = (lo + hi) // 2
+            label_upper = Label()
+            self.visit_symbol(node.found, asm, Load)
+            asm.LOAD_CONST(mid)
+            asm.COMPARE_OP(COMPARE_LT)
+            asm.POP_JUMP_IF_FALSE(label_upper)
+            ranges.append((mid, hi, label_upper))
+            ranges.append((lo, mid, None))
+
+    def build_table(self, tree, asm):
+        for i in range(len(tree.cases)):
+            asm.LOAD_CONST(i)
+        asm.LOAD_CONST(tuple(value for value, case in tree.cases))
+        asm.BUILD_CONST_KEY_MAP(len(tree.cases))
+
+    @_(TypeTest)
+    def visit_tree(self, tree, node, asm, label, bodies):
+        self.visit_symbol(tree.pattern.isinstance, asm, Load)
+        self.visit_symbol(node.temps[tree.path], asm, Load)
+        self.visit_symbol(tree.pattern.type, asm, Load)
+        asm.call_without_null(2)
+        self.visit_branch(tree, asm, label)
+
+    @_(LenTest)
+    def visit_tree(self, tree, node, asm, label, bodies):
+        temp = node.temps[tree.path]
+        star = [i for i, e in enumerate(tree.pattern.elts) if isinstance(e, ast.UnpackPattern)]
+        n = len(tree.pattern.elts)
+        self.visit_symbol(tree.pattern.len, asm, Load)
+        self.visit_symbol(temp, asm, Load)
+        asm.call_without_null(1)
+        asm.LOAD_CONST(n - len(star))
+        asm.COMPARE_OP(COMPARE_GE if star else COMPARE_EQ)
+        asm.POP_JUMP_IF_FALSE(label(tree.orelse))
+        self.visit_symbol(temp, asm, Load)
+        if star:
+            asm.UNPACK_EX(star[0] | (n - star[0] - 1) << 8)
+        else:
+            asm.UNPACK_SEQUENCE(n)
+        for path in tree.items:
+            self.visit_symbol(node.temps[path], asm, Store)
+        asm.JUMP_ABSOLUTE(label(tree.then))
+
+    @_(NameTest)
+    def visit_tree(self, tree, node, asm, label, bodies):
+        self.visit_symbol(tree.symbol, asm, Load)
+        self.visit_symbol(node.temps[tree.path], asm, Load)
+        asm.COMPARE_OP(COMPARE_EQ)
+        self.visit_branch(tree, asm, label)
+
+    @_(PathTest)
+    def visit_tree(self, tree, node, asm, label, bodies):
+        self.visit_symbol(node.temps[tree.other], asm, Load)
+        self.visit_symbol(node.temps[tree.path], asm, Load)
+        asm.COMPARE_OP(COMPARE_EQ)
+        self.visit_branch(tree, asm, label)
+
+    def visit_branch(self, tree, asm, label):
+        # labelled in this order, then is placed next
+        asm.POP_JUMP_IF_FALSE(label(tree.orelse))
+        asm.JUMP_ABSOLUTE(label(tree.then))
+
+    @_(ast.While)
+    def visit(self, node, asm):
+        label_loop = Label()
+        label_end = Label()
+
+        asm.emit(label_loop)
+        if isinstance(node.test, ast.Match):
+            yield self.visit(node.test.value, asm)
+            yield self.visit_match(node.test.pattern, asm, label_end)
+        else:
+            yield self.visit(node.test, asm)
+            asm.POP_JUMP_IF_FALSE(label_end)
+        yield from self.visit(node.body, asm)
+        if asm.stacksize is not None:
+            asm.JUMP_ABSOLUTE(label_loop)
+        asm.emit(label_end)
+
     @_(ast.Return)
     def visit(self, node, asm):
-        self.visit(node.value, asm)
+        args = None
+        if self.function is not None:
+            function, label, cellnames = self.function
+            args = tailcall_args(function, cellnames, node.value)
+        if args is not None:
+            yield from self.visit_tailcall(args, asm)
+            return
+        yield self.visit(node.value, asm)
         asm.RETURN_VALUE()
 
+    def visit_tailcall(self, args, asm):
+        function, label, cellnames = self.function
+        # iterators of the enclosing for loops
+        depth = asm.stacksize
+        for pat, value in args:
+            yield self.visit(value, asm)
+        for pat, value in reversed(args):
+            asm.STORE_FAST(pat.symbol.slot)
+        for _ in range(depth):
+            asm.POP_TOP()
+        asm.JUMP_ABSOLUTE(label)
+
     def visit_function(self, node, name, asm):
         names, varnames, freenames, cellnames, freevars = node.symtable.get_slots()
-        sub = Assembler()
+        sub = self.assembler(self.passes, self.block_passes)
 
         flags = 0
 
+        label_start = Label()
         label_exc = Label()
         label_body = Label()
 
+        sub.emit(label_start)
         for pat in node.args.args:
-            self.visit(pat.value, sub)
-            sub.LOAD_ATTR(node.slot)
             sub.LOAD_FAST(pat.symbol.slot)
-            sub.CALL_FUNCTION(1)
-            sub.POP_JUMP_IF_FALSE(label_exc)
+            yield self.visit_match(pat.value, sub, label_exc)
 
         if node.args.vararg is not None:
             flags |= sub.CO_VARARGS
-            self.visit(node.args.vararg, sub)
-            sub.LOAD_ATTR(node.slot)
             sub.LOAD_FAST(node.vararg.slot)
-            sub.CALL_FUNCTION(1)
-            sub.POP_JUMP_IF_FALSE(label_exc)
+            yield self.visit_match(node.args.vararg, sub, label_exc)
 
         for pat in node.args.kwonlyargs:
-            self.visit(pat.value, sub)
-            sub.LOAD_ATTR(node.slot)
             sub.LOAD_FAST(pat.symbol.slot)
-            sub.CALL_FUNCTION(1)
-            sub.POP_JUMP_IF_FALSE(label_exc)
+            yield self.visit_match(pat.value, sub, label_exc)
 
         if node.args.kwarg is not None:
             flags |= sub.CO_VARKEYWORDS
-            self.visit(node.args.kwarg, sub)
-            sub.LOAD_ATTR(node.slot)
             sub.LOAD_FAST(node.kwarg.slot)
-            sub.CALL_FUNCTION(1)
-            sub.POP_JUMP_IF_FALSE(label_exc)
+            yield self.visit_match(node.args.kwarg, sub, label_exc)
 
         if label_exc.stacksize is not None:
             sub.JUMP_FORWARD(label_body)
             sub.emit(label_exc)
-            sub.LOAD_GLOBAL(node.exc.slot)
-            for pat in node.args.args:
-                sub.LOAD_FAST(pat.symbol.slot)
-            sub.BUILD_TUPLE(len(node.args.args))
+            yield from sub.load_callable(lambda: sub.LOAD_GLOBAL(node.exc.slot))
+            args = [(pat.symbol.slot, False) for pat in node.args.args]
             if node.args.vararg is not None:
-                sub.LOAD_FAST(node.vararg.slot)
-                sub.BUILD_TUPLE_UNPACK(2)
-            if node.args.kwonlyargs:
-                for pat in node.args.kwonlyargs:
-                    sub.LOAD_FAST(pat.symbol.slot)
-                sub.LOAD_CONST(tuple(pat.arg for pat in node.args.kwonlyargs))
-                sub.BUILD_CONST_KEY_MAP(len(node.args.kwonlyargs))
-                if node.args.kwarg:
-                    sub.LOAD_FAST(node.kwarg.slot)
-                    sub.BUILD_MAP_UNPACK(2)
-                sub.BUILD_TUPLE(2)
-            elif node.args.kwarg:
-                sub.LOAD_FAST(node.kwarg.slot)
+                args.append((node.vararg.slot, True))
+            yield from sub.build_unpack('TUPLE', args, sub.LOAD_FAST)
+            kwargs = [(pat.arg, pat.symbol.slot) for pat in node.args.kwonlyargs]
+            if node.args.kwarg is not None:
+                kwargs.append((None, node.kwarg.slot))
+            if kwargs:
+                yield from sub.build_map_unpack(kwargs, sub.LOAD_FAST)
                 sub.BUILD_TUPLE(2)
-            sub.CALL_FUNCTION(1)
+            sub.call_function(1)
             sub.RAISE_VARARGS(1)
             sub.emit(label_body)
 
-        self.visit(node.body, sub)
+        function, self.function = self.function, (node, label_start, cellnames)
+        yield from self.visit(node.body, sub)
+        self.function = function
 
         code = sub.build(
             len(node.args.args),
@@ -146,24 +372,24 @@ class CodegenVisitor(Visitor):
             names,
             varnames,
             self.filename,
-            os.path.basename(self.filename),
+            name,
             node.lineno,
             freenames,
             cellnames)
 
         flags = 0
 
-        defaults = [pat.default for pat in node.args.args if getattr(pat, 'default', None) is not None]
+        defaults = [pat.default for pat in node.args.args if pat.default is not None]
         if defaults:
             for default in defaults:
-                self.visit(default, asm)
+                yield self.visit(default, asm)
             asm.BUILD_TUPLE(len(defaults))
             flags |= 0x01
 
-        defaults = [pat for pat in node.args.kwonlyargs if getattr(pat, 'default', None) is not None]
+        defaults = [pat for pat in node.args.kwonlyargs if pat.default is not None]
         if defaults:
             for pat in defaults:
-                self.visit(pat.default, asm)
+                yield self.visit(pat.default, asm)
             asm.LOAD_CONST(tuple(pat.arg for pat in defaults))
             asm.BUILD_CONST_KEY_MAP(len(defaults))
             flags |= 0x02
@@ -174,154 +400,55 @@ class CodegenVisitor(Visitor):
             asm.BUILD_TUPLE(len(freevars))
             flags |= 0x08
 
-        asm.LOAD_CONST(code)
-        asm.LOAD_CONST(name)
-        asm.MAKE_FUNCTION(flags)
+        asm.make_function(code, name, flags)
 
     @_(ast.Function)
     def visit(self, node, asm):
-        self.visit_function(node, node.name.s, asm)
+        yield from self.visit_function(node, node.name.s, asm)
         self.visit_symbol(node.name.symbol, asm, Store)
 
+    def visit_elts(self, elts, asm, kind, call=False):
+        yield from asm.build_unpack(
+            kind,
+            [(e.value, True) if isinstance(e, ast.Unpack) else (e, False) for e in elts],
+            lambda node: self.visit(node, asm),
+            call)
+
     @_(ast.Tuple)
     def visit(self, node, asm):
-        argcount = 0
-        tuplecount = 0
-        for arg in node.elts:
-            if isinstance(arg, ast.Unpack):
-                if argcount:
-                    asm.BUILD_TUPLE(argcount)
-                    argcount = 0
-                    tuplecount += 1
-                self.visit(arg.value, asm)
-                tuplecount += 1
-            else:
-                self.visit(arg, asm)
-                argcount += 1
-
-        if tuplecount:
-            if argcount:
-                asm.BUILD_TUPLE(argcount)
-                argcount = 0
-                tuplecount += 1
-            asm.BUILD_TUPLE_UNPACK(tuplecount)
-        else:
-            asm.BUILD_TUPLE(argcount)
+        yield from self.visit_elts(node.elts, asm, 'TUPLE')
 
     @_(ast.List)
     def visit(self, node, asm):
-        argcount = 0
-        tuplecount = 0
-        for arg in node.elts:
-            if isinstance(arg, ast.Unpack):
-                if argcount:
-                    asm.BUILD_LIST(argcount)
-                    argcount = 0
-                    tuplecount += 1
-                self.visit(arg.value, asm)
-                tuplecount += 1
-            else:
-                self.visit(arg, asm)
-                argcount += 1
-
-        if tuplecount:
-            if argcount:
-                asm.BUILD_LIST(argcount)
-                argcount = 0
-                tuplecount += 1
-            asm.BUILD_LIST_UNPACK(tuplecount)
-        else:
-            asm.BUILD_LIST(argcount)
+        yield from self.visit_elts(node.elts, asm, 'LIST')
 
     @_(ast.Set)
     def visit(self, node, asm):
-        argcount = 0
-        tuplecount = 0
-        for arg in node.elts:
-            if isinstance(arg, ast.Unpack):
-                if argcount:
-                    asm.BUILD_SET(argcount)
-                    argcount = 0
-                    tuplecount += 1
-                self.visit(arg.value, asm)
-                tuplecount += 1
-            else:
-                self.visit(arg, asm)
-                argcount += 1
-
-        if tuplecount:
-            if argcount:
-                asm.BUILD_SET(argcount)
-                argcount = 0
-                tuplecount += 1
-            asm.BUILD_SET_UNPACK(tuplecount)
-        else:
-            asm.BUILD_SET(argcount)
+        yield from self.visit_elts(node.elts, asm, 'SET')
 
     @_(ast.Call)
     def visit(self, node, asm):
-        self.visit(node.func, asm)
-        argcount = 0
-        tuplecount = 0
+        yield from asm.load_callable(lambda: self.visit(node.func, asm))
+
+        if any(isinstance(arg, ast.Unpack) for arg in node.args + node.keywords):
+            yield from self.visit_elts(node.args, asm, 'TUPLE', call=True)
+            if not node.keywords:
+                asm.CALL_FUNCTION_EX(0)
+                return
+            yield from asm.build_map_unpack(
+                [(None, arg.value) if isinstance(arg, ast.Unpack) else (arg.arg, arg.value) for arg in node.keywords],
+                lambda node: self.visit(node, asm),
+                call=True)
+            asm.CALL_FUNCTION_EX(1)
+            return
 
         for arg in node.args:
-            if isinstance(arg, ast.Unpack):
-                if argcount:
-                    asm.BUILD_TUPLE(argcount)
-                    argcount = 0
-                    tuplecount += 1
-                self.visit(arg.value, asm)
-                tuplecount += 1
-            else:
-                self.visit(arg, asm)
-                argcount += 1
-
-        if tuplecount:
-            if argcount:
-                asm.BUILD_TUPLE(argcount)
-                argcount = 0
-                tuplecount += 1
-            asm.BUILD_TUPLE_UNPACK_WITH_CALL(tuplecount)
-        elif any(isinstance(arg, ast.Unpack) for arg in node.keywords):
-            asm.BUILD_TUPLE(argcount)
-            argcount = 0
-            tuplecount = 1
-
-        kwds = ()
-        mapcount = 0
-
+            yield self.visit(arg, asm)
         for arg in node.keywords:
-            if isinstance(arg, ast.Unpack):
-                if kwds:
-                    asm.LOAD_CONST(kwds)
-                    asm.BUILD_CONST_KEY_MAP(len(kwds))
-                    kwds = ()
-                    mapcount += 1
-                self.visit(arg.value, asm)
-                mapcount += 1
-            else:
-                kwds = kwds + (arg.arg,)
-                self.visit(arg.value, asm)
-
-        if mapcount or tuplecount:
-            if kwds:
-                asm.LOAD_CONST(kwds)
-                asm.BUILD_CONST_KEY_MAP(len(kwds))
-                kwds = ()
-                mapcount += 1
-        if mapcount:
-            asm.BUILD_MAP_UNPACK_WITH_CALL(mapcount)
-            asm.CALL_FUNCTION_EX(1)
-        elif tuplecount:
-            asm.CALL_FUNCTION_EX(0)
-        elif kwds:
-            asm.LOAD_CONST(kwds)
-            asm.CALL_FUNCTION_KW(argcount + len(kwds))
-        else:
-            asm.CALL_FUNCTION(argcount)
+            yield self.visit(arg.value, asm)
+        asm.call_function(len(node.args) + len(node.keywords), tuple(arg.arg for arg in node.keywords))
 
-    @_(ast.ModuleAttribute)
-    def visit(self, node, asm):
+    def visit_import(self, node, asm):
         asm.LOAD_CONST(node.value.level)
         asm.LOAD_CONST((node.identifier,))
         asm.IMPORT_NAME(node.value.slot)
@@ -329,6 +456,14 @@ class CodegenVisitor(Visitor):
         asm.ROT_TWO()
         asm.POP_TOP()
 
+    @_(ast.ModuleAttribute)
+    def visit(self, node, asm):
+        if not self.cache_imports:
+            self.visit_import(node, asm)
+            return
+        # imported where it is first run, then kept in a global
+        asm.load_cached(node.cache.slot, lambda: self.visit_import(node, asm))
+
     @_(ast.Module)
     def visit(self, node, asm):
         asm.LOAD_CONST(node.level)
@@ -337,13 +472,13 @@ class CodegenVisitor(Visitor):
 
     @_(ast.Attribute)
     def visit(self, node, asm):
-        self.visit(node.value, asm)
+        yield self.visit(node.value, asm)
         asm.LOAD_ATTR(node.slot)
 
     @_(ast.Subscript)
     def visit(self, node, asm):
-        self.visit(node.value, asm)
-        self.visit(node.slice, asm)
+        yield self.visit(node.value, asm)
+        yield self.visit(node.slice, asm)
         asm.BINARY_SUBSCR()
 
     @_(ast.Literal)
@@ -356,31 +491,83 @@ class CodegenVisitor(Visitor):
 
     @_(ast.Match)
     def visit(self, node, asm):
-        self.visit(node.pattern, asm)
-        asm.LOAD_ATTR(node.slot)
-        self.visit(node.value, asm)
+        yield self.visit(node.value, asm)
+        if isinstance(node.pattern, ast.NamePattern) and node.pattern.ctx is Store:
+            self.visit_match(node.pattern, asm, None)
+            return
+
+        label_exc = Label()
+        label_end = Label()
         asm.DUP_TOP()
-        asm.ROT_THREE()
-        asm.CALL_FUNCTION(1)
+        yield self.visit_match(node.pattern, asm, label_exc)
+        asm.POP_TOP()
+        asm.JUMP_FORWARD(label_end)
+        asm.emit(label_exc)
+        asm.LOAD_GLOBAL(node.exc.slot)
+        asm.ROT_TWO()
+        asm.call_without_null(1)
+        asm.RAISE_VARARGS(1)
+        asm.emit(label_end)
+
+    def visit_compare(self, asm, label):
+        # same operand order as the pattern's __umatch__: pattern == value
+        asm.ROT_TWO()
+        asm.COMPARE_OP(COMPARE_EQ)
+        asm.POP_JUMP_IF_FALSE(label)
 
     @_(ast.LiteralPattern)
-    def visit(self, node, asm):
-        asm.LOAD_GLOBAL(node.pat.slot)
+    def visit_match(self, node, asm, label):
         asm.LOAD_CONST(node.value)
-        asm.CALL_FUNCTION(1)
+        self.visit_compare(asm, label)
 
     @_(ast.NamePattern)
-    def visit(self, node, asm):
-        asm.LOAD_GLOBAL(node.pat.slot)
-        if isinstance(node.symbol, Local):
-            assert node.symbol.is_referenced
-            asm.LOAD_CLOSURE(node.symbol.slot)
-            asm.CALL_FUNCTION(1)
-        elif isinstance(node.symbol, Global):
-            asm.LOAD_GLOBAL(node.globals.slot)
-            asm.CALL_FUNCTION(0)
-            asm.LOAD_CONST(node.s)
-            asm.CALL_FUNCTION(2)
+    def visit_match(self, node, asm, label):
+        self.visit_symbol(node.symbol, asm, node.ctx)
+        if node.ctx is Load:
+            self.visit_compare(asm, label)
+
+    @_(ast.TuplePattern, ast.ListPattern)
+    def visit_match(self, node, asm, label):
+        fails = {}
+        def fail(n):
+            if n not in fails:
+                fails[n] = Label()
+            return fails[n]
+
+        star = [i for i, e in enumerate(node.elts) if isinstance(e, ast.UnpackPattern)]
+        n = len(node.elts)
+
+        # isinstance(value, type) and len(value) == n, without a python call
+        asm.DUP_TOP()
+        self.visit_symbol(node.isinstance, asm, Load)
+        asm.ROT_TWO()
+        self.visit_symbol(node.type, asm, Load)
+        asm.call_without_null(2)
+        asm.POP_JUMP_IF_FALSE(fail(1))
+        asm.DUP_TOP()
+        self.visit_symbol(node.len, asm, Load)
+        asm.ROT_TWO()
+        asm.call_without_null(1)
+        asm.LOAD_CONST(n - len(star))
+        asm.COMPARE_OP(COMPARE_GE if star else COMPARE_EQ)
+        asm.POP_JUMP_IF_FALSE(fail(1))
+        if star:
+            asm.UNPACK_EX(star[0] | (n - star[0] - 1) << 8)
         else:
-            self.visit_symbol(node.symbol, asm, node.ctx)
-            asm.CALL_FUNCTION(1)
+            asm.UNPACK_SEQUENCE(n)
+        for i, elt in enumerate(node.elts):
+            if isinstance(elt, ast.UnpackPattern):
+                elt = elt.value
+            yield self.visit_match(elt, asm, fail(n - 1 - i))
+
+        # on failure, pop the elements not matched yet, then jump to label
+        label_end = Label()
+        asm.JUMP_FORWARD(label_end)
+        for i in range(max(fails), -1, -1):
+            if i in fails:
+                asm.emit(fails[i])
+            if i and asm.stacksize is not None:
+                asm.POP_TOP()
+        if asm.stacksize is not None:
+            asm.JUMP_ABSOLUTE(label)
+        asm.emit(label_end)
@@ -0,0 +1,244 @@
+from heapq import merge
+from .visit import walk
+from .symbol import Store
+from . import ast
+
+# the arms of a case statement as one decision tree. every value the tree
+# looks at has a path: 0 is the subject, and each item of a sequence gets
+# a number the first time a pattern of its shape asks for it.
+#
+# a row is an arm which may still match: its index, what is left of its
+# pattern as (path, pattern, checked) items in the order they are read,
+# and the (symbol, path) pairs it binds. a sequence pattern is checked
+# once its type is known. a test on a path serves every row with an
+# item on that path, so arms sharing a type, a length or a literal are
+# told apart by one test. a row is dropped only where it can't match,
+# and rows keep their order, so the first row with nothing left is the
+# arm which comes first
+
+
+class Leaf:
+    """the arm chosen, and what it binds"""
+
+    def __init__(self, arm, binds):
+        self.arm = arm
+        self.binds = binds
+
+
+# no arm matches
+FAIL = Leaf(None, ())
+# a switch on fewer literals compares them one by one
+TABLE_MIN = 4
+
+
+class Switch:
+    """on the literal at path. cases are (value, tree) pairs in the order
+    of the arms, equal values being one case. on TABLE_MIN or more, the
+    scope pass sets table to the global the dict of their indices is kept
+    in"""
+
+    def __init__(self, path, cases, default):
+        self.path = path
+        self.cases = cases
+        self.default = default
+        self.table = None
+
+
+class Test:
+
+    def __init__(self, path, then, orelse):
+        self.path = path
+        self.then = then
+        self.orelse = orelse
+
+
+class TypeTest(Test):
+    """isinstance(value, type) for the type of pattern"""
+
+    def __init__(self, path, pattern, then, orelse):
+        super().__init__(path, then, orelse)
+        self.pattern = pattern
+
+
+class LenTest(Test):
+    """the length pattern asks for, and if it is right, the paths its
+    items are unpacked to"""
+
+    def __init__(self, path, pattern, items, then, orelse):
+        super().__init__(path, then, orelse)
+        self.pattern = pattern
+        self.items = items
+
+
+class NameTest(Test):
+    """symbol == value, for a name bound before the case statement"""
+
+    def __init__(self, path, symbol, then, orelse):
+        super().__init__(path, then, orelse)
+        self.symbol = symbol
+
+
+class PathTest(Test):
+    """value at other == value, for a name bound earlier in the pattern"""
+
+    def __init__(self, path, other, then, orelse):
+        super().__init__(path, then, orelse)
+        self.other = other
+
+
+def shape(pattern):
+    # the type, the number of items, and where the starred one is if any
+    star = None
+    for i, e in enumerate(pattern.elts):
+        if isinstance(e, ast.UnpackPattern):
+            star = i
+    return type(pattern), len(pattern.elts), star
+
+
+def fits(passed, shape):
+    # whether a sequence of the shape which passed may have the length
+    # shape asks for
+    n = passed[1] - (passed[2] is not None)
+    m = shape[1] - (shape[2] is not None)
+    if passed[2] is None:
+        return n == m if shape[2] is None else n >= m
+    return shape[2] is not None or m >= n
+
+
+def find(row, path):
+    # the index and item of row on path, or (None, None)
+    for i, item in enumerate(row[1]):
+        if item[0] == path:
+            return i, item
+    return None, None
+
+
+def is_sequence(pattern):
+    return isinstance(pattern, (ast.TuplePattern, ast.ListPattern))
+
+
+class Builder:
+
+    def __init__(self):
+        self.paths = {}
+        self.trees = {}
+        self.tables = []
+
+    def path(self, parent, shape, i):
+        key = parent, shape, i
+        if key not in self.paths:
+            self.paths[key] = len(self.paths) + 1
+        return self.paths[key]
+
+    def row(self, arm, pending, binds):
+        # names coming first are bound without a test
+        while pending:
+            path, pattern, checked = pending[0]
+            if not (isinstance(pattern, ast.NamePattern) and pattern.ctx is Store):
+                break
+            binds += ((pattern.symbol, path),)
+            pending = pending[1:]
+        return arm, pending, binds
+
+    def replace(self, row, i, items):
+        # item i of row in place of the items it matches by, bound as
+        # soon as names come first
+        arm, pending, binds = row
+        pending = pending[:i] + items + pending[i+1:]
+        return self.row(arm, pending, binds) if i == 0 else (arm, pending, binds)
+
+    def build(self, rows):
+        rows = tuple(rows)
+        if rows in self.trees:
+            return self.trees[rows]
+        return self.split(rows)
+
+    def split(self, rows):
+        if not rows:
+            return FAIL
+        arm, pending, binds = rows[0]
+        if not pending:
+            tree = Leaf(arm, binds)
+        else:
+            path, pattern, checked = pending[0]
+            if isinstance(pattern, ast.LiteralPattern):
+                tree = yield from self.switch(rows, path)
+            elif isinstance(pattern, ast.NamePattern):
+                then = self.replace(rows[0], 0, ())
+                other = dict(binds).get(pattern.symbol)
+                if other is None:
+                    tree = NameTest(path, pattern.symbol, (yield self.build((then,) + rows[1:])), (yield self.build(rows[1:])))
+                else:
+                    tree = PathTest(path, other, (yield self.build((then,) + rows[1:])), (yield self.build(rows[1:])))
+            elif not checked:
+                tree = yield from self.type_test(rows, path, pattern)
+            else:
+                tree = yield from self.len_test(rows, path, pattern)
+        self.trees[rows] = tree
+        return tree
+
+    def switch(self, rows, path):
+        cases = {}
+        # the case of each row, None for those without a literal on path
+        found = []
+        for row in rows:
+            i, item = find(row, path)
+            if item is not None and isinstance(item[1], ast.LiteralPattern):
+                found.append((i, cases.setdefault(item[1].value, len(cases))))
+            else:
+                found.append((None, None))
+        positions = [[] for _ in cases]
+        others = []
+        for j, (i, case) in enumerate(found):
+            (others if case is None else positions[case]).append(j)
+
+        trees = []
+        for value, case in cases.items():
+            branch = [
+                rows[j] if found[j][1] is None else self.replace(rows[j], found[j][0], ())
+                for j in merge(positions[case], others)]
+            trees.append((value, (yield self.build(branch))))
+        tree = Switch(path, trees, (yield self.build(rows[j] for j in others)))
+        if len(trees) >= TABLE_MIN:
+            self.tables.append(tree)
+        return tree
+
+    def type_test(self, rows, path, pattern):
+        kind = type(pattern)
+        then, orelse = [], []
+        for row in rows:
+            i, item = find(row, path)
+            if item is None or not is_sequence(item[1]) or item[2]:
+                then.append(row)
+                orelse.append(row)
+            elif type(item[1]) is kind:
+                then.append(self.replace(row, i, ((path, item[1], True),)))
+            else:
+                orelse.append(row)
+        return TypeTest(path, pattern, (yield self.build(then)), (yield self.build(orelse)))
+
+    def len_test(self, rows, path, pattern):
+        passed = shape(pattern)
+        items = [self.path(path, passed, i) for i in range(passed[1])]
+        then, orelse = [], []
+        for row in rows:
+            i, item = find(row, path)
+            if item is None or not is_sequence(item[1]) or not item[2]:
+                then.append(row)
+                orelse.append(row)
+            elif shape(item[1]) == passed:
+                elts = [e.value if isinstance(e, ast.UnpackPattern) else e for e in item[1].elts]
+                then.append(self.replace(row, i, tuple((p, e, False) for p, e in zip(items, elts))))
+            else:
+                if fits(passed, shape(item[1])):
+                    then.append(row)
+                orelse.append(row)
+        return LenTest(path, pattern, items, (yield self.build(then)), (yield self.build(orelse)))
+
+
+def build(patterns):
+    # the tree for the patterns of the arms in order, the number of paths
+    # it looks at, and its switches needing a table
+    builder = Builder()
+    rows = [builder.row(arm, ((0, pattern, False),), ()) for arm, pattern in enumerate(patterns)]
+    return walk(builder.build(rows)), len(builder.paths) + 1, builder.tables
@@ -0,0 +1,659 @@
+from sly.lex import Token
+from .error import Error
+from .visit import walk
+from .parse import PatternVisitor
+from .scan import CODES, TYPES
+from . import ast
+
+(ATTRIBUTE, CASE, DEC, DEF, ELSE, END, FLOAT, FOR, HEX, IF, IN, IS, LET, MAP_UNPACK,
+ MODULE, NAME, OCT, RETURN, STRING, STRIP_STRING, WHEN, WHILE) = (
+    CODES[name] for name in (
+        "ATTRIBUTE CASE DEC DEF ELSE END FLOAT FOR HEX IF IN IS LET MAP_UNPACK "
+        "MODULE NAME OCT RETURN STRING STRIP_STRING WHEN WHILE").split())
+(SEMI, COMMA, DOT, COLON, LPAR, RPAR, EQUALS, LSQB, RSQB, LBRACE, RBRACE, STAR, SLASH) = (
+    CODES[name] for name in ";,.:()=[]{}*/")
+EOF = len(TYPES)
+
+INTS = {DEC, OCT, HEX}
+STRINGS = {STRING, STRIP_STRING}
+LEAVES = INTS | STRINGS | {FLOAT, NAME}
+# what ends a term, so that a leaf before it is the whole term
+FOLLOW = {SEMI, COMMA, COLON, RPAR, EQUALS, RSQB, RBRACE, IN, WHEN}
+# what can follow a module, which the LALR parser reads before it
+# reduces one
+AFTER_MODULE = FOLLOW | {IS, DOT, LPAR, LSQB, LBRACE, ATTRIBUTE, NAME}
+
+# what a term can be: an expression, a pattern, or either. a list is
+# what all its elements are, and is built as a pattern only if it can't
+# be an expression
+EXP, PAT = 1, 2
+BOTH = EXP | PAT
+# what a kind which is not BOTH asks of the rest of the list
+STRICT = (0, EXP, PAT, 0)
+
+
+class DescentParser(Error):
+    # the grammar of parse.Parser, read top down from the arrays of
+    # scan.Tokens. each method runs on the walk engine: terms are
+    # yielded to it, and yield from only delegates where the depth is
+    # bounded, so nesting takes no python stack. what a term must be
+    # is passed down, so that an error is found at the same token as
+    # the LALR parser would find it
+
+    def __init__(self, filename, text):
+        self.filename = filename
+        self.text = text
+        self.pattern = PatternVisitor(filename, text).visit
+
+    def parse(self, tokens):
+        self.tokens = tokens
+        self.types = list(tokens.types)
+        self.types.append(EOF)
+        self.starts = tokens.starts
+        self.ends = tokens.ends
+        self.lines = tokens.lines
+        self.i = 0
+        return walk(self.file())
+
+    def fail(self):
+        i = self.i
+        if self.types[i] == EOF:
+            self.tokens.check()
+            raise EOFError()
+        t = Token()
+        t.lineno = self.lines[i]
+        t.index = self.starts[i]
+        self.error(t, f"Invalid token {self.tokens.value(i)!r}")
+
+    def expect(self, code):
+        if self.types[self.i] != code:
+            self.fail()
+        self.i += 1
+
+    def check(self, kind, need):
+        if kind & need != need:
+            self.fail()
+
+    def at(self, node, i):
+        node.lineno = self.lines[i]
+        node.index = self.starts[i]
+        return node
+
+    def value(self, i):
+        return self.text[self.starts[i]:self.ends[i]]
+
+    def file(self):
+        body = yield self.block()
+        if self.types[self.i] != EOF:
+            self.fail()
+        self.tokens.check()
+        if body:
+            return ast.File(body, body=body)
+        node = ast.File(body=[])
+        node.lineno = 1
+        node.index = 0
+        return node
+
+    def block(self):
+        types = self.types
+        body = []
+        while True:
+            t = types[self.i]
+            if t == END or t == ELSE or t == WHEN or t == EOF:
+                return body
+            body.append((yield self.statement()))
+
+    def statement(self):
+        types = self.types
+        i = self.i
+        t = types[i]
+        if t == RETURN:
+            self.i += 1
+            if types[self.i] == SEMI:
+                value = self.at(ast.Literal(value=None), i)
+            else:
+                value, _ = yield self.term(EXP)
+            self.expect(SEMI)
+            return self.at(ast.Return(value=value), i)
+        elif t == IF:
+            self.i += 1
+            node = last = self.at(ast.If(orelse=[]), i)
+            node.test, _ = yield self.condition()
+            self.expect(COLON)
+            node.body = yield self.block()
+            # an else if chain is a loop, not a nesting
+            while types[self.i] == ELSE:
+                j = self.i
+                self.i += 1
+                if types[self.i] != IF:
+                    self.expect(COLON)
+                    last.orelse = yield self.block()
+                    break
+                self.i += 1
+                last.orelse = [self.at(ast.If(orelse=[]), j)]
+                last = last.orelse[0]
+                last.test, _ = yield self.condition()
+                self.expect(COLON)
+                last.body = yield self.block()
+            self.expect(END)
+            return node
+        elif t == FOR:
+            self.i += 1
+            if types[self.i] == LET:
+                self.i += 1
+            pattern = yield self.pat()
+            self.expect(IN)
+            iter, _ = yield self.term(EXP)
+            self.expect(COLON)
+            body = yield self.block()
+            self.expect(END)
+            return self.at(ast.For(pattern=pattern, iter=iter, body=body), i)
+        elif t == CASE:
+            self.i += 1
+            value, _ = yield self.term(EXP)
+            if types[self.i] != WHEN:
+                self.fail()
+            arms = []
+            while types[self.i] == WHEN:
+                self.i += 1
+                pattern = yield self.pat()
+                self.expect(COLON)
+                body = yield self.block()
+                arms.append(ast.When(pattern, pattern=pattern, body=body))
+            orelse = []
+            if types[self.i] == ELSE:
+                self.i += 1
+                self.expect(COLON)
+                orelse = yield self.block()
+            self.expect(END)
+            return self.at(ast.Case(value=value, arms=arms, orelse=orelse), i)
+        elif t == WHILE:
+            self.i += 1
+            test, _ = yield self.condition()
+            self.expect(COLON)
+            body = yield self.block()
+            self.expect(END)
+            return self.at(ast.While(test=test, body=body), i)
+        elif t == DEF:
+            self.i += 1
+            if types[self.i] != NAME:
+                self.fail()
+            name = self.at(ast.Name(s=self.value(self.i)), self.i)
+            self.i += 1
+            args = yield self.arguments()
+            self.expect(COLON)
+            body = yield self.block()
+            self.expect(END)
+            return self.at(ast.Function(name=name, args=args, body=body), i)
+        node, _ = yield self.condition()
+        self.expect(SEMI)
+        return node
+
+    def condition(self):
+        if self.types[self.i] == LET:
+            return self.match()
+        return self.term(EXP)
+
+    def match(self):
+        i = self.i
+        self.i += 1
+        pattern = yield self.pat()
+        self.expect(EQUALS)
+        value, _ = yield self.term(EXP)
+        return self.at(ast.Match(pattern=pattern, value=value), i), None
+
+    def pat(self):
+        # a leaf is done at once, like a term
+        result = self.term(PAT)
+        if type(result) is tuple:
+            return self.pattern(result[0])
+        return self.converted(result)
+
+    def converted(self, term):
+        node, kind = yield from term
+        return self.pattern(node) if kind & EXP else node
+
+    def arguments(self):
+        types = self.types
+        i = self.i
+        self.expect(LPAR)
+        args = []
+        kwonlyargs = []
+        vararg = kwarg = None
+        params = args
+        while True:
+            t = types[self.i]
+            if t == NAME or t == END:
+                param = yield self.parameter()
+                if param.default is None and params is args and args and args[-1].default is not None:
+                    self.fail()
+                params.append(param)
+            elif t == STAR and params is args:
+                self.i += 1
+                params = kwonlyargs
+                if types[self.i] != COMMA:
+                    vararg = yield self.pat()
+            elif t == MAP_UNPACK:
+                self.i += 1
+                kwarg = yield self.pat()
+                break
+            else:
+                break
+            if types[self.i] != COMMA:
+                break
+            self.i += 1
+        self.expect(RPAR)
+        return self.at(ast.Arguments(args=args, vararg=vararg, kwonlyargs=kwonlyargs, kwarg=kwarg), i)
+
+    def parameter(self):
+        i = self.i
+        t = self.types[i]
+        arg = self.value(i)
+        self.i += 1
+        if t == END or self.types[self.i] == COLON:
+            self.expect(COLON)
+            value = yield self.pat()
+        else:
+            value = self.at(ast.NamePattern(s=arg), i)
+        node = self.at(ast.KeywordPattern(arg=arg, value=value), i)
+        if self.types[self.i] == EQUALS:
+            self.i += 1
+            node.default, _ = yield self.term(EXP)
+        return node
+
+    def leaf(self, i):
+        t = self.types[i]
+        if t == NAME:
+            node = ast.Name(s=self.value(i))
+        elif t in INTS:
+            node = ast.Literal(value=int(self.value(i)))
+        elif t == FLOAT:
+            node = ast.Literal(value=float(self.value(i)))
+        else:
+            node = ast.Literal(value=self.tokens.value(i))
+        node.lineno = self.lines[i]
+        node.index = self.starts[i]
+        return node
+
+    def term(self, need):
+        # a leaf is done at once, anything else is a generator to walk
+        i = self.i
+        if self.types[i] in LEAVES and self.types[i+1] in FOLLOW:
+            self.i = i + 1
+            return self.leaf(i), BOTH
+        return self.compound(need)
+
+    def compound(self, need):
+        types = self.types
+        i = self.i
+        if types[i] == DOT:
+            if need & PAT:
+                self.fail()
+            self.i += 1
+            op = yield self.prefix()
+            self.expect(DOT)
+            operand = yield self.prefix()
+            return self.at(ast.UnaryOp(op=op, operand=operand), i), EXP
+
+        node, kind = yield from self.primary(need)
+        t = types[self.i]
+        if t == IS:
+            if kind == EXP:
+                self.fail()
+            if kind == BOTH:
+                self.i += 1
+                right, kind = yield self.primary(BOTH)
+                self.check(kind, BOTH)
+                node = ast.BinOp(node, left=node, op="is", right=right)
+            # anything longer is only a pattern
+            while types[self.i] == IS:
+                if need & EXP:
+                    self.fail()
+                self.i += 1
+                right, kind = yield self.primary(PAT)
+                self.check(kind, PAT)
+                node = ast.IsPattern(node, left=self.pattern(node), right=self.pattern(right))
+                kind = PAT
+        elif t == DOT:
+            if not kind & EXP or need & PAT:
+                self.fail()
+            self.i += 1
+            op = yield self.prefix()
+            self.expect(DOT)
+            right = yield self.prefix()
+            node, kind = ast.BinOp(node, left=node, op=op, right=right), EXP
+        self.check(kind, need)
+        return node, kind
+
+    def prefix(self):
+        node, kind = yield self.primary(EXP)
+        self.check(kind, EXP)
+        return node
+
+    def primary(self, need):
+        # what a postfix can follow, with its postfixes. until none
+        # follows it could be called, and then be anything, so only an
+        # expression passes need on to what is inside
+        types = self.types
+        inner = need & EXP
+        i = self.i
+        t = types[i]
+        if t == NAME and types[i+1] == MODULE or t == MODULE:
+            node, kind = self.module(), EXP
+        elif t in LEAVES:
+            self.i += 1
+            node, kind = self.leaf(i), BOTH
+        elif t == LPAR:
+            node, kind = yield from self.paren(inner)
+        elif t == LSQB:
+            self.i += 1
+            if types[self.i] == RSQB:
+                elts, kind = [], BOTH
+            else:
+                elts, kind = yield from self.elements([], BOTH, inner)
+            self.expect(RSQB)
+            if kind & EXP:
+                node = self.at(ast.List(elts=elts), i)
+            else:
+                node = self.at(ast.ListPattern(elts=self.pattern(elts)), i)
+        elif t == LBRACE:
+            node, kind = yield from self.brace(inner)
+        else:
+            self.fail()
+
+        while True:
+            t = types[self.i]
+            if t != LPAR and t != LSQB and t != ATTRIBUTE and t != LBRACE:
+                return node, kind
+            if not kind & EXP:
+                self.fail()
+            self.i += 1
+            if t == ATTRIBUTE:
+                if types[self.i] != NAME:
+                    self.fail()
+                identifier = self.value(self.i)
+                self.i += 1
+                if isinstance(node, ast.Module):
+                    node = ast.ModuleAttribute(node, value=node, identifier=identifier)
+                else:
+                    node = ast.Attribute(node, value=node, identifier=identifier)
+                kind = EXP
+            elif t == LSQB:
+                node = ast.Subscript(node, value=node, slice=(yield from self.slice()))
+                kind = EXP
+            else:
+                node, kind = yield from self.call(node, t, inner)
+
+    def module(self):
+        types = self.types
+        i = self.i
+        if types[i] == MODULE:
+            self.i += 1
+            node = self.at(ast.Module(level=0, path=["builtins"]), i)
+        else:
+            self.i += 2
+            s = self.value(i)
+            if s == "self":
+                node = ast.Module(level=1, path=[])
+            elif s == "super":
+                node = ast.Module(level=2, path=[])
+            else:
+                node = ast.Module(level=0, path=[s])
+            self.at(node, i)
+        while types[self.i] == NAME:
+            j = self.i
+            s = self.value(j)
+            if types[j+1] != MODULE:
+                self.i += 1
+                return ast.ModuleAttribute(node, value=node, identifier=s)
+            self.i += 2
+            if s in ("self", "super") and types[self.i] not in AFTER_MODULE:
+                self.fail()
+            t = Token()
+            t.lineno = self.lines[j]
+            t.index = self.starts[j]
+            if s == "self":
+                self.error(t, "self not allowed")
+            elif s == "super":
+                if node.level < 2 or node.path:
+                    self.error(t, "super not allowed")
+                node = ast.Module(node, level=node.level+1, path=node.path)
+            else:
+                node = ast.Module(node, level=node.level, path=node.path+[s])
+        return node
+
+    def paren(self, inner):
+        types = self.types
+        i = self.i
+        self.i += 1
+        t = types[self.i]
+        if t == RPAR:
+            self.i += 1
+            return self.at(ast.Tuple(elts=[]), i), BOTH
+        elif t == STAR:
+            node, kind = yield from self.unpack(inner)
+            elts = [node]
+        else:
+            node, kind = yield self.term(inner)
+            if types[self.i] == RPAR:
+                self.check(kind, EXP)
+                self.i += 1
+                return node, EXP
+            self.expect(COMMA)
+            elts = [node]
+            if types[self.i] != RPAR:
+                elts, kind = yield from self.elements(elts, kind, inner)
+        self.expect(RPAR)
+        if kind & EXP:
+            return self.at(ast.Tuple(elts=elts), i), kind
+        return self.at(ast.TuplePattern(elts=self.pattern(elts)), i), kind
+
+    def slice(self):
+        types = self.types
+        if types[self.i] == STAR:
+            node, kind = yield from self.unpack(EXP)
+            node = ast.Tuple(node, elts=[node])
+        else:
+            node, kind = yield self.term(EXP)
+            if types[self.i] == COMMA:
+                self.i += 1
+                elts = [node]
+                if types[self.i] != RSQB:
+                    elts, kind = yield from self.elements(elts, kind, EXP)
+                node = ast.Tuple(node, elts=elts)
+        self.expect(RSQB)
+        return node
+
+    def brace(self, inner):
+        types = self.types
+        i = self.i
+        self.i += 1
+        t = types[self.i]
+        if t == SLASH:
+            self.i += 1
+            self.expect(RBRACE)
+            return self.at(ast.Set(elts=[]), i), BOTH
+        elif t == RBRACE:
+            self.i += 1
+            return self.at(ast.Dict(elts=[]), i), BOTH
+        elif t == MAP_UNPACK:
+            elts, kind = yield from self.fields(None, inner)
+            is_dict = True
+        elif t == STAR:
+            elts, kind = yield from self.elements([], BOTH, inner)
+            is_dict = False
+        else:
+            # a key, or the first element of a set
+            node, kind = yield self.term(inner)
+            is_dict = types[self.i] == COLON
+            if is_dict:
+                self.check(kind, EXP)
+                elts, kind = yield from self.fields(node, inner)
+            else:
+                elts = [node]
+                if types[self.i] == COMMA:
+                    self.i += 1
+                    elts, kind = yield from self.elements(elts, kind, inner)
+        self.expect(RBRACE)
+        if is_dict:
+            if kind & EXP:
+                return self.at(ast.Dict(elts=elts), i), kind
+            return self.at(ast.DictPattern(elts=self.pattern(elts)), i), kind
+        if kind & EXP:
+            return self.at(ast.Set(elts=elts), i), kind
+        return self.at(ast.SetPattern(elts=self.pattern(elts)), i), kind
+
+    def elements(self, elts, kind, inner):
+        types = self.types
+        while True:
+            if types[self.i] == STAR:
+                node, k = yield from self.unpack(inner | STRICT[kind])
+            else:
+                node, k = yield self.term(inner | STRICT[kind])
+            elts.append(node)
+            kind &= k
+            if types[self.i] != COMMA:
+                return elts, kind
+            self.i += 1
+
+    def unpack(self, need):
+        # "*" or "**", the ast doesn't tell them apart
+        i = self.i
+        self.i += 1
+        node, kind = yield self.term(need)
+        if kind & EXP:
+            return self.at(ast.Unpack(value=node), i), kind
+        return self.at(ast.UnpackPattern(value=node), i), kind
+
+    def fields(self, key, inner):
+        types = self.types
+        elts = []
+        kind = BOTH
+        while True:
+            need = inner | STRICT[kind]
+            if key is None and types[self.i] == MAP_UNPACK:
+                node, k = yield from self.unpack(need)
+            else:
+                if key is None:
+                    key, k = yield self.term(EXP)
+                node, k = yield from self.field(key, need)
+                key = None
+            elts.append(node)
+            kind &= k
+            if types[self.i] != COMMA:
+                return elts, kind
+            self.i += 1
+
+    def field(self, key, need):
+        self.expect(COLON)
+        # with a default the value is read as an expression, and then
+        # made a pattern
+        value, kind = yield self.term(need & EXP)
+        if self.types[self.i] == EQUALS:
+            if not kind & EXP or need & EXP:
+                self.fail()
+            self.i += 1
+            default, _ = yield self.term(EXP)
+            # the LALR parser looks at the next token before it converts
+            if self.types[self.i] != COMMA and self.types[self.i] != RBRACE:
+                self.fail()
+            return ast.FieldPattern(key, key=key, value=self.pattern(value), default=default), PAT
+        self.check(kind, need)
+        if kind & EXP:
+            return ast.Field(key, key=key, value=value), kind
+        return ast.FieldPattern(key, key=key, value=value), kind
+
+    def call(self, func, t, inner):
+        # func(args, keywords) or func{keywords}
+        types = self.types
+        args = []
+        keywords = []
+        kind = BOTH
+        if t == LPAR:
+            close = RPAR
+            while types[self.i] != RPAR:
+                if self.keyword_start():
+                    keywords, kind = yield from self.keywords(kind, inner, False)
+                    break
+                if types[self.i] == STAR:
+                    node, k = yield from self.unpack(inner | STRICT[kind])
+                else:
+                    node, k = yield self.term(inner | STRICT[kind])
+                args.append(node)
+                kind &= k
+                if types[self.i] != COMMA:
+                    break
+                self.i += 1
+                if types[self.i] == RPAR:
+                    self.fail()
+        else:
+            close = RBRACE
+            if types[self.i] != RBRACE:
+                keywords, kind = yield from self.keywords(kind, inner, True)
+        self.expect(close)
+        if kind & EXP:
+            return ast.Call(func, func=func, args=args, keywords=keywords), kind
+        return ast.CallPattern(
+            func,
+            func=func,
+            args=self.pattern(args),
+            keywords=self.pattern(keywords)), kind
+
+    def keyword_start(self):
+        t = self.types[self.i]
+        return (
+            t == MAP_UNPACK or t == END or
+            t == NAME and self.types[self.i+1] in (COLON, EQUALS))
+
+    def keywords(self, kind, inner, names):
+        # a call takes *unpack after the first keyword, a brace call
+        # takes bare names instead
+        types = self.types
+        keywords = []
+        while True:
+            need = inner | STRICT[kind]
+            if not names and keywords and types[self.i] == STAR:
+                node, k = yield from self.unpack(need)
+            else:
+                node, k = yield from self.keyword(need, names)
+            keywords.append(node)
+            kind &= k
+            if types[self.i] != COMMA:
+                return keywords, kind
+            self.i += 1
+
+    def keyword(self, need, names):
+        types = self.types
+        i = self.i
+        t = types[i]
+        if t == MAP_UNPACK:
+            return (yield from self.unpack(need))
+        if t != NAME and t != END:
+            self.fail()
+        arg = self.value(i)
+        following = types[i+1]
+        if following == COLON:
+            self.i += 2
+            value, kind = yield self.term(need)
+            if types[self.i] != EQUALS:
+                if kind & EXP:
+                    return self.at(ast.Keyword(arg=arg, value=value), i), kind
+                return self.at(ast.KeywordPattern(arg=arg, value=value), i), kind
+            if not kind & PAT or need & EXP:
+                self.fail()
+            self.i += 1
+            default, _ = yield self.term(EXP)
+            value = self.pattern(value) if kind & EXP else value
+            return self.at(ast.KeywordPattern(arg=arg, value=value, default=default), i), PAT
+        self.i += 1
+        if t == NAME and following == EQUALS:
+            if need & EXP:
+                self.fail()
+            self.i += 1
+            default, _ = yield self.term(EXP)
+            value = self.at(ast.NamePattern(s=arg), i)
+            return self.at(ast.KeywordPattern(arg=arg, value=value, default=default), i), PAT
+        if t == NAME and names:
+            value = self.at(ast.Name(s=arg), i)
+            return self.at(ast.Keyword(arg=arg, value=value), i), BOTH
+        self.fail()
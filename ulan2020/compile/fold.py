@@ -0,0 +1,110 @@
+from .visit import Visitor, each
+from . import ast
+
+# lists and sets shorter than this are still built from their elements
+MIN_ELTS = 3
+# deeper constants would overflow the recursion of marshal and of the
+# constant pool
+MAX_DEPTH = 100
+
+
+class FoldVisitor(Visitor):
+    """tuples of literals become literals, lists and sets of them are
+    built from one. in a for loop or a starred item, where only the items
+    are used, a list is a tuple and a set is a frozenset
+
+    each visit returns the node to put in place of the one visited
+    """
+
+    depths = None
+
+    def literal(self, node, value, depth):
+        folded = ast.Literal(value=value)
+        folded.lineno = node.lineno
+        folded.index = node.index
+        self.depths[folded] = depth
+        return folded
+
+    def constant(self, node):
+        # the value and depth of a node made only of literals, or None
+        if not all(type(e) is ast.Literal for e in node.elts):
+            return None
+        depth = 1 + max((self.depths.get(e, 0) for e in node.elts), default=0)
+        if depth > MAX_DEPTH:
+            return None
+        return tuple(e.value for e in node.elts), depth
+
+    @_(list)
+    def visit(self, node, container=False):
+        return (yield from each(map(self.visit, node)))
+
+    @_(ast.Node)
+    def visit(self, node, container=False):
+        for field in node._fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.Node):
+                setattr(node, field, (yield self.visit(value)))
+            elif isinstance(value, list) and value and isinstance(value[0], ast.Node):
+                value[:] = yield self.visit(value)
+        return node
+
+    @_(ast.File)
+    def visit(self, node, container=False):
+        self.depths = {}
+        node.body = yield self.visit(node.body)
+        return node
+
+    @_(ast.Literal, ast.Name, ast.Module, ast.LiteralPattern, ast.NamePattern)
+    def visit(self, node, container=False):
+        return node
+
+    def visit_elts(self, elts):
+        # what a starred item unpacks is a container
+        folded = []
+        for e in elts:
+            if isinstance(e, ast.Unpack):
+                e.value = yield self.visit(e.value, True)
+                folded.append(e)
+            else:
+                folded.append((yield self.visit(e)))
+        return folded
+
+    @_(ast.For)
+    def visit(self, node, container=False):
+        node.iter = yield self.visit(node.iter, True)
+        node.pattern = yield self.visit(node.pattern)
+        node.body = yield self.visit(node.body)
+        return node
+
+    @_(ast.Tuple)
+    def visit(self, node, container=False):
+        node.elts = yield from self.visit_elts(node.elts)
+        constant = self.constant(node)
+        if constant is None:
+            return node
+        return self.literal(node, *constant)
+
+    @_(ast.List, ast.Set)
+    def visit(self, node, container=False):
+        node.elts = yield from self.visit_elts(node.elts)
+        constant = self.constant(node)
+        if constant is None:
+            return node
+        value, depth = constant
+        if isinstance(node, ast.Set):
+            value = frozenset(value)
+        if container:
+            return self.literal(node, value, depth)
+        if len(node.elts) >= MIN_ELTS:
+            unpack = ast.Unpack(value=self.literal(node, value, depth))
+            unpack.lineno = node.lineno
+            unpack.index = node.index
+            node.elts = [unpack]
+        return node
+
+    @_(ast.Call)
+    def visit(self, node, container=False):
+        node.func = yield self.visit(node.func)
+        node.args = yield from self.visit_elts(node.args)
+        node.keywords = yield self.visit(node.keywords)
+        return node
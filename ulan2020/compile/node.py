@@ -0,0 +1,62 @@
+from sly.yacc import YaccSymbol, YaccProduction
+
+INIT = """\
+def __init__(self, p=None, *, {args}):
+    if p is None:
+        self.lineno = self.index = None
+    else:
+        p = self.locate(p)
+        self.lineno = p.lineno
+        self.index = p.index
+{body}
+"""
+
+
+def position(p):
+    # the first token of a production, or the node it was reduced to
+    while True:
+        if isinstance(p, YaccSymbol):
+            p = p.value
+        elif isinstance(p, YaccProduction):
+            p = p._slice[0]
+        elif isinstance(p, list):
+            p = p[0]
+        else:
+            return p
+
+
+class NodeMeta(type):
+    # the annotations become slots, and keyword arguments of __init__
+    # defaulting to None, so that every field is always there
+
+    def __new__(self, name, bases, attrs):
+        fields = tuple(attrs.get("__annotations__", ()))
+        attrs.setdefault("__slots__", fields)
+        cls = type.__new__(self, name, bases, attrs)
+        cls._fields = sum((getattr(base, "_fields", ()) for base in bases), ()) + fields
+        if cls._fields:
+            namespace = {}
+            exec(INIT.format(
+                args=", ".join(f"{field}=None" for field in cls._fields),
+                body="\n".join(f"    self.{field} = {field}" for field in cls._fields)),
+                namespace)
+            cls.__init__ = namespace["__init__"]
+        return cls
+
+
+class Node(metaclass=NodeMeta):
+    __slots__ = ("lineno", "index")
+
+    def __init__(self, p=None):
+        self.lineno = self.index = None
+        if p is not None:
+            p = self.locate(p)
+            self.lineno = p.lineno
+            self.index = p.index
+
+    locate = staticmethod(position)
+
+    def __str__(self):
+        return "<{} {}>".format(
+            self.__class__.__name__,
+            ", ".join(f"{key}={getattr(self, key)}" for key in self._fields))
@@ -1,129 +1,20 @@
+import os
 import re
-import typing
 import sly
-from sly.yacc import YaccSymbol, YaccProduction
+from sly.yacc import YaccError
 from .error import Error
+from .visit import Visitor, each
+from . import table, ast
 
-def position(p):
-    if isinstance(p, YaccSymbol):
-        return position(p.value)
-    elif isinstance(p, YaccProduction):
-        return position(p._slice[0])
-    elif isinstance(p, list):
-        return position(p[0])
-    return p
-
-
-class Node:
-
-    def __init__(self, *args, **kwargs):
-        if args:
-            p = position(args[0])
-            self.lineno = p.lineno
-            self.index = p.index
-        self.__dict__.update(kwargs)
-
-    def __str__(self):
-        return "<{} {}>".format(
-            self.__class__.__name__,
-            ", ".join(
-                f"{key}={getattr(self, key)}"
-                for key in self.__class__.__annotations__
-                if hasattr(self, key))
-        )
-
-
-class Statement(Node):
-    pass
-
-class Condition(Statement):
-    pass
-
-class File(Node):
-    body: typing.List[Statement]
-
-class Expression(Condition):
-    pass
-
-class Name(Expression):
-    s: str
-
-class Unpack(Node):
-    value: Expression
-
-class Arguments(Node):
-    args: typing.List[Expression]
-    vararg: typing.Optional[Unpack]
-    kwonlyargs: typing.List[Expression]
-    kwarg: typing.Optional[Unpack]
-
-class Function(Statement):
-    name: Name
-    args: Arguments
-    body: typing.List[Statement]
-
-class If(Statement):
-    test: Condition
-    body: typing.List[Statement]
-    orelse: typing.List[Statement]
-
-class Return(Statement):
-    value: Expression
-
-class Match(Condition):
-    pattern: Expression
-    value: Expression
-
-class Submodule(Expression):
-    parent: typing.Optional[Expression]
-    name: str
-
-class Subscript(Expression):
-    value: Expression
-    slice: Expression
-
-class Attribute(Expression):
-    value: Expression
-    identifier: str
-
-class Keyword(Expression):
-    arg: str
-    value: Expression
-    default: typing.Optional[Expression]
-
-class Tuple(Expression):
-    elts: typing.List[typing.Union[Expression, Unpack]]
-
-class List(Expression):
-    elts: typing.List[typing.Union[Expression, Unpack]]
-
-class Set(Expression):
-    elts: typing.List[typing.Union[Expression, Unpack]]
-
-class Field(Node):
-    key: Expression
-    value: Expression
-    default: typing.Optional[Expression]
-
-class Dict(Expression):
-    elts: typing.List[typing.Union[Field, Unpack]]
-
-class Call(Expression):
-    func: Expression
-    args: typing.List[typing.Union[Expression, Unpack]]
-    keywords: typing.List[typing.Union[Keyword, Unpack]]
-
-class BinOp(Expression):
-    left: Expression
-    op: typing.Union[Expression, str]
-    right: Expression
-
-class Literal(Expression):
-    value: typing.Union[int, float, str]
-
-class UnaryOp(Expression):
-    op: typing.Union[Expression, str]
-    operand: Expression
+def strip_lines(value):
+    # without a blank first or last line
+    p = value.find("\n")
+    if p >= 0 and not value[:p].strip():
+        value = value[p+1:]
+    p = value.rfind("\n")
+    if p >= 0 and not value[p:].strip():
+        value = value[:p]
+    return value
 
 
 class Lexer(Error, sly.Lexer):
@@ -131,13 +22,16 @@ class Lexer(Error, sly.Lexer):
 
     tokens = {
         ATTRIBUTE,
+        CASE,
         DEC,
         DEF,
         ELSE,
         END,
         FLOAT,
+        FOR,
         HEX,
         IF,
+        IN,
         IS,
         LET,
         MAP_UNPACK,
@@ -147,6 +41,8 @@ class Lexer(Error, sly.Lexer):
         RETURN,
         STRING,
         STRIP_STRING,
+        WHEN,
+        WHILE,
     }
 
     literals = {";", ",", ".", ":", "_", "(", ")", "=", "[", "]", "{", "}", "|", "*", "/"}
@@ -161,36 +57,59 @@ class Lexer(Error, sly.Lexer):
     MODULE = r'\:\:'
 
     NAME = r'[a-zA-Z_][a-zA-Z0-9_]*'
+    NAME['case'] = CASE
     NAME['def'] = DEF
     NAME['else'] = ELSE
     NAME['end'] = END
+    NAME['for'] = FOR
     NAME['if'] = IF
+    NAME['in'] = IN
     NAME['is'] = IS
     NAME['let'] = LET
     NAME['return'] = RETURN
+    NAME['when'] = WHEN
+    NAME['while'] = WHILE
 
     ignore = ' \t'
 
-    @_(r'{(?P<b>=*)\[(?:(?!\](?P=b)}).|\n)*\](?P=b)}')
+    @_(r'{=*\[')
     def STRING(self, t):
-        self.lineno += t.value.count('\n')
-        p = t.value.find('[')
-        value = t.value[p+1:t.value.rfind(']')]
-
-        if p > 1:
-            p = value.find("\n")
-            if p >= 0 and not value[:p].strip():
-                value = value[p+1:]
-            p = value.rfind("\n")
-            if p >= 0 and not value[p:].strip():
-                value = value[:p]
-        t.value = value
+        strip = len(t.value) > 2
+        t = self.scan_string(t)
+        if t.type != 'STRING':
+            return t
+        if strip:
+            t.value = strip_lines(t.value)
         return t
 
-    @_(r'{(?P<c>-+)\[(?:(?!\](?P=c)}).|\n)*\](?P=c)}')
+    @_(r'{-+\[')
     def STRIP_STRING(self, t):
+        t = self.scan_string(t)
+        if t.type == 'STRIP_STRING':
+            t.value = t.value.strip()
+        return t
+
+    def find_closer(self, closer):
+        # a search for closer from start found it at end, so any
+        # search from start <= index <= end gives the same answer
+        start, end = self.closers.get(closer, (None, None))
+        if start is None or start > self.index or 0 <= end < self.index:
+            start = self.index
+            end = self.text.find(closer, start)
+            self.closers[closer] = (start, end)
+        return end
+
+    def scan_string(self, t):
+        closer = ']' + t.value[1:-1] + '}'
+        end = self.find_closer(closer)
+        if end < 0:
+            # not a string, rescan from "{"
+            t.type = t.value = '{'
+            t.end = self.index = t.index + 1
+            return t
+        t.value = self.text[self.index:end]
+        t.end = self.index = end + len(closer)
         self.lineno += t.value.count('\n')
-        t.value = t.value[t.value.find('[')+1:t.value.rfind(']')].strip()
         return t
 
     ignore_comment = r'#[^\n]*(?=\n|$)'
@@ -203,42 +122,127 @@ class Lexer(Error, sly.Lexer):
         super().__init__()
         self.filename = filename
 
+    def tokenize(self, text, lineno=1, index=0):
+        self.closers = {}
+        return super().tokenize(text, lineno, index)
+
     def error(self, t):
         super().error(t, f"Bad character {t.value[0]!r}")
 
 
 
+class PatternVisitor(Visitor):
+    # what could be either is read as an expression, and the rule which
+    # finds it in a pattern makes it one
+
+    @_(ast.Pattern, ast.UnpackPattern, ast.FieldPattern)
+    def visit(self, node):
+        return node
+
+    @_(ast.Node)
+    def visit(self, node):
+        self.error(node, "invalid pattern")
+
+    @_(list)
+    def visit(self, nodes):
+        return (yield from each(map(self.visit, nodes)))
+
+    @_(ast.Literal)
+    def visit(self, node):
+        return ast.LiteralPattern(node, value=node.value)
+
+    @_(ast.Name)
+    def visit(self, node):
+        return ast.NamePattern(node, s=node.s)
+
+    @_(ast.Tuple)
+    def visit(self, node):
+        return ast.TuplePattern(node, elts=(yield from self.visit(node.elts)))
+
+    @_(ast.List)
+    def visit(self, node):
+        return ast.ListPattern(node, elts=(yield from self.visit(node.elts)))
+
+    @_(ast.Set)
+    def visit(self, node):
+        return ast.SetPattern(node, elts=(yield from self.visit(node.elts)))
+
+    @_(ast.Dict)
+    def visit(self, node):
+        return ast.DictPattern(node, elts=(yield from self.visit(node.elts)))
+
+    @_(ast.Field)
+    def visit(self, node):
+        return ast.FieldPattern(node, key=node.key, value=(yield self.visit(node.value)))
+
+    @_(ast.Call)
+    def visit(self, node):
+        return ast.CallPattern(
+            node,
+            func=node.func,
+            args=(yield from self.visit(node.args)),
+            keywords=(yield from self.visit(node.keywords)))
+
+    @_(ast.Keyword)
+    def visit(self, node):
+        return ast.KeywordPattern(node, arg=node.arg, value=(yield self.visit(node.value)))
+
+    @_(ast.Unpack)
+    def visit(self, node):
+        return ast.UnpackPattern(node, value=(yield self.visit(node.value)))
+
+    @_(ast.BinOp)
+    def visit(self, node):
+        if node.op != "is":
+            self.error(node, "invalid pattern")
+        return ast.IsPattern(
+            node,
+            left=(yield self.visit(node.left)),
+            right=(yield self.visit(node.right)))
+
+
 class Parser(Error, sly.Parser):
     # debugfile = 'parser.out'
     tokens = Lexer.tokens
+    tabmodule = __package__ + '.parsetab'
+    tabfile = os.path.join(os.path.dirname(__file__), 'parsetab.py')
+    # nodes take their positions from the tokens
+    track_positions = False
+
+    @classmethod
+    def _build(cls, definitions):
+        # same as sly.Parser._build, except that the LR tables are read
+        # from tabmodule, and only regenerated when the grammar changes
+        rules = cls._Parser__collect_rules(definitions)
+        if not cls._Parser__validate_specification():
+            raise YaccError('Invalid parser specification')
+        cls._Parser__build_grammar(rules)
+        cls._lrtable = table.load(cls._grammar, cls.tabmodule, cls.tabfile, cls.log)
 
     def __init__(self, filename, text):
         super().__init__()
         self.filename = filename
         self.text = text
+        self.pattern = PatternVisitor(filename, text).visit
 
-    def error(self, t):
+    def error(self, t, msg=None):
         if t is None:
             raise EOFError()
-        super().error(t, f"Invalid token {t.value!r}")
-
-    def position(self, p, i=None):
-        if i is None:
-            return self._position(p)
-        return self._position(p._slice[i])
+        super().error(t, msg or f"Invalid token {t.value!r}")
 
     @_('block')
     def file(self, p):
         if p[0]:
-            return File(p, body=p[0])
-        node = File(body=[])
+            return ast.File(p, body=p[0])
+        node = ast.File(body=[])
         node.lineno = 1
         node.index = 0
         return node
 
-    @_('stat block')
+    @_('block stat')
     def block(self, p):
-        return [p[0]] + p[1]
+        p[0].append(p[1])
+        return p[0]
 
     @_('')
     def block(self, p):
@@ -251,24 +255,57 @@ class Parser(Error, sly.Parser):
 
     @_('RETURN exp ";"')
     def stat(self, p):
-        return Return(p, value=p[1])
+        return ast.Return(p, value=p[1])
 
     @_('RETURN ";"')
     def stat(self, p):
-        return Return(p, value=Literal(p, value=None))
+        return ast.Return(p, value=ast.Literal(p, value=None))
 
     @_('IF condition ":" block ifstat')
     def stat(self, p):
-        return If(
+        return ast.If(
             p,
             test=p[1],
             body=p[3],
             orelse=p[4])
 
+    @_('FOR LET pat IN exp ":" block END')
+    def stat(self, p):
+        return ast.For(p, pattern=p[2], iter=p[4], body=p[6])
+
+    @_('FOR pat IN exp ":" block END')
+    def stat(self, p):
+        return ast.For(p, pattern=p[1], iter=p[3], body=p[5])
+
+    @_('WHILE condition ":" block END')
+    def stat(self, p):
+        return ast.While(p, test=p[1], body=p[3])
+
+    @_('CASE exp whens caseend')
+    def stat(self, p):
+        return ast.Case(p, value=p[1], arms=p[2], orelse=p[3])
+
+    @_('whens WHEN pat ":" block')
+    def whens(self, p):
+        p[0].append(ast.When(p[2], pattern=p[2], body=p[4]))
+        return p[0]
+
+    @_('WHEN pat ":" block')
+    def whens(self, p):
+        return [ast.When(p[1], pattern=p[1], body=p[3])]
+
+    @_('ELSE ":" block END')
+    def caseend(self, p):
+        return p[2]
+
+    @_('END')
+    def caseend(self, p):
+        return []
+
     @_('ELSE IF condition ":" block ifstat')
     def ifstat(self, p):
         return [
-            If(
+            ast.If(
                 p,
                 test=p[2],
                 body=p[4],
@@ -295,8 +332,11 @@ class Parser(Error, sly.Parser):
     def exp(self, p):
        return p[0]
 
-    @_('exp_and_pat',
-       'pat_not_exp')
+    @_('exp_and_pat')
+    def pat(self, p):
+        return self.pattern(p[0])
+
+    @_('pat_not_exp')
     def pat(self, p):
         return p[0]
 
@@ -307,7 +347,7 @@ class Parser(Error, sly.Parser):
 
     @_('prefixexp_exp_and_pat IS prefixexp_exp_and_pat')
     def is_exp_and_pat(self, p):
-        return BinOp(p, left=p[0], op="is", right=p[2])
+        return ast.BinOp(p, left=p[0], op="is", right=p[2])
 
     @_('prefixexp_exp_not_pat',
        'binop',
@@ -320,7 +360,7 @@ class Parser(Error, sly.Parser):
        'pat_not_exp IS prefixexp_exp_and_pat',
        'pat_not_exp IS is_pat_not_exp')
     def pat_not_exp(self, p):
-        return BinOp(p, left=p[0], op="is", right=p[2])
+        return ast.IsPattern(p, left=self.pattern(p[0]), right=self.pattern(p[2]))
 
     @_('is_pat_not_exp')
     def pat_not_exp(self, p):
@@ -335,15 +375,15 @@ class Parser(Error, sly.Parser):
 
     @_('"(" tuple_pat_not_exp ")"')
     def is_pat_not_exp(self, p):
-        return Tuple(p, elts=p[1])
+        return ast.TuplePattern(p, elts=self.pattern(p[1]))
 
     @_('prefixexp "." prefixexp "." prefixexp')
     def binop(self, p):
-       return BinOp(p, left=p[0], op=p[2], right=p[4])
+       return ast.BinOp(p, left=p[0], op=p[2], right=p[4])
 
     @_('"." prefixexp "." prefixexp')
     def unop(self, p):
-       return UnaryOp(p, op=p[1], operand=p[3])
+       return ast.UnaryOp(p, op=p[1], operand=p[3])
 
     @_('prefixexp_exp_and_pat',
        'prefixexp_exp_not_pat')
@@ -353,7 +393,7 @@ class Parser(Error, sly.Parser):
     @_('tuple_exp_and_pat',
        'tuple_exp_not_pat')
     def tuple_exp(self, p):
-        return Tuple(p, elts=p[0])
+        return ast.Tuple(p, elts=p[0])
 
     @_('literal',
        'name',
@@ -367,7 +407,7 @@ class Parser(Error, sly.Parser):
     @_('"(" empty ")"',
        '"(" tuple_exp_and_pat ")"')
     def prefixexp_exp_and_pat(self, p):
-        return Tuple(p, elts=p[1])
+        return ast.Tuple(p, elts=p[1])
 
     @_('module',
        'modattr',
@@ -384,7 +424,7 @@ class Parser(Error, sly.Parser):
 
     @_('"(" tuple_exp_not_pat ")"')
     def prefixexp_exp_not_pat(self, p):
-        return Tuple(p, elts=p[1])
+        return ast.Tuple(p, elts=p[1])
 
 
     @_('tuple_unpack_exp_and_pat')
@@ -420,7 +460,8 @@ class Parser(Error, sly.Parser):
 
     @_('tuple_args_exp_and_pat "," tuple_arg_exp_and_pat')
     def tuple_args_exp_and_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('tuple_arg_exp_and_pat')
     def tuple_args_exp_and_pat(self, p):
@@ -435,7 +476,8 @@ class Parser(Error, sly.Parser):
        'tuple_args_exp_not_pat "," tuple_arg_exp_and_pat',
        'tuple_args_exp_not_pat "," tuple_arg_exp_not_pat')
     def tuple_args_exp_not_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('tuple_arg_exp_not_pat')
     def tuple_args_exp_not_pat(self, p):
@@ -450,10 +492,11 @@ class Parser(Error, sly.Parser):
        'tuple_args_pat_not_exp "," tuple_arg_exp_and_pat',
        'tuple_args_pat_not_exp "," tuple_arg_pat_not_exp')
     def tuple_args_pat_not_exp(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('tuple_arg_pat_not_exp')
-    def tuple_args_exp_not_pat(self, p):
+    def tuple_args_pat_not_exp(self, p):
         return [p[0]]
 
     @_('pat_not_exp',
@@ -463,15 +506,15 @@ class Parser(Error, sly.Parser):
 
     @_('"*" exp_and_pat')
     def tuple_unpack_exp_and_pat(self, p):
-       return Unpack(p, value=p[1])
+       return ast.Unpack(p, value=p[1])
 
     @_('"*" exp_not_pat')
     def tuple_unpack_exp_not_pat(self, p):
-       return Unpack(p, value=p[1])
+       return ast.Unpack(p, value=p[1])
 
     @_('"*" pat_not_exp')
     def tuple_unpack_pat_not_exp(self, p):
-       return Unpack(p, value=p[1])
+       return ast.UnpackPattern(p, value=p[1])
 
     @_('float',
        'int',
@@ -481,47 +524,61 @@ class Parser(Error, sly.Parser):
 
     @_('FLOAT')
     def float(self, p):
-        return Literal(p, value=float(p[0]))
+        return ast.Literal(p, value=float(p[0]))
 
     @_('DEC',
        'OCT',
        'HEX')
     def int(self, p):
-        return Literal(p, value=int(p[0]))
+        return ast.Literal(p, value=int(p[0]))
 
     @_('STRING',
        'STRIP_STRING')
     def string(self, p):
-        return Literal(p, value=p[0])
+        return ast.Literal(p, value=p[0])
 
     @_('NAME')
     def name(self, p):
-        return Name(p, s=p[0])
+        return ast.Name(p, s=p[0])
 
     @_('NAME MODULE')
     def module(self, p):
-        return Submodule(p, parent=None, name=p[0])
+        if p[0] == "self":
+            return ast.Module(p, level=1, path=[])
+        elif p[0] == "super":
+            return ast.Module(p, level=2, path=[])
+        return ast.Module(p, level=0, path=[p[0]])
 
     @_('MODULE')
     def module(self, p):
-        return Submodule(p, parent=None, name='')
+        return ast.Module(p, level=0, path=["builtins"])
 
     @_('module NAME MODULE')
     def module(self, p):
-        return Submodule(p, parent=p[0], name=p[1])
+        level = p[0].level
+        path = p[0].path
+        if p[1] == "self":
+            self.error(p._slice[1], "self not allowed")
+        elif p[1] == "super":
+            if (level < 2) or path:
+                self.error(p._slice[1], "super not allowed")
+            return ast.Module(p, level=level+1, path=path)
+        return ast.Module(p, level=level, path=path+[p[1]])
 
     @_('module NAME')
     def modattr(self, p):
-        return Attribute(p, value=p[0], identifier=p[1])
+        return ast.ModuleAttribute(p, value=p[0], identifier=p[1])
 
     @_('prefixexp "[" tuple_exp "]"',
        'prefixexp "[" exp "]"')
     def subscript(self, p):
-        return Subscript(p, value=p[0], slice=p[2])
+        return ast.Subscript(p, value=p[0], slice=p[2])
 
     @_('prefixexp ATTRIBUTE NAME')
     def attribute(self, p):
-        return Attribute(p, value=p[0], identifier=p[2])
+        if isinstance(p[0], ast.Module):
+            return ast.ModuleAttribute(p, value=p[0], identifier=p[2])
+        return ast.Attribute(p, value=p[0], identifier=p[2])
 
     @_('"(" exp ")"')
     def paren(self, p):
@@ -530,48 +587,49 @@ class Parser(Error, sly.Parser):
     @_('"[" tuple_args_exp_and_pat "]"',
        '"[" empty "]"')
     def list_exp_and_pat(self, p):
-        return List(p, elts=p[1])
+        return ast.List(p, elts=p[1])
 
     @_('"[" tuple_args_exp_not_pat "]"')
     def list_exp_not_pat(self, p):
-        return List(p, elts=p[1])
+        return ast.List(p, elts=p[1])
 
     @_('"[" tuple_args_pat_not_exp "]"')
     def list_pat_not_exp(self, p):
-        return List(p, elts=p[1])
+        return ast.ListPattern(p, elts=self.pattern(p[1]))
 
     @_('"{" "/" "}"')
     def set_exp_and_pat(self, p):
-        return Set(p, elts=[])
+        return ast.Set(p, elts=[])
 
     @_('"{" tuple_args_exp_and_pat "}"')
     def set_exp_and_pat(self, p):
-        return Set(p, elts=p[1])
+        return ast.Set(p, elts=p[1])
 
     @_('"{" tuple_args_exp_not_pat "}"')
     def set_exp_not_pat(self, p):
-        return Set(p, elts=p[1])
+        return ast.Set(p, elts=p[1])
 
     @_('"{" tuple_args_pat_not_exp "}"')
     def set_pat_not_exp(self, p):
-        return Set(p, elts=p[1])
+        return ast.SetPattern(p, elts=self.pattern(p[1]))
 
     @_('"{" empty "}"',
        '"{" dict_fields_exp_and_pat "}"')
     def dict_exp_and_pat(self, p):
-        return Dict(p, elts=p[1])
+        return ast.Dict(p, elts=p[1])
 
     @_('"{" dict_fields_exp_not_pat "}"')
     def dict_exp_not_pat(self, p):
-        return Dict(p, elts=p[1])
+        return ast.Dict(p, elts=p[1])
 
     @_('"{" dict_fields_pat_not_exp "}"')
     def dict_pat_not_exp(self, p):
-        return Dict(p, elts=p[1])
+        return ast.DictPattern(p, elts=self.pattern(p[1]))
 
     @_('dict_fields_exp_and_pat "," dict_field_exp_and_pat')
     def dict_fields_exp_and_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('dict_field_exp_and_pat')
     def dict_fields_exp_and_pat(self, p):
@@ -579,7 +637,7 @@ class Parser(Error, sly.Parser):
 
     @_('exp ":" exp_and_pat')
     def dict_field_exp_and_pat(self, p):
-        return Field(p, key=p[0], value=p[2])
+        return ast.Field(p, key=p[0], value=p[2])
 
     @_('map_unpack_exp_and_pat')
     def dict_field_exp_and_pat(self, p):
@@ -589,7 +647,8 @@ class Parser(Error, sly.Parser):
        'dict_fields_exp_not_pat "," dict_field_exp_and_pat',
        'dict_fields_exp_not_pat "," dict_field_exp_not_pat')
     def dict_fields_exp_not_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('dict_field_exp_not_pat')
     def dict_fields_exp_not_pat(self, p):
@@ -597,7 +656,7 @@ class Parser(Error, sly.Parser):
 
     @_('exp ":" exp_not_pat')
     def dict_field_exp_not_pat(self, p):
-        return Field(p, key=p[0], value=p[2])
+        return ast.Field(p, key=p[0], value=p[2])
 
     @_('map_unpack_exp_not_pat')
     def dict_field_exp_not_pat(self, p):
@@ -607,7 +666,8 @@ class Parser(Error, sly.Parser):
        'dict_fields_pat_not_exp "," dict_field_exp_and_pat',
        'dict_fields_pat_not_exp "," dict_field_pat_not_exp')
     def dict_fields_pat_not_exp(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('dict_field_pat_not_exp')
     def dict_fields_pat_not_exp(self, p):
@@ -615,12 +675,12 @@ class Parser(Error, sly.Parser):
 
     @_('exp ":" pat_not_exp')
     def dict_field_pat_not_exp(self, p):
-        return Field(p, key=p[0], value=p[2])
+        return ast.FieldPattern(p, key=p[0], value=p[2])
 
     @_('exp ":" exp_and_pat "=" exp',
        'exp ":" exp_not_pat "=" exp')
     def dict_field_pat_not_exp(self, p):
-        return Field(p, key=p[0], value=p[2], default=p[4])
+        return ast.FieldPattern(p, key=p[0], value=self.pattern(p[2]), default=p[4])
 
     @_('map_unpack_pat_not_exp')
     def dict_field_pat_not_exp(self, p):
@@ -628,74 +688,75 @@ class Parser(Error, sly.Parser):
 
     @_('MAP_UNPACK exp_and_pat')
     def map_unpack_exp_and_pat(self, p):
-        return Unpack(p, value=p[1])
+        return ast.Unpack(p, value=p[1])
 
     @_('MAP_UNPACK exp_not_pat')
     def map_unpack_exp_not_pat(self, p):
-        return Unpack(p, value=p[1])
+        return ast.Unpack(p, value=p[1])
 
     @_('MAP_UNPACK pat_not_exp')
     def map_unpack_pat_not_exp(self, p):
-        return Unpack(p, value=p[1])
+        return ast.UnpackPattern(p, value=p[1])
 
     @_('prefixexp "(" tuple_args_exp_and_pat "," keywords_exp_and_pat ")"')
     def call_exp_and_pat(self, p):
-        return Call(p, func=p[0], args=p[2], keywords=p[4])
+        return ast.Call(p, func=p[0], args=p[2], keywords=p[4])
 
     @_('prefixexp "(" tuple_args_exp_and_pat "," keywords_exp_not_pat ")"',
        'prefixexp "(" tuple_args_exp_not_pat "," keywords_exp_and_pat ")"',
        'prefixexp "(" tuple_args_exp_not_pat "," keywords_exp_not_pat ")"')
     def call_exp_not_pat(self, p):
-        return Call(p, func=p[0], args=p[2], keywords=p[4])
+        return ast.Call(p, func=p[0], args=p[2], keywords=p[4])
 
     @_('prefixexp "(" tuple_args_exp_and_pat "," keywords_pat_not_exp ")"',
        'prefixexp "(" tuple_args_pat_not_exp "," keywords_exp_and_pat ")"',
        'prefixexp "(" tuple_args_pat_not_exp "," keywords_pat_not_exp ")"')
     def call_pat_not_exp(self, p):
-        return Call(p, func=p[0], args=p[2], keywords=p[4])
+        return ast.CallPattern(p, func=p[0], args=self.pattern(p[2]), keywords=self.pattern(p[4]))
 
     @_('prefixexp "(" tuple_args_exp_and_pat ")"',
        'prefixexp "(" empty ")"')
     def call_exp_and_pat(self, p):
-        return Call(p, func=p[0], args=p[2], keywords=[])
+        return ast.Call(p, func=p[0], args=p[2], keywords=[])
 
     @_('prefixexp "(" tuple_args_exp_not_pat ")"')
     def call_exp_not_pat(self, p):
-        return Call(p, func=p[0], args=p[2], keywords=[])
+        return ast.Call(p, func=p[0], args=p[2], keywords=[])
 
     @_('prefixexp "(" tuple_args_pat_not_exp ")"')
     def call_pat_not_exp(self, p):
-        return Call(p, func=p[0], args=p[2], keywords=[])
+        return ast.CallPattern(p, func=p[0], args=self.pattern(p[2]), keywords=[])
 
     @_('prefixexp "(" keywords_exp_and_pat ")"')
     def call_exp_and_pat(self, p):
-        return Call(p, func=p[0], args=[], keywords=p[2])
+        return ast.Call(p, func=p[0], args=[], keywords=p[2])
 
     @_('prefixexp "(" keywords_exp_not_pat ")"')
     def call_exp_not_pat(self, p):
-        return Call(p, func=p[0], args=[], keywords=p[2])
+        return ast.Call(p, func=p[0], args=[], keywords=p[2])
 
     @_('prefixexp "(" keywords_pat_not_exp ")"')
     def call_pat_not_exp(self, p):
-        return Call(p, func=p[0], args=[], keywords=p[2])
+        return ast.CallPattern(p, func=p[0], args=[], keywords=self.pattern(p[2]))
 
     @_('prefixexp "{" name_keywords_exp_and_pat "}"',
        'prefixexp "{" empty "}"')
     def call_exp_and_pat(self, p):
-        return Call(p, func=p[0], args=[], keywords=p[2])
+        return ast.Call(p, func=p[0], args=[], keywords=p[2])
 
     @_('prefixexp "{" name_keywords_exp_not_pat "}"')
     def call_exp_not_pat(self, p):
-        return Call(p, func=p[0], args=[], keywords=p[2])
+        return ast.Call(p, func=p[0], args=[], keywords=p[2])
 
     @_('prefixexp "{" name_keywords_pat_not_exp "}"')
     def call_pat_not_exp(self, p):
-        return Call(p, func=p[0], args=[], keywords=p[2])
+        return ast.CallPattern(p, func=p[0], args=[], keywords=self.pattern(p[2]))
 
     @_('keywords_exp_and_pat "," keyword_exp_and_pat',
        'keywords_exp_and_pat "," tuple_unpack_exp_and_pat')
     def keywords_exp_and_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('keyword_exp_and_pat')
     def keywords_exp_and_pat(self, p):
@@ -708,7 +769,8 @@ class Parser(Error, sly.Parser):
        'keywords_exp_not_pat "," tuple_unpack_exp_and_pat',
        'keywords_exp_not_pat "," tuple_unpack_exp_not_pat')
     def keywords_exp_not_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('keyword_exp_not_pat')
     def keywords_exp_not_pat(self, p):
@@ -721,7 +783,8 @@ class Parser(Error, sly.Parser):
        'keywords_pat_not_exp "," tuple_unpack_exp_and_pat',
        'keywords_pat_not_exp "," tuple_unpack_pat_not_exp')
     def keywords_pat_not_exp(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('keyword_pat_not_exp')
     def keywords_pat_not_exp(self, p):
@@ -730,7 +793,7 @@ class Parser(Error, sly.Parser):
     @_('NAME ":" exp_and_pat',
        'END ":" exp_and_pat')
     def keyword_exp_and_pat(self, p):
-        return Keyword(p, arg=p[0], value=p[2])
+        return ast.Keyword(p, arg=p[0], value=p[2])
 
     @_('map_unpack_exp_and_pat')
     def keyword_exp_and_pat(self, p):
@@ -739,7 +802,7 @@ class Parser(Error, sly.Parser):
     @_('NAME ":" exp_not_pat',
        'END ":" exp_not_pat')
     def keyword_exp_not_pat(self, p):
-        return Keyword(p, arg=p[0], value=p[2])
+        return ast.Keyword(p, arg=p[0], value=p[2])
 
     @_('map_unpack_exp_not_pat')
     def keyword_exp_not_pat(self, p):
@@ -748,18 +811,18 @@ class Parser(Error, sly.Parser):
     @_('NAME ":" pat_not_exp',
        'END ":" pat_not_exp')
     def keyword_pat_not_exp(self, p):
-        return Keyword(p, arg=p[0], value=p[2])
+        return ast.KeywordPattern(p, arg=p[0], value=p[2])
 
     @_('NAME ":" exp_and_pat "=" exp',
        'END ":" exp_and_pat "=" exp',
        'NAME ":" pat_not_exp "=" exp',
        'END ":" pat_not_exp "=" exp')
     def keyword_pat_not_exp(self, p):
-        return Keyword(p, arg=p[0], value=p[2], default=p[4])
+        return ast.KeywordPattern(p, arg=p[0], value=self.pattern(p[2]), default=p[4])
 
     @_('NAME "=" exp')
     def keyword_pat_not_exp(self, p):
-        return Keyword(p, arg=p[0], value=Name(p, s=p[0]), default=p[2])
+        return ast.KeywordPattern(p, arg=p[0], value=ast.NamePattern(p, s=p[0]), default=p[2])
 
     @_('map_unpack_pat_not_exp')
     def keyword_pat_not_exp(self, p):
@@ -767,7 +830,8 @@ class Parser(Error, sly.Parser):
 
     @_('name_keywords_exp_and_pat "," name_keyword_exp_and_pat')
     def name_keywords_exp_and_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('name_keyword_exp_and_pat')
     def name_keywords_exp_and_pat(self, p):
@@ -777,7 +841,8 @@ class Parser(Error, sly.Parser):
        'name_keywords_exp_not_pat "," name_keyword_exp_and_pat',
        'name_keywords_exp_not_pat "," name_keyword_exp_not_pat')
     def name_keywords_exp_not_pat(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('name_keyword_exp_not_pat')
     def name_keywords_exp_not_pat(self, p):
@@ -787,7 +852,8 @@ class Parser(Error, sly.Parser):
        'name_keywords_pat_not_exp "," name_keyword_exp_and_pat',
        'name_keywords_pat_not_exp "," name_keyword_pat_not_exp')
     def name_keywords_pat_not_exp(self, p):
-        return p[0] + [p[2]]
+        p[0].append(p[2])
+        return p[0]
 
     @_('name_keyword_pat_not_exp')
     def name_keywords_pat_not_exp(self, p):
@@ -795,7 +861,7 @@ class Parser(Error, sly.Parser):
 
     @_('NAME')
     def name_keyword_exp_and_pat(self, p):
-        return Keyword(p, arg=p[0], value=Name(p, s=p[0]))
+        return ast.Keyword(p, arg=p[0], value=ast.Name(p, s=p[0]))
 
     @_('keyword_exp_and_pat')
     def name_keyword_exp_and_pat(self, p):
@@ -811,15 +877,15 @@ class Parser(Error, sly.Parser):
 
     @_('LET pat "=" exp')
     def match(self, p):
-        return Match(p, pattern=p[1], value=p[3])
+        return ast.Match(p, pattern=p[1], value=p[3])
 
     @_('DEF name arguments ":" block END')
     def function(self, p):
-        return Function(p, name=p[1], args=p[2], body=p[4])
+        return ast.Function(p, name=p[1], args=p[2], body=p[4])
 
     @_('"(" arguments_pat ")"')
     def arguments(self, p):
-        return Arguments(p, args=p[1][0], vararg=p[1][1], kwonlyargs=p[1][2], kwarg=p[1][3])
+        return ast.Arguments(p, args=p[1][0], vararg=p[1][1], kwonlyargs=p[1][2], kwarg=p[1][3])
 
     @_('name_keyword_pat "," arguments_pat')
     def arguments_pat(self, p):
@@ -888,11 +954,11 @@ class Parser(Error, sly.Parser):
 
     @_('name_keyword_pat "=" exp')
     def default_pat(self, p):
-        return Keyword(p, arg=p[0].arg, value=p[0].value, default=p[2])
+        return ast.KeywordPattern(p, arg=p[0].arg, value=p[0].value, default=p[2])
 
     @_('NAME')
     def name_keyword_pat(self, p):
-        return Keyword(p, arg=p[0], value=Name(p, s=p[0]))
+        return ast.KeywordPattern(p, arg=p[0], value=ast.NamePattern(p, s=p[0]))
 
     @_('keyword_pat')
     def name_keyword_pat(self, p):
@@ -901,17 +967,19 @@ class Parser(Error, sly.Parser):
     @_('NAME ":" pat',
        'END ":" pat')
     def keyword_pat(self, p):
-        return Keyword(p, arg=p[0], value=p[2])
+        return ast.KeywordPattern(p, arg=p[0], value=p[2])
+
+    # the parameter is the pattern unpacked into it
 
     @_('tuple_unpack_exp_and_pat',
        'tuple_unpack_pat_not_exp')
     def tuple_unpack_pat(self, p):
-        return p[0]
+        return self.pattern(p[0]).value
 
     @_('map_unpack_exp_and_pat',
        'map_unpack_pat_not_exp')
     def map_unpack_pat(self, p):
-        return p[0]
+        return self.pattern(p[0]).value
 
     @_('')
     def empty(self, p):
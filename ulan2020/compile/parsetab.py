@@ -0,0 +1,1071 @@
+# generated by ulan2020.compile.table, do not edit
+_tabversion = 1
+_signature = 'aeec78190034b10b8750e28b7b7b3118607de312df3bf8c4bab0b347378b6270'
+_lr_action = {
+    0: {'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2, '$end': -2},
+    1: {'$end': 0},
+    2: {'$end': -1, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    3: {'CASE': -3, 'WHILE': -3, 'FOR': -3, 'IF': -3, 'RETURN': -3, 'DEF': -3, 'LET': -3, '.': -3, '(': -3, '{': -3, '[': -3, 'MODULE': -3, 'NAME': -3, 'STRIP_STRING': -3, 'STRING': -3, 'HEX': -3, 'OCT': -3, 'DEC': -3, 'FLOAT': -3, '$end': -3, 'END': -3, 'ELSE': -3, 'WHEN': -3},
+    4: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    5: {'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    6: {';': 60},
+    7: {'LET': 62, '(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    8: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    9: {'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    10: {';': 78, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    11: {'CASE': -11, 'WHILE': -11, 'FOR': -11, 'IF': -11, 'RETURN': -11, 'DEF': -11, 'LET': -11, '.': -11, '(': -11, '{': -11, '[': -11, 'MODULE': -11, 'NAME': -11, 'STRIP_STRING': -11, 'STRING': -11, 'HEX': -11, 'OCT': -11, 'DEC': -11, 'FLOAT': -11, '$end': -11, 'END': -11, 'ELSE': -11, 'WHEN': -11},
+    12: {'NAME': 81},
+    13: {'IS': -57, '.': -57, '{': -57, '(': -57, 'ATTRIBUTE': -57, '[': -57, ';': -57, 'WHEN': -57, ':': -57, 'IN': -57, '=': -57, ',': -57, ')': -57, '}': -57, ']': -57},
+    14: {';': -20, ':': -20},
+    15: {';': -21, ':': -21, '.': 82, '{': 83, '(': 84, 'ATTRIBUTE': 85, '[': 86},
+    16: {';': -22, ':': -22},
+    17: {';': -23, ':': -23},
+    18: {';': -24, ':': -24},
+    19: {'.': -47, '{': -47, '(': -47, 'ATTRIBUTE': -47, '[': -47, ';': -47, ':': -47, 'WHEN': -47, ',': -47, ')': -47, '}': -47, ']': -47, '=': -47},
+    20: {'.': -48, '{': -48, '(': -48, 'ATTRIBUTE': -48, '[': -48, ';': -48, ':': -48, 'IS': 87},
+    21: {'(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    22: {')': -244, '*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    23: {'.': -60, '{': -60, '(': -60, 'ATTRIBUTE': -60, '[': -60, ';': -60, 'WHEN': -60, ':': -60, ',': -60, ')': -60, '}': -60, ']': -60, '=': -60},
+    24: {'.': -61, '{': -61, '(': -61, 'ATTRIBUTE': -61, '[': -61, ';': -61, 'WHEN': -61, ':': -61, ',': -61, ')': -61, '}': -61, ']': -61, '=': -61},
+    25: {'.': -62, '{': -62, '(': -62, 'ATTRIBUTE': -62, '[': -62, ';': -62, 'WHEN': -62, ':': -62, ',': -62, ')': -62, '}': -62, ']': -62, '=': -62},
+    26: {'.': -63, '{': -63, '(': -63, 'ATTRIBUTE': -63, '[': -63, ';': -63, 'WHEN': -63, ':': -63, ',': -63, ')': -63, '}': -63, ']': -63, '=': -63},
+    27: {'.': -64, '{': -64, '(': -64, 'ATTRIBUTE': -64, '[': -64, ';': -64, 'WHEN': -64, ':': -64, ',': -64, ')': -64, '}': -64, ']': -64, '=': -64},
+    28: {'.': -65, '{': -65, '(': -65, 'ATTRIBUTE': -65, '[': -65, ';': -65, 'WHEN': -65, ':': -65, ',': -65, ')': -65, '}': -65, ']': -65, '=': -65},
+    29: {'.': -66, '{': -66, '(': -66, 'ATTRIBUTE': -66, '[': -66, ';': -66, 'WHEN': -66, ':': -66, ',': -66, ')': -66, '}': -66, ']': -66, '=': -66},
+    30: {'.': -67, '{': -67, '(': -67, 'ATTRIBUTE': -67, '[': -67, ';': -67, 'WHEN': -67, ':': -67, ',': -67, ')': -67, '}': -67, ']': -67, '=': -67},
+    31: {'.': -68, '{': -68, '(': -68, 'ATTRIBUTE': -68, '[': -68, ';': -68, 'WHEN': -68, ':': -68, ',': -68, ')': -68, '}': -68, ']': -68, '=': -68, 'NAME': 99},
+    32: {'IS': -53, '.': -53, '{': -53, '(': -53, 'ATTRIBUTE': -53, '[': -53, ';': -53, 'WHEN': -53, ':': -53, 'IN': -53, '=': -53, ',': -53, ')': -53, '}': -53, ']': -53},
+    33: {'IS': -54, '.': -54, '{': -54, '(': -54, 'ATTRIBUTE': -54, '[': -54, ';': -54, 'WHEN': -54, ':': -54, 'IN': -54, '=': -54, ',': -54, ')': -54, '}': -54, ']': -54},
+    34: {'IS': -55, '.': -55, '{': -55, '(': -55, 'ATTRIBUTE': -55, '[': -55, ';': -55, 'WHEN': -55, ':': -55, 'IN': -55, '=': -55, ',': -55, ')': -55, '}': -55, ']': -55},
+    35: {'IS': -56, '.': -56, '{': -56, '(': -56, 'ATTRIBUTE': -56, '[': -56, ';': -56, 'WHEN': -56, ':': -56, 'IN': -56, '=': -56, ',': -56, ')': -56, '}': -56, ']': -56},
+    36: {'IS': -58, '.': -58, '{': -58, '(': -58, 'ATTRIBUTE': -58, '[': -58, ';': -58, 'WHEN': -58, ':': -58, 'IN': -58, '=': -58, ',': -58, ')': -58, '}': -58, ']': -58},
+    37: {'/': 105, '}': -244, 'MAP_UNPACK': 117, '*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    38: {']': -244, '*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    39: {'MODULE': 123, 'IS': -110, '.': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110, ';': -110, 'WHEN': -110, ':': -110, ',': -110, ')': -110, '}': -110, ']': -110, '=': -110},
+    40: {'NAME': -112, '.': -112, '{': -112, '(': -112, 'ATTRIBUTE': -112, '[': -112, ';': -112, 'WHEN': -112, ':': -112, ',': -112, ')': -112, '}': -112, ']': -112, '=': -112},
+    41: {'IS': -101, '.': -101, '{': -101, '(': -101, 'ATTRIBUTE': -101, '[': -101, ';': -101, 'WHEN': -101, ':': -101, 'IN': -101, '=': -101, ',': -101, ')': -101, '}': -101, ']': -101},
+    42: {'IS': -102, '.': -102, '{': -102, '(': -102, 'ATTRIBUTE': -102, '[': -102, ';': -102, 'WHEN': -102, ':': -102, 'IN': -102, '=': -102, ',': -102, ')': -102, '}': -102, ']': -102},
+    43: {'IS': -103, '.': -103, '{': -103, '(': -103, 'ATTRIBUTE': -103, '[': -103, ';': -103, 'WHEN': -103, ':': -103, 'IN': -103, '=': -103, ',': -103, ')': -103, '}': -103, ']': -103},
+    44: {'IS': -108, '.': -108, '{': -108, '(': -108, 'ATTRIBUTE': -108, '[': -108, ';': -108, 'WHEN': -108, ':': -108, 'IN': -108, '=': -108, ',': -108, ')': -108, '}': -108, ']': -108},
+    45: {'IS': -109, '.': -109, '{': -109, '(': -109, 'ATTRIBUTE': -109, '[': -109, ';': -109, 'WHEN': -109, ':': -109, 'IN': -109, '=': -109, ',': -109, ')': -109, '}': -109, ']': -109},
+    46: {'IS': -105, '.': -105, '{': -105, '(': -105, 'ATTRIBUTE': -105, '[': -105, ';': -105, 'WHEN': -105, ':': -105, 'IN': -105, '=': -105, ',': -105, ')': -105, '}': -105, ']': -105},
+    47: {'IS': -106, '.': -106, '{': -106, '(': -106, 'ATTRIBUTE': -106, '[': -106, ';': -106, 'WHEN': -106, ':': -106, 'IN': -106, '=': -106, ',': -106, ')': -106, '}': -106, ']': -106},
+    48: {'IS': -107, '.': -107, '{': -107, '(': -107, 'ATTRIBUTE': -107, '[': -107, ';': -107, 'WHEN': -107, ':': -107, 'IN': -107, '=': -107, ',': -107, ')': -107, '}': -107, ']': -107},
+    49: {'IS': -104, '.': -104, '{': -104, '(': -104, 'ATTRIBUTE': -104, '[': -104, ';': -104, 'WHEN': -104, ':': -104, 'IN': -104, '=': -104, ',': -104, ')': -104, '}': -104, ']': -104},
+    50: {'WHEN': 125},
+    51: {'WHEN': -25, ';': -25, ':': -25, '}': -25, ',': -25, ')': -25},
+    52: {'WHEN': -26, ';': -26, ':': -26, '}': -26, ',': -26, ')': -26},
+    53: {'WHEN': -32, ';': -32, ',': -32, ')': -32, '}': -32, ':': -32, ']': -32, '=': -32},
+    54: {'WHEN': -33, ';': -33, ',': -33, ')': -33, '}': -33, ':': -33, ']': -33, '=': -33},
+    55: {'WHEN': -34, ';': -34, ',': -34, ')': -34, '}': -34, ':': -34, ']': -34, '=': -34, '.': -47, '{': -47, '(': -47, 'ATTRIBUTE': -47, '[': -47},
+    56: {'WHEN': -29, ';': -29, ',': -29, ')': -29, '}': -29, ':': -29, ']': -29},
+    57: {'WHEN': -30, 'IN': -30, '=': -30, ';': -30, ',': -30, ')': -30, '}': -30, ':': -30, ']': -30, 'IS': 87, '.': -48, '{': -48, '(': -48, 'ATTRIBUTE': -48, '[': -48},
+    58: {'.': 82, '{': 83, '(': 84, 'ATTRIBUTE': 85, '[': 86},
+    59: {':': 126},
+    60: {'CASE': -12, 'WHILE': -12, 'FOR': -12, 'IF': -12, 'RETURN': -12, 'DEF': -12, 'LET': -12, '.': -12, '(': -12, '{': -12, '[': -12, 'MODULE': -12, 'NAME': -12, 'STRIP_STRING': -12, 'STRING': -12, 'HEX': -12, 'OCT': -12, 'DEC': -12, 'FLOAT': -12, '$end': -12, 'END': -12, 'ELSE': -12, 'WHEN': -12},
+    61: {'IN': 127},
+    62: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    63: {'IN': -27, '=': -27, ':': -27, ',': -27, ')': -27, 'IS': 129},
+    64: {'IN': -28, '=': -28, ':': -28, ',': -28, ')': -28},
+    65: {'IS': -35, 'IN': -35, '=': -35, ',': -35, '}': -35, ']': -35, ':': -35, ')': -35},
+    66: {'IS': 130, 'IN': -29, '=': -29, ',': -29, ')': -29, '}': -29, ':': -29, ']': -29},
+    67: {')': -244, '*': 135, '(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    68: {'IS': -41, 'IN': -41, '=': -41, ',': -41, '}': -41, ']': -41, ':': -41, ')': -41},
+    69: {'IS': -42, 'IN': -42, '=': -42, ',': -42, '}': -42, ']': -42, ':': -42, ')': -42},
+    70: {'IS': -43, 'IN': -43, '=': -43, ',': -43, '}': -43, ']': -43, ':': -43, ')': -43},
+    71: {'IS': -44, 'IN': -44, '=': -44, ',': -44, '}': -44, ']': -44, ':': -44, ')': -44},
+    72: {'{': 137, '(': 138, 'ATTRIBUTE': 85, '[': 86},
+    73: {'/': 105, '}': -244, 'MAP_UNPACK': 149, '*': 135, '(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    74: {']': -244, '*': 135, '(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    75: {'IS': -110, 'IN': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110, '=': -110, ',': -110, ')': -110, '.': -110, '}': -110, ':': -110, ']': -110, ';': -110, 'WHEN': -110, 'MODULE': 123},
+    76: {'=': 152},
+    77: {':': 153},
+    78: {'CASE': -9, 'WHILE': -9, 'FOR': -9, 'IF': -9, 'RETURN': -9, 'DEF': -9, 'LET': -9, '.': -9, '(': -9, '{': -9, '[': -9, 'MODULE': -9, 'NAME': -9, 'STRIP_STRING': -9, 'STRING': -9, 'HEX': -9, 'OCT': -9, 'DEC': -9, 'FLOAT': -9, '$end': -9, 'END': -9, 'ELSE': -9, 'WHEN': -9},
+    79: {';': 154},
+    80: {'(': 156},
+    81: {'(': -110},
+    82: {'(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    83: {'}': -244, 'NAME': 165, 'END': 167, 'MAP_UNPACK': 117},
+    84: {')': -244, 'END': 167, 'NAME': 176, 'MAP_UNPACK': 117, '*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    85: {'NAME': 177},
+    86: {'.': 21, '(': 22, '*': 98, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    87: {'(': 185, '{': 187, '[': 188, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    88: {'.': 189, '{': 83, '(': 84, 'ATTRIBUTE': 85, '[': 86},
+    89: {'.': -48, '{': -48, '(': -48, 'ATTRIBUTE': -48, '[': -48, ';': -48, 'WHEN': -48, ':': -48, ',': -48, ')': -48, '}': -48, ']': -48, '=': -48},
+    90: {')': 190},
+    91: {')': 191},
+    92: {')': 192},
+    93: {')': 193},
+    94: {',': 194, ')': -25},
+    95: {',': 195, ')': -26},
+    96: {')': -76, ']': -76},
+    97: {')': -71, ']': -71},
+    98: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    99: {'.': -114, '{': -114, '(': -114, 'ATTRIBUTE': -114, '[': -114, ';': -114, 'WHEN': -114, ':': -114, ',': -114, ')': -114, '}': -114, ']': -114, '=': -114, 'MODULE': 198},
+    100: {'}': 199, ',': 200},
+    101: {'}': 201, ',': 202},
+    102: {'}': 203, ',': 204},
+    103: {'}': 205},
+    104: {'}': 206, ',': 207},
+    105: {'}': 208},
+    106: {'}': -135, ',': -135},
+    107: {'}': -131, ',': -131},
+    108: {'}': -86, ',': -86, ']': -86, ')': -86},
+    109: {'}': -82, ',': -82, ']': -82, ')': -82},
+    110: {'}': -139, ',': -139},
+    111: {':': 209},
+    112: {'}': -91, ',': -91, ':': -25},
+    113: {'}': -90, ',': -90, ']': -90, ')': -90},
+    114: {'}': -133, ',': -133},
+    115: {'}': -85, ',': -85, ':': -26},
+    116: {'}': -84, ',': -84, ']': -84, ')': -84},
+    117: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    118: {']': 212, ',': 202},
+    119: {']': 213},
+    120: {']': 214, ',': 207},
+    121: {']': -91, ',': -91, ')': -91, '}': -91},
+    122: {']': -85, ',': -85, ')': -85, '}': -85},
+    123: {'NAME': -113, '.': -113, '{': -113, '(': -113, 'ATTRIBUTE': -113, '[': -113, ';': -113, 'WHEN': -113, ':': -113, ',': -113, ')': -113, '}': -113, ']': -113, '=': -113},
+    124: {'WHEN': 216, 'END': 217, 'ELSE': 218},
+    125: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    126: {'END': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    127: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    128: {'IN': 222},
+    129: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    130: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    131: {')': 227},
+    132: {',': 228, 'IS': 129},
+    133: {',': 229, ')': -26},
+    134: {')': -81},
+    135: {'(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    136: {'.': 82, '{': 137, '(': 138, 'ATTRIBUTE': 85, '[': 86},
+    137: {'}': -244, 'NAME': 235, 'END': 237, 'MAP_UNPACK': 149},
+    138: {')': -244, 'NAME': 243, 'END': 237, 'MAP_UNPACK': 149, '*': 135, '(': 67, '.': 21, '{': 73, '[': 74, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    139: {'}': 244, ',': 245},
+    140: {'}': 246, ',': 247},
+    141: {'}': 203, ',': 248},
+    142: {'}': 206, ',': 249},
+    143: {'}': -141, ',': -141},
+    144: {'}': -92, ',': -92, ']': -92, ')': -92},
+    145: {'}': -145, ',': -145},
+    146: {':': 250},
+    147: {'}': -97, ',': -97, ']': -97, ')': -97, 'IS': 129},
+    148: {'}': -96, ',': -96, ']': -96, ')': -96},
+    149: {'(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    150: {']': 252, ',': 247},
+    151: {']': 214, ',': 249},
+    152: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    153: {'END': -2, 'ELSE': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    154: {'CASE': -10, 'WHILE': -10, 'FOR': -10, 'IF': -10, 'RETURN': -10, 'DEF': -10, 'LET': -10, '.': -10, '(': -10, '{': -10, '[': -10, 'MODULE': -10, 'NAME': -10, 'STRIP_STRING': -10, 'STRING': -10, 'HEX': -10, 'OCT': -10, 'DEC': -10, 'FLOAT': -10, '$end': -10, 'END': -10, 'ELSE': -10, 'WHEN': -10},
+    155: {':': 255},
+    156: {'NAME': 262, '*': 264, 'END': 266, ')': -231, 'MAP_UNPACK': 272},
+    157: {'.': 273, '{': 83, '(': 84, 'ATTRIBUTE': 85, '[': 86},
+    158: {'}': 274, ',': 275},
+    159: {'}': 276},
+    160: {'}': 277, ',': 278},
+    161: {'}': -203, ',': -203},
+    162: {'}': -201, ',': -201},
+    163: {'}': -213, ',': -213},
+    164: {'}': -211, ',': -211},
+    165: {'}': -212, ',': -212, ':': 279},
+    166: {'}': -190, ',': -190, ')': -190},
+    167: {':': 280},
+    168: {'}': -187, ',': -187, ')': -187},
+    169: {')': 281, ',': 282},
+    170: {')': 283, ',': 284},
+    171: {')': 285, ',': 286},
+    172: {',': 287, ')': 288},
+    173: {')': 289},
+    174: {')': -173, ',': -173},
+    175: {')': -170, ',': -170},
+    176: {':': 279, 'MODULE': 123, 'IS': -110, ',': -110, ')': -110, '.': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110},
+    177: {'.': -117, '{': -117, '(': -117, 'ATTRIBUTE': -117, '[': -117, ';': -117, 'WHEN': -117, ':': -117, ',': -117, ')': -117, '}': -117, ']': -117, '=': -117},
+    178: {']': 290},
+    179: {']': 291},
+    180: {']': -25, ',': 194},
+    181: {']': -26, ',': 195},
+    182: {']': -49},
+    183: {']': -50},
+    184: {';': -31, 'WHEN': -31, ':': -31, 'IS': -31, 'IN': -31, '=': -31, ',': -31, ')': -31, '}': -31, ']': -31, '{': -48, '(': -48, 'ATTRIBUTE': -48, '[': -48},
+    185: {')': -244, '*': 293, '(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    186: {'{': 295, '(': 296, 'ATTRIBUTE': 85, '[': 86},
+    187: {'/': 105, '}': -244, 'MAP_UNPACK': 300, '*': 293, '(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    188: {']': -244, '*': 293, '(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    189: {'(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    190: {'.': -59, '{': -59, '(': -59, 'ATTRIBUTE': -59, '[': -59, ';': -59, 'WHEN': -59, ':': -59, ',': -59, ')': -59, '}': -59, ']': -59, '=': -59},
+    191: {'IS': -51, '.': -51, '{': -51, '(': -51, 'ATTRIBUTE': -51, '[': -51, ';': -51, 'WHEN': -51, ':': -51, 'IN': -51, '=': -51, ',': -51, ')': -51, '}': -51, ']': -51},
+    192: {'IS': -52, '.': -52, '{': -52, '(': -52, 'ATTRIBUTE': -52, '[': -52, ';': -52, 'WHEN': -52, ':': -52, 'IN': -52, '=': -52, ',': -52, ')': -52, '}': -52, ']': -52},
+    193: {'.': -118, '{': -118, '(': -118, 'ATTRIBUTE': -118, '[': -118, ';': -118, 'WHEN': -118, ':': -118, ',': -118, ')': -118, '}': -118, ']': -118, '=': -118},
+    194: {')': -244, ']': -244, '*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    195: {')': -244, ']': -244, '*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    196: {')': -99, '}': -99, ',': -99, ']': -99},
+    197: {')': -98, '}': -98, ',': -98, ']': -98},
+    198: {'NAME': -111, '.': -111, '{': -111, '(': -111, 'ATTRIBUTE': -111, '[': -111, ';': -111, 'WHEN': -111, ':': -111, ',': -111, ')': -111, '}': -111, ']': -111, '=': -111},
+    199: {'.': -129, '{': -129, '(': -129, 'ATTRIBUTE': -129, '[': -129, ';': -129, 'WHEN': -129, ':': -129, ',': -129, ')': -129, '}': -129, ']': -129, '=': -129},
+    200: {'MAP_UNPACK': 117, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    201: {'.': -125, '{': -125, '(': -125, 'ATTRIBUTE': -125, '[': -125, ';': -125, 'WHEN': -125, ':': -125, ',': -125, ')': -125, '}': -125, ']': -125, '=': -125},
+    202: {'*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    203: {'IS': -127, '.': -127, '{': -127, '(': -127, 'ATTRIBUTE': -127, '[': -127, ';': -127, 'WHEN': -127, ':': -127, 'IN': -127, '=': -127, ',': -127, ')': -127, '}': -127, ']': -127},
+    204: {'MAP_UNPACK': 117, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    205: {'IS': -128, '.': -128, '{': -128, '(': -128, 'ATTRIBUTE': -128, '[': -128, ';': -128, 'WHEN': -128, ':': -128, 'IN': -128, '=': -128, ',': -128, ')': -128, '}': -128, ']': -128},
+    206: {'IS': -123, '.': -123, '{': -123, '(': -123, 'ATTRIBUTE': -123, '[': -123, ';': -123, 'WHEN': -123, ':': -123, 'IN': -123, '=': -123, ',': -123, ')': -123, '}': -123, ']': -123},
+    207: {'*': 98, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    208: {'IS': -124, '.': -124, '{': -124, '(': -124, 'ATTRIBUTE': -124, '[': -124, ';': -124, 'WHEN': -124, ':': -124, 'IN': -124, '=': -124, ',': -124, ')': -124, '}': -124, ']': -124},
+    209: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    210: {'}': -150, ',': -150, ')': -150},
+    211: {'}': -149, ',': -149, ')': -149},
+    212: {'.': -121, '{': -121, '(': -121, 'ATTRIBUTE': -121, '[': -121, ';': -121, 'WHEN': -121, ':': -121, ',': -121, ')': -121, '}': -121, ']': -121, '=': -121},
+    213: {'IS': -119, '.': -119, '{': -119, '(': -119, 'ATTRIBUTE': -119, '[': -119, ';': -119, 'WHEN': -119, ':': -119, 'IN': -119, '=': -119, ',': -119, ')': -119, '}': -119, ']': -119},
+    214: {'IS': -120, '.': -120, '{': -120, '(': -120, 'ATTRIBUTE': -120, '[': -120, ';': -120, 'WHEN': -120, ':': -120, 'IN': -120, '=': -120, ',': -120, ')': -120, '}': -120, ']': -120},
+    215: {'CASE': -4, 'WHILE': -4, 'FOR': -4, 'IF': -4, 'RETURN': -4, 'DEF': -4, 'LET': -4, '.': -4, '(': -4, '{': -4, '[': -4, 'MODULE': -4, 'NAME': -4, 'STRIP_STRING': -4, 'STRING': -4, 'HEX': -4, 'OCT': -4, 'DEC': -4, 'FLOAT': -4, '$end': -4, 'END': -4, 'ELSE': -4, 'WHEN': -4},
+    216: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    217: {'CASE': -15, 'WHILE': -15, 'FOR': -15, 'IF': -15, 'RETURN': -15, 'DEF': -15, 'LET': -15, '.': -15, '(': -15, '{': -15, '[': -15, 'MODULE': -15, 'NAME': -15, 'STRIP_STRING': -15, 'STRING': -15, 'HEX': -15, 'OCT': -15, 'DEC': -15, 'FLOAT': -15, '$end': -15, 'END': -15, 'ELSE': -15, 'WHEN': -15},
+    218: {':': 320},
+    219: {':': 321},
+    220: {'END': 322, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    221: {':': 323},
+    222: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    223: {'IS': -36, 'IN': -36, '=': -36, ',': -36, '}': -36, ']': -36, ':': -36, ')': -36},
+    224: {'IS': -37, 'IN': -37, '=': -37, ',': -37, '}': -37, ']': -37, ':': -37, ')': -37, '{': -48, '(': -48, 'ATTRIBUTE': -48, '[': -48},
+    225: {'IS': -38, 'IN': -38, '=': -38, ',': -38, '}': -38, ']': -38, ':': -38, ')': -38},
+    226: {'IS': -39, 'IN': -39, '=': -39, ',': -39, '}': -39, ']': -39, ':': -39, ')': -39, '{': -48, '(': -48, 'ATTRIBUTE': -48, '[': -48},
+    227: {'IS': -40, 'IN': -40, '=': -40, ',': -40, '}': -40, ']': -40, ':': -40, ')': -40},
+    228: {')': -244, '*': 328, '(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    229: {')': -244, '*': 135, '(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    230: {')': -100, '}': -100, ',': -100, ']': -100, 'IS': 129},
+    231: {'}': 331, ',': 332},
+    232: {'}': 277, ',': 333},
+    233: {'}': -207, ',': -207},
+    234: {'}': -214, ',': -214},
+    235: {'}': -212, ',': -212, '=': 334, ':': 335},
+    236: {'}': -193, ',': -193, ')': -193},
+    237: {':': 336},
+    238: {')': 337, ',': 338},
+    239: {')': 339, ',': 340},
+    240: {')': 285, ',': 341},
+    241: {',': 342, ')': 288},
+    242: {')': -180, ',': -180},
+    243: {'=': 334, ':': 335, 'IS': -110, ',': -110, ')': -110, '.': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110, 'MODULE': 123},
+    244: {'IS': -130, 'IN': -130, '=': -130, ',': -130, '}': -130, ']': -130, ':': -130, ')': -130},
+    245: {'MAP_UNPACK': 272, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    246: {'IS': -126, 'IN': -126, '=': -126, ',': -126, '}': -126, ']': -126, ':': -126, ')': -126},
+    247: {'*': 328, '(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    248: {'MAP_UNPACK': 149, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    249: {'*': 135, '(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    250: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    251: {'}': -151, ',': -151, ')': -151, 'IS': 129},
+    252: {'IS': -122, 'IN': -122, '=': -122, ',': -122, '}': -122, ']': -122, ':': -122, ')': -122},
+    253: {';': -215, ':': -215},
+    254: {'END': 359, 'ELSE': 360, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    255: {'END': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    256: {')': 362},
+    257: {')': -218},
+    258: {')': -219, ',': 363, '=': 364},
+    259: {')': -221},
+    260: {')': -222, ',': 365},
+    261: {',': -236, '=': -236, ')': -236},
+    262: {',': -237, '=': -237, ')': -237, ':': 366},
+    263: {')': -224},
+    264: {',': 367, '(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    265: {')': -226, ',': 368},
+    266: {':': 369},
+    267: {')': -232},
+    268: {',': -240, ')': -240},
+    269: {',': -241, ')': -241},
+    270: {')': -242},
+    271: {')': -243},
+    272: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    273: {'(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    274: {'.': -158, '{': -158, '(': -158, 'ATTRIBUTE': -158, '[': -158, ';': -158, 'WHEN': -158, ':': -158, ',': -158, ')': -158, '}': -158, ']': -158, '=': -158},
+    275: {'NAME': 165, 'END': 167, 'MAP_UNPACK': 117},
+    276: {'IS': -152, '.': -152, '{': -152, '(': -152, 'ATTRIBUTE': -152, '[': -152, ';': -152, 'WHEN': -152, ':': -152, 'IN': -152, '=': -152, ',': -152, ')': -152, '}': -152, ']': -152},
+    277: {'IS': -153, '.': -153, '{': -153, '(': -153, 'ATTRIBUTE': -153, '[': -153, ';': -153, 'WHEN': -153, ':': -153, 'IN': -153, '=': -153, ',': -153, ')': -153, '}': -153, ']': -153},
+    278: {'NAME': 165, 'END': 167, 'MAP_UNPACK': 117},
+    279: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    280: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    281: {'.': -159, '{': -159, '(': -159, 'ATTRIBUTE': -159, '[': -159, ';': -159, 'WHEN': -159, ':': -159, ',': -159, ')': -159, '}': -159, ']': -159, '=': -159},
+    282: {'*': 98, 'END': 167, 'NAME': 383, 'MAP_UNPACK': 117},
+    283: {'.': -160, '{': -160, '(': -160, 'ATTRIBUTE': -160, '[': -160, ';': -160, 'WHEN': -160, ':': -160, ',': -160, ')': -160, '}': -160, ']': -160, '=': -160},
+    284: {'END': 167, 'NAME': 176, '*': 98, 'MAP_UNPACK': 117, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    285: {'IS': -154, '.': -154, '{': -154, '(': -154, 'ATTRIBUTE': -154, '[': -154, ';': -154, 'WHEN': -154, ':': -154, 'IN': -154, '=': -154, ',': -154, ')': -154, '}': -154, ']': -154},
+    286: {'*': 98, 'END': 167, 'NAME': 383, 'MAP_UNPACK': 117},
+    287: {'END': 167, 'NAME': 176, '*': 98, 'MAP_UNPACK': 117, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    288: {'IS': -156, '.': -156, '{': -156, '(': -156, 'ATTRIBUTE': -156, '[': -156, ';': -156, 'WHEN': -156, ':': -156, 'IN': -156, '=': -156, ',': -156, ')': -156, '}': -156, ']': -156},
+    289: {'IS': -155, '.': -155, '{': -155, '(': -155, 'ATTRIBUTE': -155, '[': -155, ';': -155, 'WHEN': -155, ':': -155, 'IN': -155, '=': -155, ',': -155, ')': -155, '}': -155, ']': -155},
+    290: {'.': -115, '{': -115, '(': -115, 'ATTRIBUTE': -115, '[': -115, ';': -115, 'WHEN': -115, ':': -115, ',': -115, ')': -115, '}': -115, ']': -115, '=': -115},
+    291: {'.': -116, '{': -116, '(': -116, 'ATTRIBUTE': -116, '[': -116, ';': -116, 'WHEN': -116, ':': -116, ',': -116, ')': -116, '}': -116, ']': -116, '=': -116},
+    292: {',': 392, ')': -26},
+    293: {'(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    294: {'.': 82, '{': 295, '(': 296, 'ATTRIBUTE': 85, '[': 86},
+    295: {'}': -244, 'NAME': 394, 'END': 395, 'MAP_UNPACK': 300},
+    296: {')': -244, 'END': 395, 'NAME': 398, 'MAP_UNPACK': 300, '*': 293, '(': 185, '.': 21, '{': 187, '[': 188, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    297: {'}': 203, ',': 399},
+    298: {'}': 206, ',': 400},
+    299: {':': 401},
+    300: {'(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    301: {']': 214, ',': 400},
+    302: {';': -46, 'WHEN': -46, ':': -46, ',': -46, ')': -46, '}': -46, ']': -46, '=': -46, '{': 83, '(': 84, 'ATTRIBUTE': 85, '[': 86},
+    303: {')': -72, ']': -72},
+    304: {')': -73, ']': -73, ',': 202},
+    305: {')': -74, ']': -74, ',': 207},
+    306: {')': -75, ']': -75, ',': 202},
+    307: {')': -69, ']': -69},
+    308: {')': -70, ']': -70, ',': 207},
+    309: {'}': -136, ',': -136},
+    310: {'}': -137, ',': -137},
+    311: {'}': -87, ',': -87, ']': -87, ')': -87},
+    312: {'}': -88, ',': -88, ']': -88, ')': -88},
+    313: {'}': -138, ',': -138},
+    314: {'}': -132, ',': -132},
+    315: {'}': -89, ',': -89, ']': -89, ')': -89},
+    316: {'}': -83, ',': -83, ']': -83, ')': -83},
+    317: {'}': -140, ',': -140},
+    318: {'}': -134, ',': -134},
+    319: {':': 402},
+    320: {'END': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    321: {'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2, 'WHEN': -2, 'END': -2, 'ELSE': -2},
+    322: {'CASE': -5, 'WHILE': -5, 'FOR': -5, 'IF': -5, 'RETURN': -5, 'DEF': -5, 'LET': -5, '.': -5, '(': -5, '{': -5, '[': -5, 'MODULE': -5, 'NAME': -5, 'STRIP_STRING': -5, 'STRING': -5, 'HEX': -5, 'OCT': -5, 'DEC': -5, 'FLOAT': -5, '$end': -5, 'END': -5, 'ELSE': -5, 'WHEN': -5},
+    323: {'END': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    324: {':': 406},
+    325: {')': -77},
+    326: {')': -78, ',': 247},
+    327: {')': -79, ',': 407},
+    328: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    329: {')': -80, ',': 247},
+    330: {')': -70, ',': 249},
+    331: {'IS': -164, 'IN': -164, '=': -164, ',': -164, '}': -164, ']': -164, ':': -164, ')': -164},
+    332: {'NAME': 410, 'END': 411, 'MAP_UNPACK': 272},
+    333: {'NAME': 235, 'END': 237, 'MAP_UNPACK': 149},
+    334: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    335: {'(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    336: {'(': 67, '.': 21, '{': 73, '[': 74, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    337: {'IS': -165, 'IN': -165, '=': -165, ',': -165, '}': -165, ']': -165, ':': -165, ')': -165},
+    338: {'*': 328, 'NAME': 422, 'END': 411, 'MAP_UNPACK': 272},
+    339: {'IS': -166, 'IN': -166, '=': -166, ',': -166, '}': -166, ']': -166, ':': -166, ')': -166},
+    340: {'NAME': 425, 'END': 411, '*': 328, 'MAP_UNPACK': 272, '(': 67, '{': 73, '[': 74, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    341: {'*': 135, 'NAME': 428, 'END': 237, 'MAP_UNPACK': 149},
+    342: {'NAME': 243, 'END': 237, '*': 135, 'MAP_UNPACK': 149, '(': 67, '.': 21, '{': 73, '[': 74, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    343: {'}': -142, ',': -142},
+    344: {'}': -143, ',': -143},
+    345: {':': 431},
+    346: {'}': -93, ',': -93, ']': -93, ')': -93},
+    347: {'}': -94, ',': -94, ']': -94, ')': -94},
+    348: {'}': -144, ',': -144},
+    349: {'}': -95, ',': -95, ']': -95, ')': -95},
+    350: {'=': 432, '}': -140, ',': -140},
+    351: {'=': 433, '}': -134, ',': -134},
+    352: {'}': -148, ',': -148, 'IS': 129},
+    353: {'=': -29, '}': -29, ',': -29, ')': -29, ':': -29, ']': -29, 'IS': 130},
+    354: {'.': 82, '{': 434, '(': 435, 'ATTRIBUTE': 85, '[': 86},
+    355: {')': -244, '*': 437, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    356: {'/': 105, '}': -244, 'MAP_UNPACK': 441, '*': 437, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    357: {']': -244, '*': 437, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    358: {'CASE': -8, 'WHILE': -8, 'FOR': -8, 'IF': -8, 'RETURN': -8, 'DEF': -8, 'LET': -8, '.': -8, '(': -8, '{': -8, '[': -8, 'MODULE': -8, 'NAME': -8, 'STRIP_STRING': -8, 'STRING': -8, 'HEX': -8, 'OCT': -8, 'DEC': -8, 'FLOAT': -8, '$end': -8, 'END': -8, 'ELSE': -8, 'WHEN': -8},
+    359: {'CASE': -17, 'WHILE': -17, 'FOR': -17, 'IF': -17, 'RETURN': -17, 'DEF': -17, 'LET': -17, '.': -17, '(': -17, '{': -17, '[': -17, 'MODULE': -17, 'NAME': -17, 'STRIP_STRING': -17, 'STRING': -17, 'HEX': -17, 'OCT': -17, 'DEC': -17, 'FLOAT': -17, '$end': -17, 'END': -17, 'ELSE': -17, 'WHEN': -17},
+    360: {':': 443, 'IF': 444},
+    361: {'END': 445, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    362: {':': -217},
+    363: {'NAME': 262, '*': 264, 'END': 266, ')': -231, 'MAP_UNPACK': 272},
+    364: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    365: {'*': 264, ')': -231, 'NAME': 262, 'END': 266, 'MAP_UNPACK': 272},
+    366: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    367: {')': -231, 'NAME': 262, 'MAP_UNPACK': 272, 'END': 266},
+    368: {')': -231, 'NAME': 262, 'MAP_UNPACK': 272, 'END': 266},
+    369: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    370: {';': -45, 'WHEN': -45, ':': -45, ',': -45, ')': -45, '}': -45, ']': -45, '=': -45, '{': 83, '(': 84, 'ATTRIBUTE': 85, '[': 86},
+    371: {'}': -204, ',': -204},
+    372: {'}': -205, ',': -205},
+    373: {'}': -206, ',': -206},
+    374: {'}': -202, ',': -202},
+    375: {'}': -192, ',': -192, ')': -192},
+    376: {'}': -189, ',': -189, ')': -189},
+    377: {'}': -191, ',': -191, ')': -191},
+    378: {'}': -188, ',': -188, ')': -188},
+    379: {')': -174, ',': -174},
+    380: {')': -175, ',': -175},
+    381: {')': -177, ',': -177},
+    382: {')': -178, ',': -178},
+    383: {':': 279},
+    384: {')': 458, ',': 282},
+    385: {')': 459, ',': 286},
+    386: {')': -176, ',': -176},
+    387: {')': -179, ',': -179},
+    388: {')': -171, ',': -171},
+    389: {')': -172, ',': -172},
+    390: {')': 460, ',': 282},
+    391: {')': 461, ',': 286},
+    392: {')': -244, '*': 293, '(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    393: {'}': 277, ',': 463},
+    394: {'}': -212, ',': -212, ':': 464},
+    395: {':': 465},
+    396: {')': 285, ',': 466},
+    397: {')': 288, ',': 467},
+    398: {':': 464, 'IS': -110, ')': -110, ',': -110, '.': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110, 'MODULE': 123},
+    399: {'MAP_UNPACK': 300, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    400: {'*': 293, '(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    401: {'(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    402: {'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2, 'WHEN': -2, 'END': -2, 'ELSE': -2},
+    403: {'END': 469, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    404: {'WHEN': -13, 'END': -13, 'ELSE': -13, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    405: {'END': 470, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    406: {'END': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    407: {'*': 328, '(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    408: {'}': -208, ',': -208},
+    409: {'}': -209, ',': -209},
+    410: {'}': -212, ',': -212, '=': 334, ':': 472},
+    411: {':': 473},
+    412: {'}': -210, ',': -210},
+    413: {'}': -194, ',': -194, ')': -194},
+    414: {'=': 474, '}': -200, ',': -200, ')': -200, 'IS': 129},
+    415: {'=': 475, '}': -189, ',': -189, ')': -189},
+    416: {'=': 476, '}': -199, ',': -199, ')': -199, 'IS': 129},
+    417: {'=': 477, '}': -188, ',': -188, ')': -188},
+    418: {')': -181, ',': -181},
+    419: {')': -182, ',': -182},
+    420: {')': -184, ',': -184},
+    421: {')': -185, ',': -185},
+    422: {'=': 334, ':': 472},
+    423: {')': 478, ',': 338},
+    424: {')': 480, ',': 479},
+    425: {'=': 334, ':': 472, 'IS': -110, ')': -110, ',': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110, 'MODULE': 123},
+    426: {')': -183, ',': -183},
+    427: {')': -186, ',': -186},
+    428: {'=': 334, ':': 335},
+    429: {')': 481, ',': 338},
+    430: {')': 461, ',': 341},
+    431: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    432: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    433: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    434: {'}': -244, 'NAME': 486, 'END': 487, 'MAP_UNPACK': 441},
+    435: {')': -244, 'END': 487, 'NAME': 490, 'MAP_UNPACK': 441, '*': 437, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    436: {',': 491, ')': -26},
+    437: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    438: {'}': 203, ',': 492},
+    439: {'}': 206, ',': 493},
+    440: {':': 494},
+    441: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    442: {']': 214, ',': 493},
+    443: {'END': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    444: {'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    445: {'CASE': -216, 'WHILE': -216, 'FOR': -216, 'IF': -216, 'RETURN': -216, 'DEF': -216, 'LET': -216, '.': -216, '(': -216, '{': -216, '[': -216, 'MODULE': -216, 'NAME': -216, 'STRIP_STRING': -216, 'STRING': -216, 'HEX': -216, 'OCT': -216, 'DEC': -216, 'FLOAT': -216, '$end': -216, 'END': -216, 'ELSE': -216, 'WHEN': -216},
+    446: {')': -220},
+    447: {',': -235, ')': -235},
+    448: {')': -223},
+    449: {'=': 364},
+    450: {',': -239, '=': -239, ')': -239},
+    451: {')': -225},
+    452: {')': -228},
+    453: {')': -229, ',': 497},
+    454: {',': -233, ')': -233, '=': 364},
+    455: {',': -234, ')': -234},
+    456: {')': -227},
+    457: {',': -238, '=': -238, ')': -238},
+    458: {'.': -161, '{': -161, '(': -161, 'ATTRIBUTE': -161, '[': -161, ';': -161, 'WHEN': -161, ':': -161, ',': -161, ')': -161, '}': -161, ']': -161, '=': -161},
+    459: {'.': -162, '{': -162, '(': -162, 'ATTRIBUTE': -162, '[': -162, ';': -162, 'WHEN': -162, ':': -162, ',': -162, ')': -162, '}': -162, ']': -162, '=': -162},
+    460: {'.': -163, '{': -163, '(': -163, 'ATTRIBUTE': -163, '[': -163, ';': -163, 'WHEN': -163, ':': -163, ',': -163, ')': -163, '}': -163, ']': -163, '=': -163},
+    461: {'IS': -157, '.': -157, '{': -157, '(': -157, 'ATTRIBUTE': -157, '[': -157, ';': -157, 'WHEN': -157, ':': -157, 'IN': -157, '=': -157, ',': -157, ')': -157, '}': -157, ']': -157},
+    462: {')': -70, ',': 400},
+    463: {'NAME': 394, 'END': 395, 'MAP_UNPACK': 300},
+    464: {'(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    465: {'(': 185, '.': 21, '{': 187, '[': 188, 'NAME': 75, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    466: {'*': 293, 'END': 395, 'NAME': 498, 'MAP_UNPACK': 300},
+    467: {'END': 395, 'NAME': 398, '*': 293, 'MAP_UNPACK': 300, '(': 185, '.': 21, '{': 187, '[': 188, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    468: {'WHEN': -14, 'END': -14, 'ELSE': -14, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    469: {'CASE': -16, 'WHILE': -16, 'FOR': -16, 'IF': -16, 'RETURN': -16, 'DEF': -16, 'LET': -16, '.': -16, '(': -16, '{': -16, '[': -16, 'MODULE': -16, 'NAME': -16, 'STRIP_STRING': -16, 'STRING': -16, 'HEX': -16, 'OCT': -16, 'DEC': -16, 'FLOAT': -16, '$end': -16, 'END': -16, 'ELSE': -16, 'WHEN': -16},
+    470: {'CASE': -6, 'WHILE': -6, 'FOR': -6, 'IF': -6, 'RETURN': -6, 'DEF': -6, 'LET': -6, '.': -6, '(': -6, '{': -6, '[': -6, 'MODULE': -6, 'NAME': -6, 'STRIP_STRING': -6, 'STRING': -6, 'HEX': -6, 'OCT': -6, 'DEC': -6, 'FLOAT': -6, '$end': -6, 'END': -6, 'ELSE': -6, 'WHEN': -6},
+    471: {'END': 500, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    472: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    473: {'(': 67, '{': 73, '[': 74, 'NAME': 75, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49, 'MODULE': 40},
+    474: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    475: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    476: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    477: {'.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    478: {'IS': -167, 'IN': -167, '=': -167, ',': -167, '}': -167, ']': -167, ':': -167, ')': -167},
+    479: {'*': 328, 'NAME': 422, 'END': 411, 'MAP_UNPACK': 272},
+    480: {'IS': -168, 'IN': -168, '=': -168, ',': -168, '}': -168, ']': -168, ':': -168, ')': -168},
+    481: {'IS': -169, 'IN': -169, '=': -169, ',': -169, '}': -169, ']': -169, ':': -169, ')': -169},
+    482: {'=': 432},
+    483: {'}': -146, ',': -146},
+    484: {'}': -147, ',': -147},
+    485: {'}': 277, ',': 505},
+    486: {'}': -212, ',': -212, ':': 506, '=': 334},
+    487: {':': 507},
+    488: {')': 285, ',': 508},
+    489: {',': 509, ')': 288},
+    490: {':': 506, '=': 334, 'MODULE': 123, 'IS': -110, ',': -110, ')': -110, '.': -110, '{': -110, '(': -110, 'ATTRIBUTE': -110, '[': -110},
+    491: {')': -244, '*': 437, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    492: {'MAP_UNPACK': 441, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    493: {'*': 437, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    494: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    495: {'END': 513, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    496: {':': 514},
+    497: {')': -231, 'NAME': 262, 'MAP_UNPACK': 272, 'END': 266},
+    498: {':': 464},
+    499: {')': 461, ',': 466},
+    500: {'CASE': -7, 'WHILE': -7, 'FOR': -7, 'IF': -7, 'RETURN': -7, 'DEF': -7, 'LET': -7, '.': -7, '(': -7, '{': -7, '[': -7, 'MODULE': -7, 'NAME': -7, 'STRIP_STRING': -7, 'STRING': -7, 'HEX': -7, 'OCT': -7, 'DEC': -7, 'FLOAT': -7, '$end': -7, 'END': -7, 'ELSE': -7, 'WHEN': -7},
+    501: {'}': -196, ',': -196, ')': -196},
+    502: {'}': -198, ',': -198, ')': -198},
+    503: {'}': -195, ',': -195, ')': -195},
+    504: {'}': -197, ',': -197, ')': -197},
+    505: {'NAME': 486, 'END': 487, 'MAP_UNPACK': 441},
+    506: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    507: {'.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    508: {'*': 437, 'END': 487, 'NAME': 518, 'MAP_UNPACK': 441},
+    509: {'END': 487, 'NAME': 490, '*': 437, 'MAP_UNPACK': 441, '.': 21, '(': 355, '{': 356, '[': 357, 'MODULE': 40, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    510: {')': -70, ',': 493},
+    511: {'}': -140, ',': -140, '=': 432},
+    512: {'}': -134, ',': -134, '=': 433},
+    513: {'CASE': -18, 'WHILE': -18, 'FOR': -18, 'IF': -18, 'RETURN': -18, 'DEF': -18, 'LET': -18, '.': -18, '(': -18, '{': -18, '[': -18, 'MODULE': -18, 'NAME': -18, 'STRIP_STRING': -18, 'STRING': -18, 'HEX': -18, 'OCT': -18, 'DEC': -18, 'FLOAT': -18, '$end': -18, 'END': -18, 'ELSE': -18, 'WHEN': -18},
+    514: {'END': -2, 'ELSE': -2, 'CASE': -2, 'WHILE': -2, 'FOR': -2, 'IF': -2, 'RETURN': -2, 'DEF': -2, 'LET': -2, '.': -2, '(': -2, '{': -2, '[': -2, 'MODULE': -2, 'NAME': -2, 'STRIP_STRING': -2, 'STRING': -2, 'HEX': -2, 'OCT': -2, 'DEC': -2, 'FLOAT': -2},
+    515: {')': -230},
+    516: {'}': -189, ',': -189, ')': -189, '=': 475},
+    517: {'}': -188, ',': -188, ')': -188, '=': 477},
+    518: {':': 506, '=': 334},
+    519: {')': 461, ',': 508},
+    520: {'END': 359, 'ELSE': 360, 'CASE': 4, 'WHILE': 5, 'FOR': 7, 'IF': 9, 'RETURN': 10, 'DEF': 12, 'LET': 8, '.': 21, '(': 22, '{': 37, '[': 38, 'MODULE': 40, 'NAME': 39, 'STRIP_STRING': 44, 'STRING': 45, 'HEX': 46, 'OCT': 47, 'DEC': 48, 'FLOAT': 49},
+    521: {'CASE': -19, 'WHILE': -19, 'FOR': -19, 'IF': -19, 'RETURN': -19, 'DEF': -19, 'LET': -19, '.': -19, '(': -19, '{': -19, '[': -19, 'MODULE': -19, 'NAME': -19, 'STRIP_STRING': -19, 'STRING': -19, 'HEX': -19, 'OCT': -19, 'DEC': -19, 'FLOAT': -19, '$end': -19, 'END': -19, 'ELSE': -19, 'WHEN': -19},
+}
+_lr_goto = {
+    0: {'file': 1, 'block': 2},
+    1: {},
+    2: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    3: {},
+    4: {'exp': 50, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    5: {'condition': 59, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    6: {},
+    7: {'pat': 61, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    8: {'pat': 76, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    9: {'condition': 77, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    10: {'exp': 79, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    11: {},
+    12: {'name': 80},
+    13: {},
+    14: {},
+    15: {},
+    16: {},
+    17: {},
+    18: {},
+    19: {},
+    20: {},
+    21: {'prefixexp': 88, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 89, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    22: {'tuple_exp_not_pat': 90, 'tuple_exp_and_pat': 91, 'empty': 92, 'exp': 93, 'exp_not_pat': 94, 'exp_and_pat': 95, 'tuple_unpack_exp_not_pat': 96, 'tuple_unpack_exp_and_pat': 97, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    23: {},
+    24: {},
+    25: {},
+    26: {},
+    27: {},
+    28: {},
+    29: {},
+    30: {},
+    31: {},
+    32: {},
+    33: {},
+    34: {},
+    35: {},
+    36: {},
+    37: {'dict_fields_exp_not_pat': 100, 'tuple_args_exp_not_pat': 101, 'dict_fields_exp_and_pat': 102, 'empty': 103, 'tuple_args_exp_and_pat': 104, 'dict_field_exp_not_pat': 106, 'dict_field_exp_and_pat': 107, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'map_unpack_exp_not_pat': 110, 'exp': 111, 'exp_not_pat': 112, 'tuple_unpack_exp_not_pat': 113, 'map_unpack_exp_and_pat': 114, 'exp_and_pat': 115, 'tuple_unpack_exp_and_pat': 116, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    38: {'tuple_args_exp_not_pat': 118, 'empty': 119, 'tuple_args_exp_and_pat': 120, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    39: {},
+    40: {},
+    41: {},
+    42: {},
+    43: {},
+    44: {},
+    45: {},
+    46: {},
+    47: {},
+    48: {},
+    49: {},
+    50: {'whens': 124},
+    51: {},
+    52: {},
+    53: {},
+    54: {},
+    55: {},
+    56: {},
+    57: {},
+    58: {},
+    59: {},
+    60: {},
+    61: {},
+    62: {'pat': 128, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    63: {},
+    64: {},
+    65: {},
+    66: {},
+    67: {'tuple_pat_not_exp': 131, 'tuple_exp_and_pat': 91, 'empty': 92, 'tuple_exp_not_pat': 90, 'exp': 93, 'pat_not_exp': 132, 'exp_and_pat': 133, 'tuple_unpack_pat_not_exp': 134, 'tuple_unpack_exp_and_pat': 97, 'exp_not_pat': 94, 'tuple_unpack_exp_not_pat': 96, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    68: {},
+    69: {},
+    70: {},
+    71: {},
+    72: {},
+    73: {'dict_fields_pat_not_exp': 139, 'tuple_args_pat_not_exp': 140, 'dict_fields_exp_and_pat': 141, 'empty': 103, 'tuple_args_exp_and_pat': 142, 'dict_fields_exp_not_pat': 100, 'tuple_args_exp_not_pat': 101, 'dict_field_pat_not_exp': 143, 'dict_field_exp_and_pat': 107, 'tuple_arg_pat_not_exp': 144, 'tuple_arg_exp_and_pat': 109, 'dict_field_exp_not_pat': 106, 'tuple_arg_exp_not_pat': 108, 'map_unpack_pat_not_exp': 145, 'exp': 146, 'exp_not_pat': 112, 'exp_and_pat': 115, 'pat_not_exp': 147, 'tuple_unpack_pat_not_exp': 148, 'map_unpack_exp_and_pat': 114, 'tuple_unpack_exp_and_pat': 116, 'map_unpack_exp_not_pat': 110, 'tuple_unpack_exp_not_pat': 113, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    74: {'tuple_args_pat_not_exp': 150, 'empty': 119, 'tuple_args_exp_and_pat': 151, 'tuple_args_exp_not_pat': 118, 'tuple_arg_pat_not_exp': 144, 'tuple_arg_exp_and_pat': 109, 'tuple_arg_exp_not_pat': 108, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    75: {},
+    76: {},
+    77: {},
+    78: {},
+    79: {},
+    80: {'arguments': 155},
+    81: {},
+    82: {'prefixexp': 157, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 89, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    83: {'name_keywords_exp_not_pat': 158, 'empty': 159, 'name_keywords_exp_and_pat': 160, 'name_keyword_exp_not_pat': 161, 'name_keyword_exp_and_pat': 162, 'keyword_exp_not_pat': 163, 'keyword_exp_and_pat': 164, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168},
+    84: {'prefixexp': 58, 'keywords_exp_not_pat': 169, 'tuple_args_exp_not_pat': 170, 'keywords_exp_and_pat': 171, 'tuple_args_exp_and_pat': 172, 'empty': 173, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'map_unpack_exp_not_pat': 166, 'exp_not_pat': 121, 'exp_and_pat': 122, 'map_unpack_exp_and_pat': 168, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    85: {},
+    86: {'prefixexp': 58, 'exp': 178, 'tuple_exp': 179, 'exp_not_pat': 180, 'exp_and_pat': 181, 'tuple_exp_not_pat': 182, 'tuple_exp_and_pat': 183, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'tuple_unpack_exp_not_pat': 96, 'tuple_unpack_exp_and_pat': 97, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    87: {'prefixexp_exp_and_pat': 184, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 186, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    88: {},
+    89: {},
+    90: {},
+    91: {},
+    92: {},
+    93: {},
+    94: {},
+    95: {},
+    96: {},
+    97: {},
+    98: {'exp_not_pat': 196, 'exp_and_pat': 197, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    99: {},
+    100: {},
+    101: {},
+    102: {},
+    103: {},
+    104: {},
+    105: {},
+    106: {},
+    107: {},
+    108: {},
+    109: {},
+    110: {},
+    111: {},
+    112: {},
+    113: {},
+    114: {},
+    115: {},
+    116: {},
+    117: {'exp_not_pat': 210, 'exp_and_pat': 211, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    118: {},
+    119: {},
+    120: {},
+    121: {},
+    122: {},
+    123: {},
+    124: {'caseend': 215},
+    125: {'pat': 219, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    126: {'block': 220},
+    127: {'exp': 221, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    128: {},
+    129: {'is_pat_not_exp': 223, 'prefixexp_exp_and_pat': 224, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    130: {'is_pat_not_exp': 225, 'prefixexp_exp_and_pat': 226, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    131: {},
+    132: {},
+    133: {},
+    134: {},
+    135: {'pat_not_exp': 230, 'exp_and_pat': 197, 'exp_not_pat': 196, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    136: {},
+    137: {'name_keywords_pat_not_exp': 231, 'empty': 159, 'name_keywords_exp_and_pat': 232, 'name_keywords_exp_not_pat': 158, 'name_keyword_pat_not_exp': 233, 'name_keyword_exp_and_pat': 162, 'name_keyword_exp_not_pat': 161, 'keyword_pat_not_exp': 234, 'keyword_exp_and_pat': 164, 'keyword_exp_not_pat': 163, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166},
+    138: {'prefixexp': 136, 'keywords_pat_not_exp': 238, 'tuple_args_pat_not_exp': 239, 'keywords_exp_and_pat': 240, 'tuple_args_exp_and_pat': 241, 'empty': 173, 'keywords_exp_not_pat': 169, 'tuple_args_exp_not_pat': 170, 'keyword_pat_not_exp': 242, 'tuple_unpack_pat_not_exp': 148, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'tuple_arg_pat_not_exp': 144, 'tuple_arg_exp_and_pat': 109, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_arg_exp_not_pat': 108, 'map_unpack_pat_not_exp': 236, 'pat_not_exp': 147, 'exp_and_pat': 122, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166, 'exp_not_pat': 121, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    139: {},
+    140: {},
+    141: {},
+    142: {},
+    143: {},
+    144: {},
+    145: {},
+    146: {},
+    147: {},
+    148: {},
+    149: {'pat_not_exp': 251, 'exp_and_pat': 211, 'exp_not_pat': 210, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    150: {},
+    151: {},
+    152: {'exp': 253, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    153: {'block': 254},
+    154: {},
+    155: {},
+    156: {'arguments_pat': 256, 'arguments_pat_args': 257, 'name_keyword_pat': 258, 'arguments_pat_vararg': 259, 'default_pat': 260, 'keyword_pat': 261, 'arguments_pat_kwarg': 263, 'tuple_unpack_pat': 265, 'map_unpack_pat': 267, 'tuple_unpack_pat_not_exp': 268, 'tuple_unpack_exp_and_pat': 269, 'map_unpack_pat_not_exp': 270, 'map_unpack_exp_and_pat': 271},
+    157: {},
+    158: {},
+    159: {},
+    160: {},
+    161: {},
+    162: {},
+    163: {},
+    164: {},
+    165: {},
+    166: {},
+    167: {},
+    168: {},
+    169: {},
+    170: {},
+    171: {},
+    172: {},
+    173: {},
+    174: {},
+    175: {},
+    176: {},
+    177: {},
+    178: {},
+    179: {},
+    180: {},
+    181: {},
+    182: {},
+    183: {},
+    184: {},
+    185: {'tuple_exp_and_pat': 91, 'empty': 92, 'tuple_exp_not_pat': 90, 'exp': 93, 'exp_and_pat': 292, 'tuple_unpack_exp_and_pat': 97, 'exp_not_pat': 94, 'tuple_unpack_exp_not_pat': 96, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    186: {},
+    187: {'dict_fields_exp_and_pat': 297, 'empty': 103, 'tuple_args_exp_and_pat': 298, 'dict_fields_exp_not_pat': 100, 'tuple_args_exp_not_pat': 101, 'dict_field_exp_and_pat': 107, 'tuple_arg_exp_and_pat': 109, 'dict_field_exp_not_pat': 106, 'tuple_arg_exp_not_pat': 108, 'map_unpack_exp_and_pat': 114, 'exp': 299, 'exp_and_pat': 115, 'tuple_unpack_exp_and_pat': 116, 'map_unpack_exp_not_pat': 110, 'exp_not_pat': 112, 'tuple_unpack_exp_not_pat': 113, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    188: {'empty': 119, 'tuple_args_exp_and_pat': 301, 'tuple_args_exp_not_pat': 118, 'tuple_arg_exp_and_pat': 109, 'tuple_arg_exp_not_pat': 108, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    189: {'prefixexp': 302, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 89, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    190: {},
+    191: {},
+    192: {},
+    193: {},
+    194: {'exp_not_pat': 121, 'empty': 303, 'tuple_args_exp_not_pat': 304, 'tuple_args_exp_and_pat': 305, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'tuple_unpack_exp_not_pat': 113, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    195: {'exp_and_pat': 122, 'tuple_args_exp_not_pat': 306, 'empty': 307, 'tuple_args_exp_and_pat': 308, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    196: {},
+    197: {},
+    198: {},
+    199: {},
+    200: {'dict_field_exp_not_pat': 309, 'dict_field_exp_and_pat': 310, 'map_unpack_exp_not_pat': 110, 'exp': 111, 'exp_not_pat': 51, 'map_unpack_exp_and_pat': 114, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    201: {},
+    202: {'tuple_arg_exp_not_pat': 311, 'tuple_arg_exp_and_pat': 312, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    203: {},
+    204: {'dict_field_exp_not_pat': 313, 'dict_field_exp_and_pat': 314, 'map_unpack_exp_not_pat': 110, 'exp': 111, 'exp_not_pat': 51, 'map_unpack_exp_and_pat': 114, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    205: {},
+    206: {},
+    207: {'tuple_arg_exp_not_pat': 315, 'tuple_arg_exp_and_pat': 316, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    208: {},
+    209: {'exp_not_pat': 317, 'exp_and_pat': 318, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    210: {},
+    211: {},
+    212: {},
+    213: {},
+    214: {},
+    215: {},
+    216: {'pat': 319, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    217: {},
+    218: {},
+    219: {},
+    220: {'condition': 6, 'stat': 3, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    221: {},
+    222: {'exp': 324, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    223: {},
+    224: {},
+    225: {},
+    226: {},
+    227: {},
+    228: {'pat_not_exp': 147, 'empty': 325, 'tuple_args_pat_not_exp': 326, 'tuple_args_exp_and_pat': 327, 'tuple_arg_pat_not_exp': 144, 'tuple_arg_exp_and_pat': 109, 'tuple_unpack_pat_not_exp': 148, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    229: {'exp_and_pat': 122, 'tuple_args_pat_not_exp': 329, 'empty': 307, 'tuple_args_exp_and_pat': 330, 'tuple_args_exp_not_pat': 306, 'tuple_arg_pat_not_exp': 144, 'tuple_arg_exp_and_pat': 109, 'tuple_arg_exp_not_pat': 108, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'tuple_unpack_exp_and_pat': 116, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    230: {},
+    231: {},
+    232: {},
+    233: {},
+    234: {},
+    235: {},
+    236: {},
+    237: {},
+    238: {},
+    239: {},
+    240: {},
+    241: {},
+    242: {},
+    243: {},
+    244: {},
+    245: {'dict_field_pat_not_exp': 343, 'dict_field_exp_and_pat': 344, 'map_unpack_pat_not_exp': 145, 'exp': 345, 'exp_not_pat': 51, 'exp_and_pat': 52, 'map_unpack_exp_and_pat': 114, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    246: {},
+    247: {'tuple_arg_pat_not_exp': 346, 'tuple_arg_exp_and_pat': 347, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    248: {'dict_field_pat_not_exp': 348, 'dict_field_exp_and_pat': 314, 'dict_field_exp_not_pat': 313, 'map_unpack_pat_not_exp': 145, 'exp': 146, 'exp_not_pat': 51, 'exp_and_pat': 52, 'map_unpack_exp_and_pat': 114, 'map_unpack_exp_not_pat': 110, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    249: {'tuple_arg_pat_not_exp': 349, 'tuple_arg_exp_and_pat': 316, 'tuple_arg_exp_not_pat': 315, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    250: {'exp_not_pat': 350, 'exp_and_pat': 351, 'pat_not_exp': 352, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    251: {},
+    252: {},
+    253: {},
+    254: {'condition': 6, 'ifstat': 358, 'stat': 3, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    255: {'block': 361},
+    256: {},
+    257: {},
+    258: {},
+    259: {},
+    260: {},
+    261: {},
+    262: {},
+    263: {},
+    264: {'pat_not_exp': 230, 'exp_and_pat': 197, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    265: {},
+    266: {},
+    267: {},
+    268: {},
+    269: {},
+    270: {},
+    271: {},
+    272: {'pat_not_exp': 251, 'exp_and_pat': 211, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    273: {'prefixexp': 370, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 89, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    274: {},
+    275: {'name_keyword_exp_not_pat': 371, 'name_keyword_exp_and_pat': 372, 'keyword_exp_not_pat': 163, 'keyword_exp_and_pat': 164, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168},
+    276: {},
+    277: {},
+    278: {'name_keyword_exp_not_pat': 373, 'name_keyword_exp_and_pat': 374, 'keyword_exp_not_pat': 163, 'keyword_exp_and_pat': 164, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168},
+    279: {'exp_not_pat': 375, 'exp_and_pat': 376, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    280: {'exp_not_pat': 377, 'exp_and_pat': 378, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    281: {},
+    282: {'tuple_unpack_exp_not_pat': 379, 'tuple_unpack_exp_and_pat': 380, 'keyword_exp_not_pat': 381, 'keyword_exp_and_pat': 382, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168},
+    283: {},
+    284: {'prefixexp': 58, 'keywords_exp_not_pat': 384, 'keywords_exp_and_pat': 385, 'tuple_arg_exp_not_pat': 311, 'tuple_arg_exp_and_pat': 312, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'exp_not_pat': 121, 'exp_and_pat': 122, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    285: {},
+    286: {'tuple_unpack_exp_not_pat': 386, 'keyword_exp_not_pat': 387, 'tuple_unpack_exp_and_pat': 388, 'keyword_exp_and_pat': 389, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168},
+    287: {'prefixexp': 58, 'keywords_exp_not_pat': 390, 'keywords_exp_and_pat': 391, 'tuple_arg_exp_not_pat': 315, 'tuple_arg_exp_and_pat': 316, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'exp_not_pat': 121, 'exp_and_pat': 122, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    288: {},
+    289: {},
+    290: {},
+    291: {},
+    292: {},
+    293: {'exp_and_pat': 197, 'exp_not_pat': 196, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    294: {},
+    295: {'empty': 159, 'name_keywords_exp_and_pat': 393, 'name_keywords_exp_not_pat': 158, 'name_keyword_exp_and_pat': 162, 'name_keyword_exp_not_pat': 161, 'keyword_exp_and_pat': 164, 'keyword_exp_not_pat': 163, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166},
+    296: {'prefixexp': 294, 'keywords_exp_and_pat': 396, 'empty': 173, 'tuple_args_exp_and_pat': 397, 'keywords_exp_not_pat': 169, 'tuple_args_exp_not_pat': 170, 'keyword_exp_and_pat': 175, 'tuple_unpack_exp_and_pat': 116, 'tuple_arg_exp_and_pat': 109, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_arg_exp_not_pat': 108, 'map_unpack_exp_and_pat': 168, 'exp_and_pat': 122, 'map_unpack_exp_not_pat': 166, 'exp_not_pat': 121, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    297: {},
+    298: {},
+    299: {},
+    300: {'exp_and_pat': 211, 'exp_not_pat': 210, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    301: {},
+    302: {},
+    303: {},
+    304: {},
+    305: {},
+    306: {},
+    307: {},
+    308: {},
+    309: {},
+    310: {},
+    311: {},
+    312: {},
+    313: {},
+    314: {},
+    315: {},
+    316: {},
+    317: {},
+    318: {},
+    319: {},
+    320: {'block': 403},
+    321: {'block': 404},
+    322: {},
+    323: {'block': 405},
+    324: {},
+    325: {},
+    326: {},
+    327: {},
+    328: {'pat_not_exp': 230, 'exp_and_pat': 197, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    329: {},
+    330: {},
+    331: {},
+    332: {'name_keyword_pat_not_exp': 408, 'name_keyword_exp_and_pat': 409, 'keyword_pat_not_exp': 234, 'keyword_exp_and_pat': 164, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168},
+    333: {'name_keyword_pat_not_exp': 412, 'name_keyword_exp_and_pat': 374, 'name_keyword_exp_not_pat': 373, 'keyword_pat_not_exp': 234, 'keyword_exp_and_pat': 164, 'keyword_exp_not_pat': 163, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166},
+    334: {'exp': 413, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    335: {'pat_not_exp': 414, 'exp_and_pat': 415, 'exp_not_pat': 375, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    336: {'pat_not_exp': 416, 'exp_and_pat': 417, 'exp_not_pat': 377, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 136, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    337: {},
+    338: {'tuple_unpack_pat_not_exp': 418, 'tuple_unpack_exp_and_pat': 419, 'keyword_pat_not_exp': 420, 'keyword_exp_and_pat': 421, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168},
+    339: {},
+    340: {'prefixexp': 72, 'keywords_pat_not_exp': 423, 'keywords_exp_and_pat': 424, 'tuple_arg_pat_not_exp': 346, 'tuple_arg_exp_and_pat': 347, 'keyword_pat_not_exp': 242, 'tuple_unpack_pat_not_exp': 148, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'pat_not_exp': 147, 'exp_and_pat': 122, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    341: {'tuple_unpack_pat_not_exp': 426, 'keyword_pat_not_exp': 427, 'tuple_unpack_exp_and_pat': 388, 'keyword_exp_and_pat': 389, 'tuple_unpack_exp_not_pat': 386, 'keyword_exp_not_pat': 387, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166},
+    342: {'prefixexp': 136, 'keywords_pat_not_exp': 429, 'keywords_exp_and_pat': 430, 'keywords_exp_not_pat': 390, 'tuple_arg_pat_not_exp': 349, 'tuple_arg_exp_and_pat': 316, 'tuple_arg_exp_not_pat': 315, 'keyword_pat_not_exp': 242, 'tuple_unpack_pat_not_exp': 148, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'pat_not_exp': 147, 'exp_and_pat': 122, 'exp_not_pat': 121, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    343: {},
+    344: {},
+    345: {},
+    346: {},
+    347: {},
+    348: {},
+    349: {},
+    350: {},
+    351: {},
+    352: {},
+    353: {},
+    354: {},
+    355: {'tuple_exp_not_pat': 90, 'tuple_exp_and_pat': 91, 'empty': 92, 'tuple_pat_not_exp': 131, 'exp': 93, 'exp_not_pat': 94, 'exp_and_pat': 436, 'tuple_unpack_exp_not_pat': 96, 'tuple_unpack_exp_and_pat': 97, 'pat_not_exp': 132, 'tuple_unpack_pat_not_exp': 134, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    356: {'dict_fields_exp_not_pat': 100, 'tuple_args_exp_not_pat': 101, 'dict_fields_exp_and_pat': 438, 'empty': 103, 'tuple_args_exp_and_pat': 439, 'dict_fields_pat_not_exp': 139, 'tuple_args_pat_not_exp': 140, 'dict_field_exp_not_pat': 106, 'dict_field_exp_and_pat': 107, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'dict_field_pat_not_exp': 143, 'tuple_arg_pat_not_exp': 144, 'map_unpack_exp_not_pat': 110, 'exp': 440, 'exp_not_pat': 112, 'tuple_unpack_exp_not_pat': 113, 'map_unpack_exp_and_pat': 114, 'exp_and_pat': 115, 'tuple_unpack_exp_and_pat': 116, 'map_unpack_pat_not_exp': 145, 'pat_not_exp': 147, 'tuple_unpack_pat_not_exp': 148, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    357: {'tuple_args_exp_not_pat': 118, 'empty': 119, 'tuple_args_exp_and_pat': 442, 'tuple_args_pat_not_exp': 150, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'tuple_arg_pat_not_exp': 144, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    358: {},
+    359: {},
+    360: {},
+    361: {'name': 13, 'stat': 3, 'condition': 6, 'function': 11, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    362: {},
+    363: {'name_keyword_pat': 258, 'arguments_pat': 446, 'arguments_pat_args': 257, 'arguments_pat_vararg': 259, 'default_pat': 260, 'keyword_pat': 261, 'arguments_pat_kwarg': 263, 'tuple_unpack_pat': 265, 'map_unpack_pat': 267, 'tuple_unpack_pat_not_exp': 268, 'tuple_unpack_exp_and_pat': 269, 'map_unpack_pat_not_exp': 270, 'map_unpack_exp_and_pat': 271},
+    364: {'exp': 447, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    365: {'default_pat': 260, 'arguments_pat_args': 448, 'arguments_pat_vararg': 259, 'arguments_pat_kwarg': 263, 'tuple_unpack_pat': 265, 'name_keyword_pat': 449, 'map_unpack_pat': 267, 'tuple_unpack_pat_not_exp': 268, 'tuple_unpack_exp_and_pat': 269, 'keyword_pat': 261, 'map_unpack_pat_not_exp': 270, 'map_unpack_exp_and_pat': 271},
+    366: {'pat': 450, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    367: {'arguments_pat_kwonly': 451, 'arguments_pat_kwarg': 452, 'argument_pat': 453, 'map_unpack_pat': 267, 'name_keyword_pat': 454, 'default_pat': 455, 'map_unpack_pat_not_exp': 270, 'map_unpack_exp_and_pat': 271, 'keyword_pat': 261},
+    368: {'arguments_pat_kwonly': 456, 'arguments_pat_kwarg': 452, 'argument_pat': 453, 'map_unpack_pat': 267, 'name_keyword_pat': 454, 'default_pat': 455, 'map_unpack_pat_not_exp': 270, 'map_unpack_exp_and_pat': 271, 'keyword_pat': 261},
+    369: {'pat': 457, 'pat_not_exp': 63, 'exp_and_pat': 64, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    370: {},
+    371: {},
+    372: {},
+    373: {},
+    374: {},
+    375: {},
+    376: {},
+    377: {},
+    378: {},
+    379: {},
+    380: {},
+    381: {},
+    382: {},
+    383: {},
+    384: {},
+    385: {},
+    386: {},
+    387: {},
+    388: {},
+    389: {},
+    390: {},
+    391: {},
+    392: {'exp_and_pat': 122, 'empty': 307, 'tuple_args_exp_and_pat': 462, 'tuple_args_exp_not_pat': 306, 'tuple_arg_exp_and_pat': 109, 'tuple_arg_exp_not_pat': 108, 'tuple_unpack_exp_and_pat': 116, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    393: {},
+    394: {},
+    395: {},
+    396: {},
+    397: {},
+    398: {},
+    399: {'dict_field_exp_and_pat': 314, 'dict_field_exp_not_pat': 313, 'map_unpack_exp_and_pat': 114, 'exp': 299, 'exp_and_pat': 52, 'map_unpack_exp_not_pat': 110, 'exp_not_pat': 51, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    400: {'tuple_arg_exp_and_pat': 316, 'tuple_arg_exp_not_pat': 315, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    401: {'exp_and_pat': 318, 'exp_not_pat': 317, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    402: {'block': 468},
+    403: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    404: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    405: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    406: {'block': 471},
+    407: {'tuple_arg_pat_not_exp': 349, 'tuple_arg_exp_and_pat': 316, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    408: {},
+    409: {},
+    410: {},
+    411: {},
+    412: {},
+    413: {},
+    414: {},
+    415: {},
+    416: {},
+    417: {},
+    418: {},
+    419: {},
+    420: {},
+    421: {},
+    422: {},
+    423: {},
+    424: {},
+    425: {},
+    426: {},
+    427: {},
+    428: {},
+    429: {},
+    430: {},
+    431: {'exp_not_pat': 482, 'exp_and_pat': 351, 'pat_not_exp': 352, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    432: {'exp': 483, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    433: {'exp': 484, 'exp_and_pat': 52, 'exp_not_pat': 51, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    434: {'name_keywords_exp_not_pat': 158, 'empty': 159, 'name_keywords_exp_and_pat': 485, 'name_keywords_pat_not_exp': 231, 'name_keyword_exp_not_pat': 161, 'name_keyword_exp_and_pat': 162, 'name_keyword_pat_not_exp': 233, 'keyword_exp_not_pat': 163, 'keyword_exp_and_pat': 164, 'keyword_pat_not_exp': 234, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168, 'map_unpack_pat_not_exp': 236},
+    435: {'prefixexp': 354, 'keywords_exp_not_pat': 169, 'tuple_args_exp_not_pat': 170, 'keywords_exp_and_pat': 488, 'tuple_args_exp_and_pat': 489, 'empty': 173, 'keywords_pat_not_exp': 238, 'tuple_args_pat_not_exp': 239, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'keyword_pat_not_exp': 242, 'tuple_unpack_pat_not_exp': 148, 'tuple_arg_pat_not_exp': 144, 'map_unpack_exp_not_pat': 166, 'exp_not_pat': 121, 'exp_and_pat': 122, 'map_unpack_exp_and_pat': 168, 'map_unpack_pat_not_exp': 236, 'pat_not_exp': 147, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    436: {},
+    437: {'exp_not_pat': 196, 'exp_and_pat': 197, 'pat_not_exp': 230, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    438: {},
+    439: {},
+    440: {},
+    441: {'exp_not_pat': 210, 'exp_and_pat': 211, 'pat_not_exp': 251, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    442: {},
+    443: {'block': 495},
+    444: {'condition': 496, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    445: {},
+    446: {},
+    447: {},
+    448: {},
+    449: {},
+    450: {},
+    451: {},
+    452: {},
+    453: {},
+    454: {},
+    455: {},
+    456: {},
+    457: {},
+    458: {},
+    459: {},
+    460: {},
+    461: {},
+    462: {},
+    463: {'name_keyword_exp_and_pat': 374, 'name_keyword_exp_not_pat': 373, 'keyword_exp_and_pat': 164, 'keyword_exp_not_pat': 163, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166},
+    464: {'exp_and_pat': 376, 'exp_not_pat': 375, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    465: {'exp_and_pat': 378, 'exp_not_pat': 377, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 294, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    466: {'tuple_unpack_exp_and_pat': 388, 'keyword_exp_and_pat': 389, 'tuple_unpack_exp_not_pat': 386, 'keyword_exp_not_pat': 387, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166},
+    467: {'prefixexp': 294, 'keywords_exp_and_pat': 499, 'keywords_exp_not_pat': 390, 'tuple_arg_exp_and_pat': 316, 'tuple_arg_exp_not_pat': 315, 'keyword_exp_and_pat': 175, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'exp_and_pat': 122, 'exp_not_pat': 121, 'map_unpack_exp_and_pat': 168, 'map_unpack_exp_not_pat': 166, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'string': 41, 'int': 42, 'float': 43},
+    468: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    469: {},
+    470: {},
+    471: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    472: {'pat_not_exp': 414, 'exp_and_pat': 415, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    473: {'pat_not_exp': 416, 'exp_and_pat': 417, 'is_pat_not_exp': 65, 'prefixexp_exp_and_pat': 57, 'is_exp_and_pat': 66, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'prefixexp': 72, 'string': 41, 'int': 42, 'float': 43, 'prefixexp_exp_not_pat': 19, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31},
+    474: {'exp': 501, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    475: {'exp_and_pat': 52, 'exp': 502, 'exp_not_pat': 51, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    476: {'exp': 503, 'exp_not_pat': 51, 'exp_and_pat': 52, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    477: {'exp_and_pat': 52, 'exp': 504, 'exp_not_pat': 51, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    478: {},
+    479: {'tuple_unpack_pat_not_exp': 426, 'keyword_pat_not_exp': 427, 'tuple_unpack_exp_and_pat': 388, 'keyword_exp_and_pat': 389, 'map_unpack_pat_not_exp': 236, 'map_unpack_exp_and_pat': 168},
+    480: {},
+    481: {},
+    482: {},
+    483: {},
+    484: {},
+    485: {},
+    486: {},
+    487: {},
+    488: {},
+    489: {},
+    490: {},
+    491: {'exp_and_pat': 122, 'tuple_args_exp_not_pat': 306, 'empty': 307, 'tuple_args_exp_and_pat': 510, 'tuple_args_pat_not_exp': 329, 'tuple_arg_exp_not_pat': 108, 'tuple_arg_exp_and_pat': 109, 'tuple_arg_pat_not_exp': 144, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    492: {'dict_field_exp_not_pat': 313, 'dict_field_exp_and_pat': 314, 'dict_field_pat_not_exp': 348, 'map_unpack_exp_not_pat': 110, 'exp': 440, 'exp_not_pat': 51, 'map_unpack_exp_and_pat': 114, 'exp_and_pat': 52, 'map_unpack_pat_not_exp': 145, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 56, 'prefixexp_exp_and_pat': 57, 'prefixexp': 58, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    493: {'tuple_arg_exp_not_pat': 315, 'tuple_arg_exp_and_pat': 316, 'tuple_arg_pat_not_exp': 349, 'tuple_unpack_exp_not_pat': 113, 'exp_not_pat': 121, 'tuple_unpack_exp_and_pat': 116, 'exp_and_pat': 122, 'tuple_unpack_pat_not_exp': 148, 'pat_not_exp': 147, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    494: {'exp_not_pat': 511, 'exp_and_pat': 512, 'pat_not_exp': 352, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    495: {'stat': 3, 'condition': 6, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    496: {},
+    497: {'argument_pat': 453, 'arguments_pat_kwonly': 515, 'arguments_pat_kwarg': 452, 'map_unpack_pat': 267, 'name_keyword_pat': 454, 'default_pat': 455, 'map_unpack_pat_not_exp': 270, 'map_unpack_exp_and_pat': 271, 'keyword_pat': 261},
+    498: {},
+    499: {},
+    500: {},
+    501: {},
+    502: {},
+    503: {},
+    504: {},
+    505: {'name_keyword_exp_not_pat': 373, 'name_keyword_exp_and_pat': 374, 'name_keyword_pat_not_exp': 412, 'keyword_exp_not_pat': 163, 'keyword_exp_and_pat': 164, 'keyword_pat_not_exp': 234, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168, 'map_unpack_pat_not_exp': 236},
+    506: {'exp_not_pat': 375, 'exp_and_pat': 516, 'pat_not_exp': 414, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    507: {'exp_not_pat': 377, 'exp_and_pat': 517, 'pat_not_exp': 416, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'prefixexp': 354, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    508: {'tuple_unpack_exp_not_pat': 386, 'keyword_exp_not_pat': 387, 'tuple_unpack_exp_and_pat': 388, 'keyword_exp_and_pat': 389, 'tuple_unpack_pat_not_exp': 426, 'keyword_pat_not_exp': 427, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168, 'map_unpack_pat_not_exp': 236},
+    509: {'prefixexp': 354, 'keywords_exp_not_pat': 390, 'keywords_exp_and_pat': 519, 'keywords_pat_not_exp': 429, 'tuple_arg_exp_not_pat': 315, 'tuple_arg_exp_and_pat': 316, 'tuple_arg_pat_not_exp': 349, 'keyword_exp_not_pat': 174, 'tuple_unpack_exp_not_pat': 113, 'tuple_unpack_exp_and_pat': 116, 'keyword_exp_and_pat': 175, 'keyword_pat_not_exp': 242, 'tuple_unpack_pat_not_exp': 148, 'exp_not_pat': 121, 'exp_and_pat': 122, 'pat_not_exp': 147, 'map_unpack_exp_not_pat': 166, 'map_unpack_exp_and_pat': 168, 'map_unpack_pat_not_exp': 236, 'unop': 53, 'binop': 54, 'prefixexp_exp_not_pat': 55, 'is_exp_and_pat': 353, 'prefixexp_exp_and_pat': 57, 'is_pat_not_exp': 65, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'name': 13, 'literal': 36, 'call_pat_not_exp': 68, 'dict_pat_not_exp': 69, 'set_pat_not_exp': 70, 'list_pat_not_exp': 71, 'string': 41, 'int': 42, 'float': 43},
+    510: {},
+    511: {},
+    512: {},
+    513: {},
+    514: {'block': 520},
+    515: {},
+    516: {},
+    517: {},
+    518: {},
+    519: {},
+    520: {'condition': 6, 'ifstat': 521, 'stat': 3, 'function': 11, 'name': 13, 'match': 14, 'prefixexp': 15, 'is_exp_and_pat': 16, 'unop': 17, 'binop': 18, 'prefixexp_exp_not_pat': 19, 'prefixexp_exp_and_pat': 20, 'call_exp_not_pat': 23, 'dict_exp_not_pat': 24, 'set_exp_not_pat': 25, 'list_exp_not_pat': 26, 'paren': 27, 'attribute': 28, 'subscript': 29, 'modattr': 30, 'module': 31, 'call_exp_and_pat': 32, 'dict_exp_and_pat': 33, 'set_exp_and_pat': 34, 'list_exp_and_pat': 35, 'literal': 36, 'string': 41, 'int': 42, 'float': 43},
+    521: {},
+}
+_defaulted_states = {
+    81: -110,
+    134: -81,
+    182: -49,
+    183: -50,
+    257: -218,
+    259: -221,
+    263: -224,
+    267: -232,
+    270: -242,
+    271: -243,
+    325: -77,
+    362: -217,
+    446: -220,
+    448: -223,
+    451: -225,
+    452: -228,
+    456: -227,
+    515: -230,
+}
@@ -0,0 +1,165 @@
+from dis import opmap, opname, hasjabs
+from .bytecode import CACHE_ENTRIES, hasjback, hasjump, _no_fallthrough, Instruction, Label
+
+# passes over an assembler's instructions, run before offsets are
+# resolved. each one edits the list in place, and returns whether it
+# changed anything
+
+JUMPS = {opmap[name] for name in ("JUMP_FORWARD", "JUMP_ABSOLUTE", "JUMP_BACKWARD") if name in opmap}
+BRANCHES = JUMPS | {op for name, op in opmap.items() if name.startswith("POP_JUMP_")}
+
+# what the stack shuffles below look for: the shape of an opcode, and the
+# argument it must have if any
+SHAPES = {
+    opmap[name]: (arg, shape)
+    for name, arg, shape in [
+        ("DUP_TOP", None, "dup"), ("COPY", 1, "dup"),
+        ("ROT_TWO", None, "swap"), ("SWAP", 2, "swap"),
+        ("POP_TOP", None, "pop"), ("LOAD_CONST", None, "push")]
+    if name in opmap}
+
+
+def redirected(op, forward):
+    # the opcode jumping like op in the given direction, or None
+    if op in hasjabs or forward != (op in hasjback):
+        return op
+    name = opname[op]
+    if forward:
+        name = name.replace("BACKWARD", "FORWARD")
+    elif "FORWARD" in name:
+        name = name.replace("FORWARD", "BACKWARD")
+    else:
+        # since 3.12 conditional jumps only go forward
+        return None
+    if name == "JUMP_BACKWARD" and name not in opmap:
+        name = "JUMP_ABSOLUTE"
+    return opmap.get(name)
+
+
+def retarget(inst, op, label):
+    inst._op = op
+    inst._arg = label
+    inst.caches = CACHE_ENTRIES.get(op, 0)
+
+
+def thread_jumps(insts):
+    # a jump landing on an unconditional jump goes straight to where that
+    # one goes
+    where = {}
+    # the first instruction from each label on
+    landing = {}
+    following = None
+    for i in range(len(insts) - 1, -1, -1):
+        inst = insts[i]
+        if isinstance(inst, Instruction):
+            following = inst
+        elif isinstance(inst, Label):
+            where[inst] = i
+            landing[inst] = following
+
+    final = {}
+    def destination(label):
+        # the end of the chain of jumps from label, shared by every label
+        # on the way
+        path = {}
+        while label not in final:
+            target = landing[label]
+            if target is None or target._op not in JUMPS or label in path:
+                final[label] = label
+                break
+            path[label] = None
+            label = target._arg
+        for passed in path:
+            final[passed] = final[label]
+        return final[label]
+
+    changed = False
+    for i, inst in enumerate(insts):
+        if not isinstance(inst, Instruction) or inst._op not in BRANCHES:
+            continue
+        label = destination(inst._arg)
+        if label is inst._arg:
+            continue
+        op = redirected(inst._op, where[label] > i)
+        if op is not None:
+            retarget(inst, op, label)
+            changed = True
+    return changed
+
+
+def remove_dead_code(insts):
+    # after an unconditional transfer, code is only reached through a
+    # label something jumps to. a jump to the label right after it goes
+    # nowhere, and labels nothing jumps to are dropped
+    targets = {inst._arg for inst in insts if isinstance(inst, Instruction) and inst._op in hasjump}
+    kept = []
+    last = None
+    live = True
+    for inst in insts:
+        if isinstance(inst, Label):
+            if inst not in targets:
+                continue
+            if last is not None and kept[last]._op in JUMPS and kept[last]._arg is inst:
+                del kept[last]
+                last = None
+            live = True
+        elif isinstance(inst, Instruction):
+            if not live:
+                continue
+            live = inst._op not in _no_fallthrough
+            last = len(kept)
+        kept.append(inst)
+    changed = len(kept) != len(insts)
+    insts[:] = kept
+    return changed
+
+
+def shape(inst):
+    if type(inst) is Instruction and inst._op in SHAPES:
+        arg, shape = SHAPES[inst._op]
+        if arg is None or inst._arg == arg:
+            return shape
+    return None
+
+
+# shapes of consecutive instructions, and which of them are kept, by the
+# last shape
+SHUFFLES = {
+    "pop": [(("dup", "pop"), ()), (("push", "pop"), ()), (("swap", "pop", "pop"), (1, 2))],
+    "swap": [(("swap", "swap"), ())],
+}
+
+
+def remove_shuffles(insts):
+    # stack shuffles which undo each other
+    kept = []
+    shapes = []
+    for inst in insts:
+        last = shape(inst)
+        kept.append(inst)
+        shapes.append(last)
+        for pattern, keep in SHUFFLES.get(last, ()):
+            n = len(pattern)
+            if tuple(shapes[-n:]) == pattern:
+                window = kept[-n:]
+                del kept[-n:], shapes[-n:]
+                for i in keep:
+                    kept.append(window[i])
+                    shapes.append(pattern[i])
+                break
+    changed = len(kept) != len(insts)
+    insts[:] = kept
+    return changed
+
+
+PASSES = (thread_jumps, remove_dead_code, remove_shuffles)
+
+
+def optimize(insts, passes=PASSES):
+    # until no pass changes anything
+    changed = True
+    while changed:
+        changed = False
+        for p in passes:
+            changed |= p(insts)
+    return insts
@@ -0,0 +1,445 @@
+import sys
+import ast as py
+import builtins
+from .visit import Visitor
+from .symbol import Global, Free, Local, Store
+from .codegen import tailcall_args
+from . import ast
+
+# the value being matched, when it is not a plain name
+TEMP = ".t"
+# set before breaking out of loops to make a tail call
+TAIL = ".tail"
+# the value of a case statement
+SUBJECT = ".s"
+
+
+if sys.version_info >= (3, 9):
+    def index(value):
+        return value
+else:
+    index = py.Index
+
+
+def Name(id, ctx=py.Load):
+    return py.Name(id=id, ctx=ctx())
+
+
+def Not(test):
+    return py.UnaryOp(op=py.Not(), operand=test)
+
+
+def And(tests):
+    if len(tests) == 1:
+        return tests[0]
+    return py.BoolOp(op=py.And(), values=tests)
+
+
+def Compare(left, op, right):
+    return py.Compare(left=left, ops=[op()], comparators=[right])
+
+
+def Call(func, args, keywords=()):
+    return py.Call(func=func, args=list(args), keywords=list(keywords))
+
+
+def Assign(target, value):
+    return py.Assign(targets=[target], value=value)
+
+
+def If(test, body, orelse=()):
+    return py.If(test=test, body=body or [py.Pass()], orelse=list(orelse))
+
+
+def set_end_lineno(node):
+    # a statement ends on the last line of its body
+    end = getattr(node, "lineno", 0)
+    for child in py.iter_child_nodes(node):
+        end = max(end, set_end_lineno(child))
+    if "end_lineno" in node._attributes:
+        node.end_lineno = end
+        node.end_col_offset = 0
+    return end
+
+
+def make(cls, **fields):
+    # fields added by later versions
+    for name in ("posonlyargs", "type_params", "type_ignores"):
+        if name in cls._fields:
+            fields.setdefault(name, [])
+    return cls(**fields)
+
+
+class PyastVisitor(Visitor):
+    """lowers the tree to the standard ast module, and leaves code
+    generation to the built-in compile()
+    """
+
+    function = None
+    loops = 0
+    tail = False
+    looptail = False
+    params = frozenset()
+    cache_imports = True
+
+    def identifier(self, symbol):
+        while isinstance(symbol, Free):
+            symbol = symbol.parent
+        if isinstance(symbol, Global):
+            return symbol.name
+        if symbol not in self.idents:
+            # a let in python rebinds, here it is a new variable
+            name = symbol.name
+            n = self.counts.get(name, 0)
+            self.counts[name] = n + 1
+            self.idents[symbol] = f"{name}.{n}" if n else name
+        return self.idents[symbol]
+
+    def load(self, symbol):
+        if isinstance(symbol, Global) and symbol.name in self.params:
+            # hidden by an argument of the same name
+            return py.Subscript(
+                value=Call(Name(".globals"), []),
+                slice=index(py.Constant(value=symbol.name)),
+                ctx=py.Load())
+        return Name(self.identifier(symbol))
+
+    def store(self, symbol):
+        if isinstance(symbol, Global):
+            self.globals.add(symbol.name)
+        return Name(self.identifier(symbol), py.Store)
+
+    def visit_body(self, body):
+        stmts = []
+        for subnode in body:
+            if isinstance(subnode, ast.Expression):
+                new = [py.Expr(value=self.visit(subnode))]
+            else:
+                new = self.visit(subnode)
+            for stmt in new:
+                for pynode in py.walk(stmt):
+                    if "lineno" in pynode._attributes and not hasattr(pynode, "lineno"):
+                        pynode.lineno = subnode.lineno
+                        pynode.col_offset = 0
+            stmts.extend(new)
+        return stmts
+
+    @_(ast.File)
+    def visit(self, node):
+        self.idents = {}
+        self.counts = {}
+        self.globals = set()
+        body = []
+        if self.cache_imports:
+            # nothing is imported until it is used
+            for symbol in node.caches:
+                stmt = Assign(self.store(symbol), py.Constant(value=None))
+                for pynode in py.walk(stmt):
+                    if "lineno" in pynode._attributes:
+                        pynode.lineno = node.lineno
+                        pynode.col_offset = 0
+                body.append(stmt)
+        body.extend(self.visit_body(node.body))
+        if self.globals:
+            body.insert(0, py.Global(names=sorted(self.globals), lineno=node.lineno, col_offset=0))
+        module = make(py.Module, body=body)
+        set_end_lineno(module)
+        return builtins.compile(module, self.filename, "exec", dont_inherit=True)
+
+    @_(ast.If)
+    def visit(self, node):
+        if isinstance(node.test, ast.Match):
+            prelude, test, binds, get = self.visit_match(node.test.pattern, self.visit(node.test.value))
+            return prelude + [
+                If(test or py.Constant(value=True),
+                   binds + self.visit_body(node.body),
+                   self.visit_body(node.orelse))]
+        return [If(self.visit(node.test), self.visit_body(node.body), self.visit_body(node.orelse))]
+
+    @_(ast.Case)
+    def visit(self, node):
+        # the arms are tried one after another
+        orelse = self.visit_body(node.orelse)
+        for arm in reversed(node.arms):
+            prelude, test, binds, get = self.visit_match(arm.pattern, Name(SUBJECT))
+            orelse = prelude + [
+                If(test or py.Constant(value=True),
+                   binds + self.visit_body(arm.body),
+                   orelse)]
+        return [Assign(Name(SUBJECT, py.Store), self.visit(node.value))] + orelse
+
+    def visit_loop(self, body):
+        # a tail call inside loops breaks out of each of them
+        looptail, self.looptail = self.looptail, False
+        self.loops += 1
+        body = self.visit_body(body)
+        self.loops -= 1
+        after = []
+        if self.looptail:
+            after.append(If(Name(TAIL), [py.Break() if self.loops else py.Continue()]))
+        self.looptail = looptail or self.looptail
+        return body or [py.Pass()], after
+
+    @_(ast.For)
+    def visit(self, node):
+        it = self.visit(node.iter)
+        pattern = node.pattern
+        if isinstance(pattern, ast.NamePattern) and pattern.ctx is Store:
+            target = self.store(pattern.symbol)
+            head = []
+        else:
+            # items not matching the pattern are skipped
+            target = Name(TEMP, py.Store)
+            prelude, test, binds, get = self.visit_match(pattern, Name(TEMP))
+            head = [If(Not(test), [py.Continue()])] + binds
+        body, after = self.visit_loop(node.body)
+        return [py.For(target=target, iter=it, body=head + body, orelse=[])] + after
+
+    @_(ast.While)
+    def visit(self, node):
+        if isinstance(node.test, ast.Match):
+            prelude, test, binds, get = self.visit_match(node.test.pattern, self.visit(node.test.value))
+            head = prelude
+            if test is not None:
+                head.append(If(Not(test), [py.Break()]))
+            head.extend(binds)
+            test = py.Constant(value=True)
+        else:
+            head = []
+            test = self.visit(node.test)
+        body, after = self.visit_loop(node.body)
+        return [py.While(test=test, body=head + body, orelse=[])] + after
+
+    @_(ast.Return)
+    def visit(self, node):
+        args = None
+        if self.function is not None:
+            function, cellnames = self.function
+            args = tailcall_args(function, cellnames, node.value)
+        if args is None:
+            return [py.Return(value=self.visit(node.value))]
+
+        # rebind the arguments and start over
+        self.tail = True
+        targets = [Name(pat.arg, py.Store) for pat, value in args]
+        values = [self.visit(value) for pat, value in args]
+        if len(args) == 1:
+            stmts = [Assign(targets[0], values[0])]
+        elif args:
+            stmts = [Assign(py.Tuple(elts=targets, ctx=py.Store()), py.Tuple(elts=values, ctx=py.Load()))]
+        else:
+            stmts = []
+        if self.loops:
+            self.looptail = True
+            return stmts + [Assign(Name(TAIL, py.Store), py.Constant(value=True)), py.Break()]
+        return stmts + [py.Continue()]
+
+    def visit_arguments(self, node):
+        args = node.args
+        patterns = [(pat.value, pat.arg) for pat in args.args]
+        if args.vararg is not None:
+            patterns.append((args.vararg, "*"))
+        patterns.extend((pat.value, pat.arg) for pat in args.kwonlyargs)
+        if args.kwarg is not None:
+            patterns.append((args.kwarg, "**"))
+
+        checks, binds, bound = [], [], {}
+        for pattern, name in patterns:
+            self.visit_pattern(pattern, lambda name=name: Name(name), checks, binds, bound)
+        if not checks:
+            return binds
+
+        value = py.Tuple(elts=[Name(pat.arg) for pat in args.args], ctx=py.Load())
+        if args.vararg is not None:
+            value.elts.append(py.Starred(value=Name("*"), ctx=py.Load()))
+        keys = [py.Constant(value=pat.arg) for pat in args.kwonlyargs]
+        values = [Name(pat.arg) for pat in args.kwonlyargs]
+        if args.kwarg is not None:
+            keys.append(None)
+            values.append(Name("**"))
+        if keys:
+            value = py.Tuple(elts=[value, py.Dict(keys=keys, values=values)], ctx=py.Load())
+        exc = py.Raise(exc=Call(self.load(node.exc), [value]), cause=None)
+        return [If(Not(And(checks)), [exc])] + binds
+
+    @_(ast.Function)
+    def visit(self, node):
+        args = node.args
+        defaults = [self.visit(pat.default) for pat in args.args if pat.default is not None]
+        kw_defaults = [
+            None if pat.default is None else self.visit(pat.default)
+            for pat in args.kwonlyargs]
+        names = {pat.arg for pat in args.args + args.kwonlyargs} | {"*", "**"}
+
+        saved = self.function, self.loops, self.tail, self.looptail, self.params
+        cellnames = any(isinstance(s, Local) and s.is_referenced for s in node.symtable.symbols)
+        self.function = node, cellnames
+        self.loops = 0
+        self.tail = self.looptail = False
+        self.params = self.params | names
+
+        body = self.visit_arguments(node) + self.visit_body(node.body)
+        if self.tail:
+            if self.looptail:
+                body.insert(0, Assign(Name(TAIL, py.Store), py.Constant(value=False)))
+            body = [py.While(test=py.Constant(value=True), body=body + [py.Return(value=None)], orelse=[])]
+        self.function, self.loops, self.tail, self.looptail, self.params = saved
+
+        arguments = make(
+            py.arguments,
+            args=[py.arg(arg=pat.arg, annotation=None) for pat in args.args],
+            vararg=None if args.vararg is None else py.arg(arg="*", annotation=None),
+            kwonlyargs=[py.arg(arg=pat.arg, annotation=None) for pat in args.kwonlyargs],
+            kw_defaults=kw_defaults,
+            kwarg=None if args.kwarg is None else py.arg(arg="**", annotation=None),
+            defaults=defaults)
+        return [make(
+            py.FunctionDef,
+            name=self.store(node.name.symbol).id,
+            args=arguments,
+            body=body or [py.Pass()],
+            decorator_list=[],
+            returns=None)]
+
+    def visit_elts(self, elts):
+        return [
+            py.Starred(value=self.visit(e.value), ctx=py.Load()) if isinstance(e, ast.Unpack) else self.visit(e)
+            for e in elts]
+
+    @_(ast.Tuple)
+    def visit(self, node):
+        return py.Tuple(elts=self.visit_elts(node.elts), ctx=py.Load())
+
+    @_(ast.List)
+    def visit(self, node):
+        return py.List(elts=self.visit_elts(node.elts), ctx=py.Load())
+
+    @_(ast.Set)
+    def visit(self, node):
+        return py.Set(elts=self.visit_elts(node.elts))
+
+    @_(ast.Call)
+    def visit(self, node):
+        return Call(
+            self.visit(node.func),
+            self.visit_elts(node.args),
+            [py.keyword(arg=None if isinstance(arg, ast.Unpack) else arg.arg, value=self.visit(arg.value))
+             for arg in node.keywords])
+
+    def visit_import(self, node, fromlist):
+        return Call(self.load(Global("__import__")), [
+            py.Constant(value=".".join(node.path)),
+            Call(Name(".globals"), []) if node.level else py.Constant(value=None),
+            py.Constant(value=None),
+            py.Constant(value=fromlist),
+            py.Constant(value=node.level)])
+
+    @_(ast.ModuleAttribute)
+    def visit(self, node):
+        value = py.Attribute(
+            value=self.visit_import(node.value, (node.identifier,)),
+            attr=node.identifier,
+            ctx=py.Load())
+        if not self.cache_imports:
+            return value
+        # imported where it is first run, then kept in a global. it is
+        # stored through globals() as a function can't assign it
+        cache = self.load(node.cache)
+        store = Call(
+            py.Attribute(value=Call(Name(".globals"), []), attr="__setitem__", ctx=py.Load()),
+            [py.Constant(value=node.cache.name), value])
+        return py.IfExp(
+            test=Compare(cache, py.IsNot, py.Constant(value=None)),
+            body=self.load(node.cache),
+            orelse=py.BoolOp(op=py.Or(), values=[store, self.load(node.cache)]))
+
+    @_(ast.Module)
+    def visit(self, node):
+        return self.visit_import(node, None)
+
+    @_(ast.Attribute)
+    def visit(self, node):
+        return py.Attribute(value=self.visit(node.value), attr=node.identifier, ctx=py.Load())
+
+    @_(ast.Subscript)
+    def visit(self, node):
+        return py.Subscript(value=self.visit(node.value), slice=index(self.visit(node.slice)), ctx=py.Load())
+
+    @_(ast.Literal)
+    def visit(self, node):
+        return py.Constant(value=node.value)
+
+    @_(ast.Name)
+    def visit(self, node):
+        return self.load(node.symbol)
+
+    @_(ast.Match)
+    def visit(self, node):
+        prelude, test, binds, get = self.visit_match(node.pattern, self.visit(node.value), True)
+        if test is None:
+            return prelude + binds
+        exc = py.Raise(exc=Call(self.load(node.exc), [get()]), cause=None)
+        return prelude + [If(Not(test), [exc])] + binds
+
+    def visit_match(self, pattern, value, raises=False):
+        # returns (prelude, test, binds, get), where test is None if the
+        # pattern always matches, and get() gives the value again
+        if isinstance(pattern, ast.NamePattern) and pattern.ctx is Store:
+            return [], None, [Assign(self.store(pattern.symbol), value)], None
+
+        prelude = []
+        if isinstance(value, py.Name):
+            get = lambda: Name(value.id)
+        elif not raises and isinstance(pattern, (ast.LiteralPattern, ast.NamePattern)):
+            # only used once
+            get = lambda: value
+        else:
+            prelude.append(Assign(Name(TEMP, py.Store), value))
+            get = lambda: Name(TEMP)
+
+        checks, binds, bound = [], [], {}
+        self.visit_pattern(pattern, get, checks, binds, bound)
+        return prelude, And(checks) if checks else None, binds, get
+
+    @_(ast.LiteralPattern)
+    def visit_pattern(self, node, get, checks, binds, bound):
+        checks.append(Compare(py.Constant(value=node.value), py.Eq, get()))
+
+    @_(ast.NamePattern)
+    def visit_pattern(self, node, get, checks, binds, bound):
+        name = self.identifier(node.symbol)
+        if node.ctx is Store:
+            binds.append(Assign(self.store(node.symbol), get()))
+            bound[name] = get
+        elif name in bound:
+            # bound earlier in the same pattern, not assigned yet
+            checks.append(Compare(bound[name](), py.Eq, get()))
+        else:
+            checks.append(Compare(self.load(node.symbol), py.Eq, get()))
+
+    @_(ast.TuplePattern, ast.ListPattern)
+    def visit_pattern(self, node, get, checks, binds, bound):
+        star = [i for i, e in enumerate(node.elts) if isinstance(e, ast.UnpackPattern)]
+        n = len(node.elts)
+
+        checks.append(Call(self.load(node.isinstance), [get(), self.load(node.type)]))
+        checks.append(Compare(
+            Call(self.load(node.len), [get()]),
+            py.GtE if star else py.Eq,
+            py.Constant(value=n - len(star))))
+        for i, elt in enumerate(node.elts):
+            if isinstance(elt, ast.UnpackPattern):
+                # a list, as unpacking gives
+                def item(i=i):
+                    s = py.Slice(
+                        lower=py.Constant(value=i) if i else None,
+                        upper=py.Constant(value=i + 1 - n) if i + 1 < n else None,
+                        step=None)
+                    return py.List(
+                        elts=[py.Starred(value=py.Subscript(value=get(), slice=s, ctx=py.Load()), ctx=py.Load())],
+                        ctx=py.Load())
+                elt = elt.value
+            else:
+                def item(k=i - n if star and i > star[0] else i):
+                    return py.Subscript(value=get(), slice=index(py.Constant(value=k)), ctx=py.Load())
+            self.visit_pattern(elt, item, checks, binds, bound)
@@ -0,0 +1,149 @@
+import re
+from array import array
+from sly.lex import Token
+from .error import Error
+from .parse import Lexer, strip_lines
+
+# type codes index TYPES
+TYPES = tuple(sorted(Lexer.tokens)) + tuple(sorted(Lexer.literals))
+CODES = {name: code for code, name in enumerate(TYPES)}
+KEYWORDS = {value: CODES[name] for value, name in Lexer._remapping["NAME"].items()}
+STRINGS = {CODES["STRING"], CODES["STRIP_STRING"]}
+
+# what the lexer ignores, and the comments it matches and then ignores.
+# a comment runs to the end of the line, so that a token can't be
+# found inside one when the match backtracks
+IGNORE = f"(?:[{re.escape(Lexer.ignore)}\\n]|#[^\\n]*(?![^\\n]))*"
+SKIP = re.compile(IGNORE, Lexer.reflags)
+
+# the lexer's own patterns in its order, and then the literals it falls
+# back to, after what is skipped
+MASTER = re.compile(
+    f"{IGNORE}(?:{Lexer._master_re.pattern}|"
+    f"(?P<LITERAL>[{re.escape(''.join(sorted(Lexer.literals)))}]))",
+    Lexer.reflags)
+
+NAME, STRING, STRIP_STRING, LITERAL = (
+    MASTER.groupindex[name] for name in ("NAME", "STRING", "STRIP_STRING", "LITERAL"))
+IGNORED = {MASTER.groupindex[name] for name in Lexer._ignored_tokens}
+GROUPS = [None] * (MASTER.groups + 1)
+for name, group in MASTER.groupindex.items():
+    GROUPS[group] = CODES.get(name)
+
+
+class Tokens(Error):
+    # a compact token stream, where the values are only taken from the
+    # text when asked for
+
+    def __init__(self, filename, text):
+        self.filename = filename
+        self.text = text
+        self.types = array('B')
+        self.starts = array('l')
+        self.ends = array('l')
+        self.lines = array('l')
+        # where the scan stopped at a bad character
+        self.bad = None
+
+    def __len__(self):
+        return len(self.types)
+
+    def value(self, i):
+        start = self.starts[i]
+        end = self.ends[i]
+        if self.types[i] in STRINGS:
+            width = self.text.index("[", start) + 1 - start
+            value = self.text[start+width:end-width]
+            if self.types[i] == CODES["STRIP_STRING"]:
+                return value.strip()
+            return strip_lines(value) if width > 2 else value
+        return self.text[start:end]
+
+    def __iter__(self):
+        # the tokens the lexer would have produced
+        text = self.text
+        for i, (code, start, end, lineno) in enumerate(zip(self.types, self.starts, self.ends, self.lines)):
+            tok = Token()
+            tok.type = TYPES[code]
+            tok.value = self.value(i) if code in STRINGS else text[start:end]
+            tok.lineno = lineno
+            tok.index = start
+            tok.end = end
+            yield tok
+        self.check()
+
+    def check(self):
+        # the lexer's error, once the tokens before it are used up
+        if self.bad is not None:
+            tok = Token()
+            tok.lineno, tok.index = self.bad
+            self.error(tok, f"Bad character {self.text[tok.index]!r}")
+
+
+class Scanner:
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def scan(self, text, lineno=1, index=0):
+        tokens = Tokens(self.filename, text)
+        types = tokens.types.append
+        starts = tokens.starts.append
+        ends = tokens.ends.append
+        lines = tokens.lines.append
+        match = MASTER.match
+        count = text.count
+        closers = {}
+        length = len(text)
+
+        while True:
+            m = match(text, index)
+            if m is None:
+                skip = SKIP.match(text, index).end()
+                if skip < length:
+                    tokens.bad = (lineno + count('\n', index, skip), skip)
+                break
+            group = m.lastindex
+            start, end = m.span(group)
+            lineno += count('\n', index, start)
+            if group == NAME:
+                code = KEYWORDS.get(text[start:end], GROUPS[NAME])
+            elif group == LITERAL:
+                code = CODES[text[start]]
+            elif group in IGNORED:
+                # only when no token follows what is skipped
+                lineno += count('\n', start, end)
+                index = end
+                continue
+            elif group == STRING or group == STRIP_STRING:
+                # same search as Lexer.find_closer
+                closer = ']' + text[start+1:end-1] + '}'
+                first, close = closers.get(closer, (None, None))
+                if first is None or first > end or 0 <= close < end:
+                    first = end
+                    close = text.find(closer, first)
+                    closers[closer] = (first, close)
+                if close < 0:
+                    # not a string, rescan from "{"
+                    code = CODES['{']
+                    end = start + 1
+                else:
+                    code = GROUPS[group]
+                    types(code)
+                    starts(start)
+                    ends(close + len(closer))
+                    lines(lineno)
+                    lineno += count('\n', end, close)
+                    index = close + len(closer)
+                    continue
+            else:
+                code = GROUPS[group]
+            types(code)
+            starts(start)
+            ends(end)
+            lines(lineno)
+            index = end
+        return tokens
+
+    def tokenize(self, text, lineno=1, index=0):
+        return iter(self.scan(text, lineno, index))
@@ -1,144 +1,189 @@
 from .visit import Visitor
-from .symbol import Symbol, SymbolTable, BlockScope, Local, Global, Load, Store
-from . import ast
+from .symbol import Symbol, SymbolTable, BlockScope, Local, Load, Store
+from . import ast, decision
 
 class ScopeVisitor(Visitor):
 
+    scopes = None
+    caches = None
+    tables = None
+
     @_(list)
     def visit(self, node, symtable):
         for subnode in node:
-            yield from self.visit(subnode, symtable)
+            yield self.visit(subnode, symtable)
 
     @_(ast.File)
     def visit(self, node, symtable):
-        scopes = list(self.visit(node.body, symtable))
+        self.scopes = scopes = []
+        self.caches = caches = {}
+        self.tables = tables = {}
+        yield from self.visit(node.body, symtable)
         for scope in scopes:
-            self.visit_scope(scope, symtable)
+            yield self.visit_scope(scope, symtable)
         node.symtable = symtable
+        node.caches = [symtable.get_global(name) for name in caches]
+        node.tables = [symtable.get_global(name) for name in tables]
 
     @_(ast.If)
     def visit(self, node, symtable):
         with BlockScope(symtable, 2) as (symtable1, symtable2):
-            yield from self.visit(node.test, symtable1)
+            with symtable1:
+                yield self.visit(node.test, symtable1)
+                yield from self.visit(node.body, symtable1)
+            with symtable2:
+                yield from self.visit(node.orelse, symtable2)
+
+    @_(ast.For)
+    def visit(self, node, symtable):
+        yield self.visit(node.iter, symtable)
+        with BlockScope(symtable, 1) as (symtable1,), symtable1:
+            yield self.visit(node.pattern, symtable1)
+            yield from self.visit(node.body, symtable1)
+
+    @_(ast.Case)
+    def visit(self, node, symtable):
+        yield self.visit(node.value, symtable)
+        with BlockScope(symtable, len(node.arms) + 1) as symtables:
+            for arm, symtable1 in zip(node.arms, symtables):
+                with symtable1:
+                    yield self.visit(arm.pattern, symtable1)
+                    yield from self.visit(arm.body, symtable1)
+            with symtables[-1]:
+                yield from self.visit(node.orelse, symtables[-1])
+
+        node.tree, paths, switches = decision.build([arm.pattern for arm in node.arms])
+        # a table is named after its keys, so code run in the same globals
+        # shares it rather than finding another one there
+        for switch in switches:
+            name = "_case{!r}".format(tuple(value for value, tree in switch.cases))
+            switch.table = symtable.get_global(name)
+            self.tables[name] = None
+        # the values the tree looks at are kept in locals no name can spell
+        function = symtable.function
+        node.temps = []
+        for _ in range(paths + 1):
+            symbol = Local(f".{len(function.symbols)}")
+            function.symbols.append(symbol)
+            node.temps.append(symbol)
+        node.found = node.temps.pop()
+        node.case = symtable.get_global(".case")
+
+    @_(ast.While)
+    def visit(self, node, symtable):
+        with BlockScope(symtable, 1) as (symtable1,), symtable1:
+            yield self.visit(node.test, symtable1)
             yield from self.visit(node.body, symtable1)
-            yield from self.visit(node.orelse, symtable2)
 
     @_(ast.Return)
     def visit(self, node, symtable):
-        yield from self.visit(node.value, symtable)
+        yield self.visit(node.value, symtable)
 
     @_(ast.Arguments)
     def visit(self, node, symtable):
         for pat in node.args:
-            yield from self.visit(pat.value, symtable)
+            yield self.visit(pat.value, symtable)
         if node.vararg is not None:
-            yield from self.visit(node.vararg, symtable)
+            yield self.visit(node.vararg, symtable)
         for pat in node.kwonlyargs:
-            yield from self.visit(pat.value, symtable)
+            yield self.visit(pat.value, symtable)
         if node.kwarg is not None:
-            yield from self.visit(node.kwarg, symtable)
+            yield self.visit(node.kwarg, symtable)
 
     @_(ast.Function)
     def visit(self, node, symtable):
         for pat in node.args.args:
-            if getattr(pat, 'default', None) is not None:
-                yield from self.visit(pat.default, symtable)
+            if pat.default is not None:
+                yield self.visit(pat.default, symtable)
         for pat in node.args.kwonlyargs:
-            if getattr(pat, 'default', None) is not None:
-                yield from self.visit(pat.default, symtable)
+            if pat.default is not None:
+                yield self.visit(pat.default, symtable)
 
         self.visit_new(node.name, symtable)
-        yield node
+        # visited once the enclosing scope has seen all of its names
+        self.scopes.append(node)
 
     @_(ast.Call)
     def visit(self, node, symtable):
-        yield from self.visit(node.func, symtable)
+        yield self.visit(node.func, symtable)
         yield from self.visit(node.args, symtable)
         yield from self.visit(node.keywords, symtable)
 
     @_(ast.Module)
     def visit(self, node, symtable):
         node.slot = symtable.get_name_slot(".".join(node.path))
-        if False:
-            yield
 
     @_(ast.ModuleAttribute)
     def visit(self, node, symtable):
-        yield from self.visit(node.value, symtable)
+        yield self.visit(node.value, symtable)
         node.slot = symtable.get_name_slot(node.identifier)
+        # not a name the language can spell, and left out of import *
+        name = "_{}{}->{}".format("." * node.value.level, ".".join(node.value.path), node.identifier)
+        node.cache = symtable.get_global(name)
+        self.caches[name] = None
 
     @_(ast.Literal)
     def visit(self, node, symtable):
-        if False:
-            yield
+        pass
 
     @_(ast.Name)
     def visit(self, node, symtable):
         node.symbol = symtable[node.s]
-        if False:
-            yield
 
     @_(ast.Attribute)
     def visit(self, node, symtable):
-        yield from self.visit(node.value, symtable)
+        yield self.visit(node.value, symtable)
         node.slot = symtable.get_name_slot(node.identifier)
 
     @_(ast.Subscript)
     def visit(self, node, symtable):
-        yield from self.visit(node.value, symtable)
-        yield from self.visit(node.slice, symtable)
+        yield self.visit(node.value, symtable)
+        yield self.visit(node.slice, symtable)
 
     @_(ast.Tuple, ast.List, ast.Set)
     def visit(self, node, symtable):
         for e in node.elts:
-            yield from self.visit(e, symtable)
+            yield self.visit(e, symtable)
 
-    @_(ast.Keyword)
+    @_(ast.Keyword, ast.Unpack)
     def visit(self, node, symtable):
-        yield from self.visit(node.value, symtable)
+        yield self.visit(node.value, symtable)
 
     @_(ast.Match)
     def visit(self, node, symtable):
-        node.slot = symtable.get_name_slot("__umatch__")
         node.exc = symtable.get_global(".MatchException")
-        yield from self.visit(node.pattern, symtable)
-        yield from self.visit(node.value, symtable)
+        yield self.visit(node.pattern, symtable)
+        yield self.visit(node.value, symtable)
 
     @_(ast.LiteralPattern)
     def visit(self, node, symtable):
-        node.pat = symtable.get_global(".value")
-        if False:
-            yield
+        pass
+
+    @_(ast.TuplePattern, ast.ListPattern)
+    def visit(self, node, symtable):
+        node.isinstance = symtable.get_global(".isinstance")
+        node.len = symtable.get_global(".len")
+        node.type = symtable.get_global(
+            ".tuple" if isinstance(node, ast.TuplePattern) else ".list")
+        stars = [e for e in node.elts if isinstance(e, ast.UnpackPattern)]
+        if len(stars) > 1:
+            self.error(stars[1], "multiple starred patterns")
+        yield from self.visit(node.elts, symtable)
+
+    @_(ast.UnpackPattern)
+    def visit(self, node, symtable):
+        yield self.visit(node.value, symtable)
 
     @_(ast.NamePattern)
     def visit(self, node, symtable):
         if node.s in symtable:
             node.ctx = Load
             node.symbol = symtable[node.s]
-
-            if isinstance(node.symbol, Global):
-                node.pat = symtable.get_global(".gvar")
-                node.globals = symtable.get_global(".globals")
-            elif isinstance(node.symbol, Local):
-                node.pat = symtable.get_global(".var")
-                node.symbol.is_referenced = True
-            else:
-                node.pat = symtable.get_global(".value")
-                return
         else:
             node.ctx = Store
             node.symbol = symtable.declare(node.s)
             symtable[node.s] = node.symbol
 
-            if isinstance(node.symbol, Global):
-                node.pat = symtable.get_global(".gnew")
-                node.globals = symtable.get_global(".globals")
-            else:
-                node.pat = symtable.get_global(".new")
-                node.symbol.is_referenced = True
-
-        if False:
-            yield
 
     @_(ast.Name)
     def visit_new(self, node, symtable):
@@ -148,10 +193,9 @@ class ScopeVisitor(Visitor):
     @_(ast.Function)
     def visit_scope(self, node, symtable):
         node.symtable = SymbolTable(symtable)
-        node.slot = node.symtable.get_name_slot("__umatch__")
         node.exc = node.symtable.get_global(".MatchException")
 
-        scopes = []
+        self.scopes = scopes = []
         for pat in node.args.args:
             pat.symbol = Local(pat.arg)
             node.symtable.symbols.append(pat.symbol)
@@ -167,7 +211,7 @@ class ScopeVisitor(Visitor):
             node.symtable.symbols.append(symbol)
             node.kwarg = symbol
 
-        scopes.extend(self.visit(node.args, node.symtable))
-        scopes.extend(self.visit(node.body, node.symtable))
+        yield self.visit(node.args, node.symtable)
+        yield from self.visit(node.body, node.symtable)
         for scope in scopes:
-            self.visit_scope(scope, symtable)
+            yield self.visit_scope(scope, node.symtable)
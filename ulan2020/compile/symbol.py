@@ -1,6 +1,8 @@
+from bisect import bisect_right
 from contextlib import contextmanager
 from enum import Enum, auto
 from functools import reduce
+from .bytecode import Pool
 
 class Context(Enum):
     Load = auto()
@@ -21,6 +23,9 @@ class Global(Symbol):
     def __eq__(self, other):
         return other.__class__ is Global and self.name == other.name
 
+    def __hash__(self):
+        return hash(self.name)
+
 
 class Free(Symbol):
 
@@ -31,26 +36,59 @@ class Free(Symbol):
     def __eq__(self, other):
         return other.__class__ is Free and self.name == other.name and self.parent == other.parent
 
+    def __hash__(self):
+        return hash((self.name, self.parent))
+
 
 class Local(Symbol):
     is_referenced = False
 
 
 class SymbolTable:
+    # table maps a name to its symbol and the scope it was bound in, as the
+    # depth and serial number of that scope on the stack of open blocks and
+    # branches. serials only grow, so the scopes still open from where a
+    # name was bound are those on the stack with a serial up to its own,
+    # and nothing is copied when a block is left. Nested functions are
+    # visited after the body, when every block of the function is closed
 
     def __init__(self, parent=None):
         self.parent = parent
-        self.names = []
+        self.function = self
+        self.names = Pool()
         self.table = {}
         self.symbols = []
+        # the function, then blocks and branches in turn
+        self.serials = [0]
+        self.serial = 0
+
+    def push(self):
+        self.serial += 1
+        self.serials.append(self.serial)
+
+    def pop(self):
+        self.serials.pop()
+
+    def find(self, name):
+        # how deep the stack is still the one name was bound in, None if
+        # the name is not in table. at an even depth, a branch or the
+        # function, the name is visible. at an odd depth it was bound in
+        # another branch of the block there, and is not visible yet
+        entry = self.table.get(name)
+        if entry is None:
+            return None
+        symbol, depth, serial = entry
+        serials = self.serials
+        if depth < len(serials) and serials[depth] == serial:
+            return depth
+        return bisect_right(serials, serial) - 1
+
+    def visible(self, name):
+        depth = self.find(name)
+        return depth is not None and depth % 2 == 0
 
     def get_name_slot(self, name):
-        try:
-            return self.names.index(name)
-        except ValueError:
-            slot = len(self.names)
-            self.names.append(name)
-            return slot
+        return self.names.add(name)
 
     def get_global(self, name):
         symbol = Global(name)
@@ -58,26 +96,39 @@ class SymbolTable:
         return symbol
 
     def __contains__(self, name):
-        if name in self.table:
-            return True
-        if self.parent:
-            return name in self.parent
+        table = self
+        while table is not None:
+            if table.visible(name):
+                return True
+            table = table.parent
         return False
 
     def __getitem__(self, name):
-        if name in self.table:
-            return self.table[name]
-
-        if self.parent is not None:
-            if name in self.parent:
-                symbol = self.parent[name]
+        if self.visible(name):
+            return self.table[name][0]
+
+        # the enclosing functions not defining name, innermost first
+        functions = [self]
+        table = self.parent
+        while table is not None and not table.visible(name):
+            functions.append(table)
+            table = table.parent
+        if table is None:
+            raise KeyError(name)
+
+        symbol = table.table[name][0]
+        for table in reversed(functions):
+            if isinstance(symbol, Global):
+                symbol = table.get_global(name)
+            else:
+                # only variables closed over by a nested function
+                # become cells, the rest stay in fast slots
                 if isinstance(symbol, Local):
                     symbol.is_referenced = True
                 symbol = Free(name, symbol)
-                self.symbols.append(symbol)
-                self.table[name] = symbol
-                return symbol
-        raise KeyError(name)
+                table.symbols.append(symbol)
+            table.table[name] = symbol, 0, 0
+        return symbol
 
     def declare(self, name):
         if self.parent is not None:
@@ -88,18 +139,18 @@ class SymbolTable:
         return symbol
 
     def __setitem__(self, name, symbol):
+        # bound in the innermost scope open
         assert name not in self
-        self.table[name] = symbol
+        self.table[name] = symbol, len(self.serials) - 1, self.serials[-1]
 
     def get_slots(self):
         varnames = []
         freenames = []
         cellnames = []
-        freevars = []
+        freevars = Pool()
         for symbol in self.symbols:
             if isinstance(symbol, Free):
-                if symbol not in freevars:
-                    freevars.append(symbol)
+                freevars.add(symbol)
             elif isinstance(symbol, Local):
                 if symbol.is_referenced:
                     slot = len(cellnames)
@@ -111,68 +162,77 @@ class SymbolTable:
 
         for symbol in self.symbols:
             if isinstance(symbol, Free):
-                symbol.slot = len(cellvars) + freevars.index(symbol)
+                symbol.slot = len(cellnames) + freevars.add(symbol)
 
         return tuple(self.names), tuple(varnames), tuple(symbol.name for symbol in freevars), tuple(cellnames), tuple(freevars)
 
 
 class BlockSymbolTable:
+    # one branch of a block, entered with `with` while it is visited
 
     def __init__(self, parent):
         self.parent = parent
-        self.table = {}
+        self.function = parent.function
 
     def get_name_slot(self, name):
-        return self.parent.get_name_slot(name)
+        return self.function.get_name_slot(name)
 
     def get_global(self, name):
-        return self.parent.get_global(name)
+        return self.function.get_global(name)
 
     def __contains__(self, name):
-        if name in self.table:
-            return True
-        return name in self.parent
+        return name in self.function
 
     def __getitem__(self, name):
-        if name in self.table:
-            return self.table[name]
-        return self.parent[name]
+        return self.function[name]
 
     def declare(self, name):
-        return self.parent.declare(name)
+        return declare(self, name)
 
     def __setitem__(self, name, symbol):
-        assert name not in self
-        self.table[name] = symbol
+        self.function[name] = symbol
+
+    def __enter__(self):
+        self.function.push()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.function.pop()
+
+
+def declare(table, name):
+    # a name bound in another branch of a block still open is the same
+    # variable, which is visible once the block is left
+    function = table.function
+    if function.find(name):
+        return function.table[name][0]
+    return function.declare(name)
+
 
 class BlockScope:
     def __init__(self, parent, n):
         self.parent = parent
-        self.table = {}
+        self.function = parent.function
         self.children = tuple(BlockSymbolTable(self) for _ in range(n))
 
     def get_name_slot(self, name):
-        return self.parent.get_name_slot(name)
+        return self.function.get_name_slot(name)
 
     def get_global(self, name):
-        return self.parent.get_global(name)
+        return self.function.get_global(name)
 
     def __contains__(self, name):
-        return name in self.parent
+        return name in self.function
 
     def __getitem__(self, name):
-        return self.parent[name]
+        return self.function[name]
 
     def declare(self, name):
-        if name in self.table:
-            return self.table[name]
-        symbol = self.parent.declare(name)
-        self.table[name] = symbol
-        return symbol
+        return declare(self, name)
 
     def __enter__(self):
+        self.function.push()
         return self.children
 
     def __exit__(self, exc_type, exc_value, traceback):
-        for key in self.table:
-            self.parent[key] = self.table[key]
+        self.function.pop()
@@ -0,0 +1,79 @@
+import os
+import hashlib
+import importlib
+import sly
+from sly.yacc import LRTable
+
+TABVERSION = 1
+
+
+class Table:
+
+    def __init__(self, lr_action, lr_goto, defaulted_states):
+        self.lr_action = lr_action
+        self.lr_goto = lr_goto
+        self.defaulted_states = defaulted_states
+
+
+def signature(grammar):
+    h = hashlib.sha256()
+    h.update(f"sly {sly.__version__}\ntabversion {TABVERSION}\n".encode())
+    h.update(f"start {grammar.Start}\n".encode())
+    h.update(" ".join(sorted(grammar.Terminals)).encode())
+    for p in grammar.Productions:
+        h.update(f"\n{p}".encode())
+    return h.hexdigest()
+
+
+def read(module, sig):
+    try:
+        tab = importlib.import_module(module)
+    except ImportError:
+        return None
+    if getattr(tab, "_tabversion", None) != TABVERSION:
+        return None
+    if getattr(tab, "_signature", None) != sig:
+        return None
+    return Table(tab._lr_action, tab._lr_goto, tab._defaulted_states)
+
+
+def iter_table(name, table):
+    yield f"{name} = {{\n"
+    for key in sorted(table):
+        yield f"    {key!r}: {table[key]!r},\n"
+    yield "}\n"
+
+
+def write(filename, sig, table):
+    tmpname = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(tmpname, "w") as f:
+            f.write("# generated by ulan2020.compile.table, do not edit\n")
+            f.write(f"_tabversion = {TABVERSION!r}\n")
+            f.write(f"_signature = {sig!r}\n")
+            f.writelines(iter_table("_lr_action", table.lr_action))
+            f.writelines(iter_table("_lr_goto", table.lr_goto))
+            f.writelines(iter_table("_defaulted_states", table.defaulted_states))
+        os.replace(tmpname, filename)
+    except OSError:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+        raise
+
+
+def load(grammar, module, filename, log):
+    sig = signature(grammar)
+    table = read(module, sig)
+    if table is not None:
+        return table
+
+    table = LRTable(grammar)
+    if table.sr_conflicts:
+        log.warning('%d shift/reduce conflicts', len(table.sr_conflicts))
+    if table.rr_conflicts:
+        log.warning('%d reduce/reduce conflicts', len(table.rr_conflicts))
+    try:
+        write(filename, sig, table)
+    except OSError:
+        pass
+    return table
@@ -1,11 +1,80 @@
+from types import GeneratorType
 from .error import Error
 
 class MatchDescriptor(dict):
 
+    def __set_name__(self, owner, name):
+        self.name = name
+
     def __get__(self, instance, owner):
-        def wrapper(node, *args, **kwargs):
-            return self[type(node)](instance, node, *args, **kwargs)
-        return wrapper
+        if instance is None:
+            return self
+        # bind every function once, and keep the dispatcher on the instance
+        table = {t: func.__get__(instance, owner) for t, func in self.items()}
+
+        def dispatch(node, *args):
+            try:
+                method = table[type(node)]
+            except KeyError:
+                method = table[type(node)] = lookup(table, type(node))
+            result = method(node, *args)
+            if type(result) is GeneratorType and not instance.walking:
+                instance.walking = True
+                try:
+                    return walk(result)
+                finally:
+                    instance.walking = False
+            return result
+
+        instance.__dict__[self.name] = dispatch
+        return dispatch
+
+def walk(visit):
+    # a method written as a generator yields the visits of its children
+    # and is sent back their results, so the children are run from here
+    # and the python stack stays flat however deep the tree is
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    value = error = None
+    while True:
+        try:
+            if error is None:
+                child = visit.send(value)
+            else:
+                child, error = visit.throw(error), None
+            while type(child) is not GeneratorType:
+                # a child which was not a generator has finished already
+                child = visit.send(child)
+        except StopIteration as e:
+            if not stack:
+                return e.value
+            visit = pop()
+            value, error = e.value, None
+            continue
+        except BaseException as e:
+            if not stack:
+                raise
+            visit = pop()
+            error = e
+            continue
+        push(visit)
+        visit = child
+        value = None
+
+def each(visits):
+    # the results of visits in order, delegated to with yield from
+    results = []
+    for visit in visits:
+        results.append((yield visit))
+    return results
+
+def lookup(table, t):
+    # the closest registered base class of the node
+    for base in t.__mro__[1:]:
+        if base in table:
+            return table[base]
+    raise KeyError(t)
 
 class VisitorMetaDict(dict):
     def __setitem__(self, name, value):
@@ -27,11 +96,19 @@ class VisitorMeta(type):
 
     def __new__(self, name, bases, attrs):
         attrs.pop("_")
+        for key, value in attrs.items():
+            if isinstance(value, MatchDescriptor):
+                # inherit what the base classes match and this one doesn't
+                for base in bases:
+                    inherited = getattr(base, key, None)
+                    if isinstance(inherited, MatchDescriptor):
+                        for t, func in inherited.items():
+                            value.setdefault(t, func)
         return type.__new__(self, name, bases, attrs)
 
 class Visitor(Error, metaclass=VisitorMeta):
+    walking = False
 
     def __init__(self, filename, text):
         self.filename = filename
         self.text = text
-
@@ -0,0 +1,49 @@
+import sys
+from importlib.machinery import (
+    FileFinder, SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader,
+    SOURCE_SUFFIXES, BYTECODE_SUFFIXES, EXTENSION_SUFFIXES)
+from importlib.util import decode_source
+from . import compile, exec
+from .cache import cache_from_source, load, store
+
+SUFFIX = ".ul"
+
+
+class Loader(SourceFileLoader):
+
+    def source_to_code(self, data, path):
+        return compile(decode_source(data), path)
+
+    def get_code(self, fullname):
+        # same as SourceLoader.get_code, except that the cache is keyed by
+        # compiler version and source hash, and foo.ul is cached as
+        # __pycache__/foo.ul.<tag>.pyc so that it never clashes with foo.py
+        path = self.get_filename(fullname)
+        data = self.get_data(path)
+        cachename = cache_from_source(path)
+        code = load(cachename, data, path)
+        if code is None:
+            code = self.source_to_code(data, path)
+            if not sys.dont_write_bytecode:
+                store(cachename, data, code)
+        return code
+
+    def exec_module(self, module):
+        exec(self.get_code(module.__name__), module.__dict__)
+
+
+# foo.ul comes before foo.py in the same directory, and the directories
+# are searched in sys.path order, with their listings cached as usual
+path_hook = FileFinder.path_hook(
+    (Loader, [SUFFIX]),
+    (ExtensionFileLoader, EXTENSION_SUFFIXES),
+    (SourceFileLoader, SOURCE_SUFFIXES),
+    (SourcelessFileLoader, BYTECODE_SUFFIXES))
+
+
+def install():
+    if path_hook in sys.path_hooks:
+        return
+    sys.path_hooks.insert(0, path_hook)
+    # finders made before would not know about .ul
+    sys.path_importer_cache.clear()
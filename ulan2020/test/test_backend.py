@@ -0,0 +1,308 @@
+import sys
+import dis
+import unittest
+from types import CodeType
+from .. import compile, MatchException
+from ..compile.asm import ASSEMBLERS, get_assembler
+from ..compile.bytecode import Pool, constant_key
+from ..compile.peephole import PASSES
+from ..compile import cfg
+from ..compile.bytecode import Instruction, Label
+from .test_lang import run
+
+
+def iter_code(code):
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from iter_code(const)
+
+
+SOURCE = """
+let t = (1, *[2, 3], 4);
+let l = [*(1,), 2];
+let s = {1, *[2]};
+let m = ::max(1, *[5, 2]);
+let d = ::dict(a: 1, **::dict(b: 2), c: 3);
+def outer(x):
+  let y = x;
+  def inner(z): return (y, z); end
+  return inner;
+end
+let c = outer(1)(2);
+def count(n, acc=0):
+  if let 0 = n: return acc; end
+  return count(::int->__sub__(n, 1), acc: ::int->__add__(acc, 1));
+end
+let total = count(1000);
+def pairs(rows):
+  let out = [];
+  for let (k, 1) in rows: out->append(k); end
+  return out;
+end
+let p = pairs([(1, 1), (2, 0), [3, 1], (4, 1)]);
+"""
+
+
+class BackendTest(unittest.TestCase):
+
+    def test_selected(self):
+        self.assertIs(get_assembler(), ASSEMBLERS[sys.version_info[:2]])
+        with self.assertRaises(RuntimeError):
+            get_assembler((2, 7))
+
+    def test_run(self):
+        d = run(SOURCE)
+        self.assertEqual(d["t"], (1, 2, 3, 4))
+        self.assertEqual(d["l"], [1, 2])
+        self.assertEqual(d["s"], {1, 2})
+        self.assertEqual(d["m"], 5)
+        self.assertEqual(d["d"], {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(d["c"], (1, 2))
+        self.assertEqual(d["total"], 1000)
+        self.assertEqual(d["p"], [1, 4])
+        self.assertEqual(d["outer"].__qualname__, "outer")
+
+    def test_disassemble(self):
+        # every opcode is known to the running interpreter, and every jump
+        # lands on an instruction
+        for code in iter_code(compile(SOURCE, "<stdin>")):
+            with self.subTest(code.co_name):
+                insts = list(dis.get_instructions(code))
+                offsets = {inst.offset for inst in insts}
+                for inst in insts:
+                    self.assertIn(inst.opname, dis.opmap)
+                    if inst.opcode in dis.hasjrel or inst.opcode in dis.hasjabs:
+                        self.assertIn(inst.argval, offsets)
+                list(dis.findlinestarts(code))
+
+    def test_extended_arg(self):
+        body = "".join(f"  let x{i} = a;\n" for i in range(300))
+        f = run(f"def f(a):\n  if let 1 = a:\n{body}  return 1; end\n  return 2;\nend\n")["f"]
+        self.assertEqual([f(1), f(0)], [1, 2])
+
+    def test_constant_pool(self):
+        pool = Pool(constant_key)
+        values = [1, 1.0, True, 0.0, -0.0, (1,), (1.0,), "a", None]
+        self.assertEqual([pool.add(v) for v in values], list(range(len(values))))
+        self.assertEqual([pool.add(v) for v in values], list(range(len(values))))
+        code = compile("let t = (1, {[a]}, 1, {[a]});", "<stdin>", fold=False)
+        self.assertEqual(code.co_consts.count(1), 1)
+        self.assertEqual(run("let t = (1, {[a]}, 1, {[a]});")["t"], (1, "a", 1, "a"))
+        self.assertEqual(run("let t = (100000000000000000000,);")["t"], (10 ** 20,))
+
+
+LOOP_SOURCE = """
+def f(rows):
+  let out = [];
+  for let x in rows:
+    if let 0 = x: out->append(0);
+    else if let (k, 1) = x: out->append(k);
+    else if let [k] = x: while k: return k; end
+    end
+  end
+  return out;
+end
+let r = f([0, (2, 1), (3, 0), 4, 0, [0]]);
+let s = f([[5]]);
+"""
+
+UNCONDITIONAL = {"JUMP_FORWARD", "JUMP_ABSOLUTE", "JUMP_BACKWARD"}
+NO_FALLTHROUGH = UNCONDITIONAL | {"RETURN_VALUE", "RETURN_CONST", "RAISE_VARARGS"}
+
+
+class PeepholeTest(unittest.TestCase):
+
+    def test_run(self):
+        for source in (SOURCE, LOOP_SOURCE):
+            d = run(source, peephole=False)
+            values = {k: v for k, v in run(source).items() if not callable(v)}
+            self.assertEqual(values, {k: v for k, v in d.items() if not callable(v)})
+        self.assertEqual((d["r"], d["s"]), ([0, 2, 0], 5))
+
+    def test_jumps(self):
+        # no jump lands on an unconditional jump, and every instruction
+        # is reached
+        for code in iter_code(compile(SOURCE + LOOP_SOURCE, "<stdin>")):
+            with self.subTest(code.co_name):
+                insts = list(dis.get_instructions(code))
+                at = {inst.offset: inst for inst in insts}
+                reached = set()
+                todo = [0]
+                while todo:
+                    offset = todo.pop()
+                    if offset in reached:
+                        continue
+                    reached.add(offset)
+                    inst = at[offset]
+                    if inst.opcode in dis.hasjrel or inst.opcode in dis.hasjabs:
+                        todo.append(inst.argval)
+                        target = at[inst.argval]
+                        if target.opname in UNCONDITIONAL:
+                            # since 3.12 conditional jumps only go forward
+                            self.assertTrue(inst.opname.startswith("POP_JUMP") and target.argval < inst.offset)
+                    if inst.opname not in NO_FALLTHROUGH:
+                        todo.append(insts[insts.index(inst) + 1].offset)
+                self.assertEqual(reached, set(at))
+
+    def test_shuffles(self):
+        def build(passes):
+            asm = get_assembler()(passes)
+            asm.LOAD_FAST(0)
+            asm.LOAD_CONST(1)
+            asm.DUP_TOP()
+            asm.POP_TOP()
+            asm.ROT_TWO()
+            asm.ROT_TWO()
+            asm.ROT_TWO()
+            asm.POP_TOP()
+            asm.POP_TOP()
+            code = asm.build(1, 0, 0, (), ("a",), "<stdin>", "f", 1, (), ())
+            return [inst.opname for inst in dis.get_instructions(code) if inst.opname not in ("RESUME", "CACHE")]
+        self.assertEqual(len(build(())), 11)
+        names = build(PASSES)
+        self.assertTrue(names[0].startswith("LOAD_FAST"))
+        self.assertEqual(names[1:], ["POP_TOP", "LOAD_CONST", "RETURN_VALUE"])
+
+
+# only 3.11 names the direction of a conditional jump
+POP_JUMP_IF_FALSE = "POP_JUMP_FORWARD_IF_FALSE" if "POP_JUMP_FORWARD_IF_FALSE" in dis.opmap else "POP_JUMP_IF_FALSE"
+
+
+def inst(name, arg=0):
+    return Instruction(dis.opmap[name], arg)
+
+
+class BlockTest(unittest.TestCase):
+
+    def test_build(self):
+        label, dead = Label(), Label()
+        insts = [
+            inst("LOAD_FAST", 0), inst(POP_JUMP_IF_FALSE, label),
+            inst("LOAD_CONST", 1), inst("RETURN_VALUE"),
+            inst("LOAD_CONST", 2), dead, inst("POP_TOP"),
+            label, inst("LOAD_CONST", 3), inst("LOAD_CONST", 4), inst("BUILD_TUPLE", 2), inst("RETURN_VALUE")]
+        blocks = cfg.build(insts)
+        self.assertEqual([len(block.insts) for block in blocks], [2, 2, 1, 1, 4])
+        entry, then, unlabelled, unreached, orelse = blocks
+        self.assertEqual(entry.successors, [then, orelse])
+        self.assertEqual(then.successors, [])
+        self.assertEqual(unlabelled.successors, [unreached])
+        self.assertEqual(cfg.flatten(blocks), insts)
+
+        self.assertTrue(cfg.prune_unreachable(blocks))
+        self.assertEqual(blocks, [entry, then, orelse])
+        self.assertFalse(cfg.merge_blocks(blocks))
+        # the deeper path counts
+        self.assertEqual(cfg.max_stacksize(blocks), 2)
+
+    def test_merge(self):
+        middle, end = Label(), Label()
+        insts = [
+            inst("LOAD_CONST", 1), inst("JUMP_FORWARD", middle),
+            middle, inst("LOAD_CONST", 2), inst("BUILD_TUPLE", 2),
+            end, inst("RETURN_VALUE")]
+        blocks = cfg.optimize(cfg.build(insts))
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual([dis.opname[i._op] for i in blocks[0].insts], ["LOAD_CONST", "LOAD_CONST", "BUILD_TUPLE", "RETURN_VALUE"])
+        self.assertEqual(cfg.max_stacksize(blocks), 2)
+
+    def test_dead_stores(self):
+        source = "def f(rows):\n  for let (k, 1) in rows: end\n  let [a] = rows; return a;\nend\n"
+        for code in iter_code(compile(source, "<stdin>")):
+            stored = {inst.argval for inst in dis.get_instructions(code) if inst.opname == "STORE_FAST"}
+            self.assertNotIn("$k", stored)
+        f = run(source)["f"]
+        self.assertEqual(f([[1]]), [1])
+        with self.assertRaises(MatchException):
+            f([(1, 1), (1, 1)])
+
+
+FOLD_SOURCE = """
+let t = ((1, 2), {[a]}, (0,));
+def rows(): return [(1, 2), (3, 4), (5, 6)]; end
+let r = rows();
+let same = r->__eq__(rows());
+r->append(7);
+let fresh = rows();
+let s = {1, (2, 3), 4};
+let items = [];
+for let x in {5, 6}: items->append(x); end
+for let y in [7, 8, 9]: items->append(y); end
+let u = [0, *[1, 2], *{3}];
+"""
+
+
+class FoldTest(unittest.TestCase):
+
+    def test_run(self):
+        for backend in ("codegen", "pyast"):
+            with self.subTest(backend):
+                d = run(FOLD_SOURCE, backend=backend)
+                values = {k: v for k, v in d.items() if not callable(v)}
+                self.assertEqual(values, {k: v for k, v in run(FOLD_SOURCE, fold=False).items() if not callable(v)})
+        self.assertEqual(d["t"], ((1, 2), "a", (0,)))
+        self.assertTrue(d["same"])
+        self.assertEqual(d["fresh"], [(1, 2), (3, 4), (5, 6)])
+        self.assertIs(type(d["s"]), set)
+        self.assertEqual(sorted(d["items"]), [5, 6, 7, 8, 9])
+        self.assertEqual(d["u"], [0, 1, 2, 3])
+
+    def test_constants(self):
+        code = compile(FOLD_SOURCE, "<stdin>")
+        consts = [const for code in iter_code(code) for const in code.co_consts]
+        self.assertIn(((1, 2), "a", (0,)), consts)
+        self.assertIn(((1, 2), (3, 4), (5, 6)), consts)
+        self.assertIn(frozenset({1, (2, 3), 4}), consts)
+        self.assertIn(frozenset({5, 6}), consts)
+        self.assertIn((7, 8, 9), consts)
+        names = {inst.opname for inst in dis.get_instructions(code)}
+        self.assertNotIn("BUILD_TUPLE", names)
+
+    def test_deep(self):
+        # too deep a constant is built at run time
+        d = run("let x = " + "(" * 1000 + "1" + ",)" * 1000 + ";")
+        x = d["x"]
+        for _ in range(1000):
+            x, = x
+        self.assertEqual(x, 1)
+
+
+CASE_SOURCE = """
+def route(msg):
+  case msg
+  when ({[get]}, key): return (0, key);
+  when ({[put]}, key, value): return (1, key, value);
+  when ({[del]}, key): return (2, key);
+  when ({[get]}, key, default): return (3, key, default);
+  when [{[batch]}, *rest]: return (4, rest);
+  when {[ping]}: return 5;
+  when {[pong]}: return 6;
+  when {[stop]}: return 7;
+  when {[wait]}: return 8;
+  else: return 9;
+  end
+end
+"""
+
+MESSAGES = [
+    ("get", 1), ("put", 1, 2), ("del", 1), ("get", 1, 2), ["batch"], ["batch", 1, 2],
+    "ping", "pong", "stop", "wait", "nope", ("put", 1), ("batch",), [], 1]
+
+
+class CaseTest(unittest.TestCase):
+
+    def test_run(self):
+        routes = [run(CASE_SOURCE, backend=backend)["route"] for backend in ("codegen", "pyast")]
+        self.assertEqual(*[[route(msg) for msg in MESSAGES] for route in routes])
+
+    def test_tree(self):
+        code = compile(CASE_SOURCE, "<stdin>")
+        route, = [c for c in iter_code(code) if c.co_name == "route"]
+        loads = [inst.argval for inst in dis.get_instructions(route) if inst.opname == "LOAD_GLOBAL"]
+        # one test of each type and of each length, however many arms
+        # share it
+        self.assertEqual(loads.count(".isinstance"), 2)
+        self.assertEqual(loads.count(".len"), 3)
+        # the strings the subject may be are looked up, not compared
+        self.assertIn(("ping", "pong", "stop", "wait"), route.co_consts)
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+from tempfile import TemporaryDirectory
+from ..cache import cache_from_source, compile_file
+from .test_lang import run_code as run
+
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.filename = os.path.join(self.dir.name, "x.ul")
+        self.cachename = cache_from_source(self.filename)
+        self.dont_write_bytecode = sys.dont_write_bytecode
+        sys.dont_write_bytecode = False
+
+    def tearDown(self):
+        sys.dont_write_bytecode = self.dont_write_bytecode
+        self.dir.cleanup()
+
+    def write(self, source):
+        with open(self.filename, "w") as f:
+            f.write(source)
+
+    def test_cache(self):
+        self.write("let x = 1;")
+        code = compile_file(self.filename)
+        self.assertTrue(os.path.exists(self.cachename))
+        self.assertEqual(compile_file(self.filename), code)
+        self.assertEqual(run(compile_file(self.filename))["x"], 1)
+
+    def test_source_changed(self):
+        self.write("let x = 1;")
+        compile_file(self.filename)
+        self.write("let x = 2;")
+        self.assertEqual(run(compile_file(self.filename))["x"], 2)
+
+    def test_corrupted(self):
+        self.write("let x = 1;")
+        compile_file(self.filename)
+        with open(self.cachename, "r+b") as f:
+            f.truncate(30)
+        self.assertEqual(run(compile_file(self.filename))["x"], 1)
+
+    def test_no_cache(self):
+        self.write("let x = 1;")
+        compile_file(self.filename, use_cache=False)
+        self.assertFalse(os.path.exists(self.cachename))
+
+    def test_dont_write_bytecode(self):
+        self.write("let x = 1;")
+        sys.dont_write_bytecode = True
+        self.assertEqual(run(compile_file(self.filename))["x"], 1)
+        self.assertFalse(os.path.exists(self.cachename))
+
+    def test_rebuild(self):
+        self.write("let x = 1;")
+        compile_file(self.filename)
+        os.utime(self.cachename, ns=(0, 0))
+        compile_file(self.filename, rebuild=True)
+        self.assertNotEqual(os.stat(self.cachename).st_mtime_ns, 0)
@@ -0,0 +1,56 @@
+import unittest
+from .. import compile
+from .test_lang import run
+
+
+def depth(value):
+    n = 0
+    while isinstance(value, (list, tuple)):
+        value = value[0]
+        n += 1
+    return n
+
+
+class DeepTest(unittest.TestCase):
+    # far deeper than the python stack would allow a recursive compiler
+
+    def test_else_if_10k(self):
+        n = 10000
+        f = run(
+            "def f(a):\n  if let 0 = a: return 0;\n" +
+            "".join(f"  else if let {i} = a: let x = a; return x;\n" for i in range(1, n)) +
+            "  end\nend\n")["f"]
+        self.assertEqual([f(1), f(n - 1), f(n)], [1, n - 1, None])
+
+    def test_else_if_distinct_10k(self):
+        n = 10000
+        f = run(
+            "def f(a):\n  if let 0 = a: return 0;\n" +
+            "".join(f"  else if let {i} = a: let x{i} = a; return x{i};\n" for i in range(1, n)) +
+            "  end\nend\n")["f"]
+        self.assertEqual([f(1), f(n - 1), f(n)], [1, n - 1, None])
+
+    def test_nested_list_10k(self):
+        d = run("let x = " + "[" * 10000 + "1" + "]" * 10000 + ";")
+        self.assertEqual(depth(d["x"]), 10000)
+
+    def test_nested_list_100k(self):
+        d = run("let x = " + "[" * 100000 + "1" + "]" * 100000 + ";")
+        self.assertEqual(depth(d["x"]), 100000)
+
+    def test_nested_list_100k_descent(self):
+        d = run("let x = " + "[" * 100000 + "1" + "]" * 100000 + ";", parser="descent")
+        self.assertEqual(depth(d["x"]), 100000)
+
+    def test_nested_call_10k(self):
+        d = run("def f(y): return (y,); end let x = " + "f(" * 10000 + "1" + ")" * 10000 + ";")
+        self.assertEqual(depth(d["x"]), 10000)
+
+    def test_nested_pattern_10k(self):
+        d = run("let " + "[" * 10000 + "x" + "]" * 10000 + " = " + "[" * 10000 + "1" + "]" * 10000 + ";")
+        self.assertEqual(d["x"], 1)
+
+    def test_error_10k(self):
+        with self.assertRaises(SyntaxError) as cm:
+            compile("let x = " + "[" * 10000 + "\na::self::b" + "]" * 10000 + ";", "<stdin>")
+        self.assertEqual(cm.exception.lineno, 2)
@@ -0,0 +1,93 @@
+import os
+import sys
+import unittest
+import importlib
+from tempfile import TemporaryDirectory
+from ..cache import cache_from_source
+from .test_lang import run
+
+
+class ImportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        sys.path.insert(0, self.dir.name)
+        self.modules = set(sys.modules)
+        self.dont_write_bytecode = sys.dont_write_bytecode
+
+    def tearDown(self):
+        sys.dont_write_bytecode = self.dont_write_bytecode
+        for name in set(sys.modules) - self.modules:
+            del sys.modules[name]
+        sys.path.remove(self.dir.name)
+        importlib.invalidate_caches()
+        self.dir.cleanup()
+
+    def write(self, name, source):
+        filename = os.path.join(self.dir.name, name)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "w") as f:
+            f.write(source)
+        return filename
+
+    def test_module(self):
+        self.write("ul_foo.ul", "let x = 1;")
+        self.assertEqual(run("let x = ul_foo::x;")["x"], 1)
+        self.assertEqual(importlib.import_module("ul_foo").x, 1)
+
+    def test_package(self):
+        self.write("ul_pkg/__init__.ul", "let x = 1;")
+        self.write("ul_pkg/sub.ul", "let y = (self::x, self::mod::z);")
+        self.write("ul_pkg/mod.ul", "let z = 2;")
+        self.assertEqual(run("let y = ul_pkg::sub::y;")["y"], (1, 2))
+
+    def test_path_order(self):
+        # a .ul file later on sys.path doesn't hide a module before it
+        self.write("ul_first.py", "x = 'py'")
+        with TemporaryDirectory() as later:
+            with open(os.path.join(later, "ul_first.ul"), "w") as f:
+                f.write("let x = {[ul]};")
+            sys.path.append(later)
+            try:
+                self.assertEqual(importlib.import_module("ul_first").x, "py")
+            finally:
+                sys.path.remove(later)
+
+    def test_cache(self):
+        sys.dont_write_bytecode = False
+        filename = self.write("ul_bar.ul", "let x = 1;")
+        importlib.import_module("ul_bar")
+        self.assertTrue(os.path.exists(cache_from_source(filename)))
+
+    def test_first_use(self):
+        # a module attribute is imported where it is first run
+        f = run("def f(): return ul_later::x; end")["f"]
+        self.assertNotIn("ul_later", sys.modules)
+        with self.assertRaises(ImportError):
+            f()
+        self.write("ul_later.ul", "let x = 1;")
+        importlib.invalidate_caches()
+        self.assertEqual(f(), 1)
+
+    def test_imported_once(self):
+        self.write("ul_count.py", "lookups = 0\ndef __getattr__(name):\n    global lookups\n    lookups += 1\n    return name\n")
+        f = run("def f(): return ul_count::x; end")["f"]
+        self.assertEqual(f(), "x")
+        module = sys.modules["ul_count"]
+        lookups = module.lookups
+        self.assertEqual([f(), f()], ["x", "x"])
+        self.assertEqual(module.lookups, lookups)
+
+    def test_imported_once_pyast(self):
+        self.write("ul_count.py", "lookups = 0\ndef __getattr__(name):\n    global lookups\n    lookups += 1\n    return name\n")
+        for cache_imports in (True, False):
+            with self.subTest(cache_imports=cache_imports):
+                f = run("def f(): return ul_count::x; end", backend="pyast", cache_imports=cache_imports)["f"]
+                self.assertEqual(f(), "x")
+                module = sys.modules["ul_count"]
+                lookups = module.lookups
+                self.assertEqual([f(), f()], ["x", "x"])
+                if cache_imports:
+                    self.assertEqual(module.lookups, lookups)
+                else:
+                    self.assertGreater(module.lookups, lookups)
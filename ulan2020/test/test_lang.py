@@ -5,12 +5,14 @@ from io import StringIO
 from .. import compile, exec, MatchException
 
 
-def run(source):
-    code = compile(source, "<stdin>")
+def run_code(code):
     d = dict()
     exec(code, d)
     return d
 
+def run(source, **kwargs):
+    return run_code(compile(source, "<stdin>", **kwargs))
+
 @contextmanager
 def assert_prints_context(test_case, output):
     buf = StringIO()
@@ -49,6 +51,16 @@ class FileTest(TestCase):
         with self.assertRaises(MatchException):
             self.assertEqual(run("let x = 1; let x = 2;")["x"], 1)
 
+    def test_match_local(self):
+        f = run("def f(a): let x = a; let x = 1; return x; end")['f']
+        self.assertEqual(f(1), 1)
+        with self.assertRaises(MatchException):
+            f(2)
+
+    def test_if_return(self):
+        f = run("def f(a): if let 1 = a: return 1; else if let 2 = a: return 2; end return 0; end")['f']
+        self.assertEqual([f(1), f(2), f(3)], [1, 2, 0])
+
     def test_var_not_defined(self):
         with self.assertRaises(KeyError):
             run("x;")
@@ -60,6 +72,20 @@ class FileTest(TestCase):
         with self.assertPrints("2\n"):
             run("if let 2 = 1: ::print(1); else: ::print(2); end")
 
+    def test_if_branches(self):
+        # not visible to the other branch, and one variable after the if
+        f = run("def f(a): if let 1 = a: let x = 1; else: let x = 2; end return x; end")['f']
+        self.assertEqual([f(1), f(2)], [1, 2])
+        f = run("def f(a): if let 1 = a: let x = a; def g(): return x; end return g(); end return 0; end")['f']
+        self.assertEqual([f(1), f(2)], [1, 0])
+        # visible in the branch around the inner if once it is left
+        f = run(
+            "def f(a, b):"
+            " if let 1 = a: if let 1 = b: let x = 1; else: let x = 2; end let y = x;"
+            " else: let x = 3; let y = 0; end"
+            " return (x, y); end")['f']
+        self.assertEqual([f(1, 1), f(1, 2), f(2, 0)], [(1, 1), (2, 2), (3, 0)])
+
     def test_unsafe(self):
         with self.assertRaises(NameError):
             run("if let 1 = 2: let x = 2; end ::print(x);")
@@ -92,6 +118,119 @@ class FileTest(TestCase):
 
         self.assertEqual(run("def f(**kw): return kw; end")['f'](a=1), {"a":1})
 
+    def test_global(self):
+        self.assertEqual(run("let x = 1; def f(): return x; end")['f'](), 1)
+
+    def test_closure(self):
+        f = run("let z = 3; def f(a): let x = a; def g(): return (x, z); end return g; end")['f']
+        self.assertEqual(f(1)(), (1, 3))
+        self.assertEqual(f.__code__.co_cellvars, ('$x',))
+
+    def test_fast_locals(self):
+        f = run("def f(a): let x = a; let x = a; return x; end")['f']
+        self.assertEqual(f(1), 1)
+        self.assertEqual(f.__code__.co_cellvars, ())
+
+    def test_tailcall(self):
+        f = run(
+            "let sub = ::int->__sub__;"
+            "def f(n, acc=0): if let 0 = n: return acc; end return f(sub(n, 1), acc: n); end")['f']
+        self.assertEqual(f(100000), 1)
+
+        f = run(
+            "let sub = ::int->__sub__;"
+            "def f(n, *, k: 1): if let 0 = n: return 0; end return f(sub(n, 1), k: 2); end")['f']
+        with self.assertRaises(MatchException):
+            f(3, k=1)
+
+    def test_tailcall_closure(self):
+        f = run(
+            "let sub = ::int->__sub__;"
+            "def f(n, g): let x = n; def h(): return x; end"
+            " if let 0 = n: return g; end return f(sub(n, 1), h); end")['f']
+        self.assertEqual(f(2, None)(), 1)
+
+    def test_for(self):
+        with self.assertPrints("1\n2\n"):
+            run("for x in [1, 2]: ::print(x); end")
+        with self.assertPrints("1\n3\n"):
+            run("for let (k, 1) in [(1, 1), (2, 0), (3, 1), 4]: ::print(k); end")
+
+    def test_while(self):
+        f = run(
+            "def f(it): let out = [];"
+            " while let (1, x) = (1, ::next(it, 0)): if let 0 = x: return out; end out->append(x); end end")['f']
+        self.assertEqual(f(iter([1, 2])), [1, 2])
+
+    def test_sequence_pattern(self):
+        d = run("let (a, *b, c) = (1, 2, 3, 4); let [x, y] = [5, 6];")
+        self.assertEqual([d[k] for k in "abcxy"], [1, [2, 3], 4, 5, 6])
+        with self.assertRaises(MatchException):
+            run("let (a, b) = [1, 2];")
+        with self.assertRaises(MatchException):
+            run("let (a, 2) = (1, 3);")
+
+    def test_multiple_starred(self):
+        for source in ("let (a, *b, *c) = 1;", "let [*a, b, *c] = 1;", "def f(a: [b, *c, *d]): end"):
+            with self.subTest(source), self.assertRaises(SyntaxError) as cm:
+                compile(source, "<stdin>")
+            self.assertEqual(cm.exception.msg, "multiple starred patterns")
+
+    def test_case(self):
+        f = run(
+            "def f(x):"
+            " case x"
+            " when 1: return {[one]};"
+            " when (1, y): return y;"
+            " when [y, *z]: return z;"
+            " when (y, y): return {[pair]};"
+            " else: return {[other]};"
+            " end end")['f']
+        self.assertEqual(
+            [f(1), f(True), f((1, 2)), f([3, 4, 5]), f((6, 6)), f((6, 7)), f([]), f(2)],
+            ["one", "one", 2, [4, 5], "pair", "other", "other", "other"])
+
+    def test_case_order(self):
+        # the first arm matching is taken, and names bound before are
+        # compared, not bound
+        f = run(
+            "def f(x, n):"
+            " case x when (n, y): return (0, y); when (y, 2): return (1, y); when n: return 2; end"
+            " return 3; end")['f']
+        self.assertEqual([f((1, 2), 1), f((0, 2), 1), f(1, 1), f(0, 1)], [(0, 2), (1, 0), 2, 3])
+
+    def test_case_table(self):
+        class Three:
+            def __eq__(self, other):
+                return other == 3
+        f = run(
+            "def f(x): case x " + " ".join(f"when {i}: return {i};" for i in range(20)) +
+            " when {[a]}: return 20; else: return 21; end end")['f']
+        self.assertEqual([f(i) for i in range(20)], list(range(20)))
+        self.assertEqual([f("a"), f(2.0), f(Three()), f(None), f(20)], [20, 2, 3, 21, 21])
+        # the table is not a constant, so the code can still be hashed
+        hash(f.__code__)
+
+    def test_case_table_kept(self):
+        # the table is kept in the globals of the module, built where it
+        # is first used, and running the module again leaves no other one
+        source = "def f(x): case x " + " ".join(f"when {i}: return {i};" for i in range(4)) + " end end"
+        d = {}
+        for _ in range(200):
+            exec(compile(source, "<stdin>"), d)
+            self.assertEqual(d["f"](2), 2)
+            table, = [name for name in d if name.startswith("_case(")]
+            found = d[table]
+            self.assertEqual(d["f"](3), 3)
+            self.assertIs(d[table], found)
+        self.assertEqual(found, {0: 0, 1: 1, 2: 2, 3: 3})
+
+    def test_tailcall_loop(self):
+        f = run(
+            "let sub = ::int->__sub__;"
+            "def f(n): for x in [n]: if let 0 = x: return 0; end return f(sub(x, 1)); end end")['f']
+        self.assertEqual(f(100000), 0)
+
     def test_module(self):
         import builtins
         self.assertIs(run("let x = ::;")["x"], builtins)
@@ -1,5 +1,12 @@
 import unittest
-from ..compile.parse import Lexer, Parser, Node, File
+from functools import partial
+from unittest import mock
+from ..compile.parse import Lexer, Parser
+from ..compile.scan import Scanner, TYPES
+from ..compile.descent import DescentParser
+from ..compile.ast import Node, File
+from ..compile import table, ast, compile
+from . import test_backend, test_lang
 from typing import _GenericAlias, Union
 
 def check_type(node, ty):
@@ -37,6 +44,17 @@ def check_type(node, ty):
 
     return True
 
+def dump(node):
+    if isinstance(node, Node):
+        return (type(node).__name__, node.lineno, node.index) + tuple(
+            (key, dump(getattr(node, key))) for key in node._fields)
+    if isinstance(node, list):
+        return [dump(elem) for elem in node]
+    return node
+
+def descent_parse(text, filename=__file__):
+    return DescentParser(filename, text).parse(Scanner(filename).scan(text))
+
 class TestCase(unittest.TestCase):
 
     def parse(self, text, filename=__file__):
@@ -44,7 +62,78 @@ class TestCase(unittest.TestCase):
         parser = Parser(filename, text)
 
         with self.subTest(text):
-            self.assertTrue(check_type(parser.parse(lexer.tokenize(text)), File))
+            node = parser.parse(lexer.tokenize(text))
+            self.assertTrue(check_type(node, File))
+            # and the same tree from the other engine
+            self.assertEqual(dump(descent_parse(text, filename)), dump(node))
+
+
+class TableTest(unittest.TestCase):
+
+    def test_up_to_date(self):
+        from ..compile import parsetab
+        self.assertEqual(parsetab._tabversion, table.TABVERSION)
+        self.assertEqual(parsetab._signature, table.signature(Parser._grammar))
+
+
+class LexerTest(unittest.TestCase):
+
+    def tokens(self, text):
+        return [(t.type, t.value, t.lineno) for t in Lexer(__file__).tokenize(text)]
+
+    def test_string(self):
+        self.assertEqual(self.tokens("{[a]}"), [('STRING', 'a', 1)])
+        self.assertEqual(self.tokens("{[a]=}]}"), [('STRING', 'a]=}', 1)])
+        self.assertEqual(self.tokens("{=[\na\n]=}\nb"), [('STRING', 'a', 1), ('NAME', 'b', 4)])
+        self.assertEqual(self.tokens("{==[]=}]==}"), [('STRING', ']=}', 1)])
+
+    def test_strip_string(self):
+        self.assertEqual(self.tokens("{-[ a ]-}"), [('STRIP_STRING', 'a', 1)])
+        self.assertEqual(self.tokens("{--[\n]-}\n]--} b"), [('STRIP_STRING', ']-}', 1), ('NAME', 'b', 3)])
+
+    def test_unterminated_string(self):
+        self.assertEqual(
+            self.tokens("{[1]"),
+            [('{', '{', 1), ('[', '[', 1), ('DEC', '1', 1), (']', ']', 1)])
+        self.assertEqual(
+            self.tokens("{=[a]}"),
+            [('{', '{', 1), ('=', '=', 1), ('[', '[', 1), ('NAME', 'a', 1), (']', ']', 1), ('}', '}', 1)])
+
+
+class ScannerTest(LexerTest):
+    # the same tokens, from the compact stream
+
+    def tokens(self, text):
+        return [(t.type, t.value, t.lineno) for t in Scanner(__file__).tokenize(text)]
+
+    def test_same_as_lexer(self):
+        for text in (test_backend.SOURCE, "a # b\n\n{[1]}\t{-[ c ]-} {=[ d", "x $ y"):
+            with self.subTest(text):
+                self.assertEqual(self.all_tokens(Scanner, text), self.all_tokens(Lexer, text))
+
+    def all_tokens(self, lexer, text):
+        tokens = []
+        try:
+            for t in lexer(__file__).tokenize(text):
+                tokens.append((t.type, t.value, t.lineno, t.index, t.end))
+        except SyntaxError as e:
+            tokens.append(e.args)
+        return tokens
+
+    def test_arrays(self):
+        tokens = Scanner(__file__).scan("f({=[\n a\n]=},\nx)$")
+        self.assertEqual([TYPES[code] for code in tokens.types], ['NAME', '(', 'STRING', ',', 'NAME', ')'])
+        self.assertEqual(list(tokens.starts), [0, 1, 2, 12, 14, 15])
+        self.assertEqual(list(tokens.lines), [1, 1, 1, 3, 4, 4])
+        self.assertEqual([tokens.value(2), tokens.value(4)], [" a", "x"])
+        self.assertEqual(tokens.bad, (4, 16))
+
+    def test_compile(self):
+        self.assertEqual(
+            compile(test_backend.SOURCE, "<stdin>", lexer="scan").co_code,
+            compile(test_backend.SOURCE, "<stdin>").co_code)
+        with self.assertRaises(ValueError):
+            compile("let x = 1;", "<stdin>", lexer="re")
 
 
 class FileTest(TestCase):
@@ -52,6 +141,19 @@ class FileTest(TestCase):
     def test_shebang(self):
         self.parse("#!/usr/bin/env python3")
 
+    def test_slots(self):
+        text = "f(a:1);"
+        node = Parser(__file__, text).parse(Lexer(__file__).tokenize(text))
+        keyword = node.body[0].keywords[0]
+        self.assertFalse(hasattr(keyword, "__dict__"))
+        self.assertEqual((keyword.arg, keyword.value.value, keyword.lineno), ("a", 1, 1))
+
+    def test_self_not_allowed(self):
+        text = "x;\nf(a::self::b);"
+        with self.assertRaises(SyntaxError) as cm:
+            Parser(__file__, text).parse(Lexer(__file__).tokenize(text))
+        self.assertEqual((cm.exception.msg, cm.exception.lineno, cm.exception.offset), ("self not allowed", 2, 6))
+
 
 class StatementTest(TestCase):
 
@@ -63,6 +165,18 @@ class StatementTest(TestCase):
         self.parse("if 1: return 1; else: return 2; end")
         self.parse("if 1: return 1; else if 2: return 2; end")
 
+    def test_for(self):
+        self.parse("for x in y: f(x); end")
+        self.parse("for let (x, 1) in y: f(x); end")
+
+    def test_while(self):
+        self.parse("while 1: f(); end")
+        self.parse("while let x = f(): g(x); end")
+
+    def test_case(self):
+        self.parse("case x when 1: f(); end")
+        self.parse("case f(x) when (a, *b): g(a); when 2: when [3]: else: h(); end")
+
 
 class ExpressionTest(TestCase):
 
@@ -213,6 +327,8 @@ class PatternTest(TestCase):
         self.parse("let [*a] = 1;")
         self.parse("let [a, *a] = 1;")
         self.parse("let [a, *a, a, *a, a] = 1;")
+        self.parse("let [f(a=1)] = 1;")
+        self.parse("let [f(a=1), a] = 1;")
 
     def test_set(self):
         self.parse("let {/} = 1;")
@@ -229,6 +345,14 @@ class PatternTest(TestCase):
         self.parse("let {1: a, **b, 2:c} = 1;")
         self.parse("let {1: a=2} = 1;")
 
+    def test_split(self):
+        text = "let (a, [b]) = (a, [b]);"
+        match = Parser(__file__, text).parse(Lexer(__file__).tokenize(text)).body[0]
+        self.assertIsInstance(match.pattern, ast.TuplePattern)
+        self.assertIsInstance(match.pattern.elts[1], ast.ListPattern)
+        self.assertIsInstance(match.value, ast.Tuple)
+        self.assertIsInstance(match.value.elts[1], ast.List)
+
     def test_cons(self):
         self.parse("let std::int(x) = 1;")
         self.parse("let f() = 1;")
@@ -265,3 +389,66 @@ class SoftKeywordTest(TestCase):
         self.parse("let f{end:a=1} = 1;")
         self.parse("let f{end:f(a=1)=1} = 1;")
         self.parse("def f(end: a): end")
+
+
+class DescentTest(unittest.TestCase):
+
+    def outcome(self, parse, text):
+        try:
+            return dump(parse(text))
+        except SyntaxError as e:
+            return (e.msg, e.lineno, e.offset)
+        except EOFError:
+            return EOFError
+
+    def test_errors(self):
+        # the same error, at the same token
+        for text in (
+                "let x is y->z = 1;",
+                "let a->b = 1;",
+                "return x is y is z;",
+                "f(a=1);",
+                "let x = [a->b, f(y=1)];",
+                "let a is [x, f(y=1)] = 1;",
+                "let (a) = 1;",
+                "let (*a, b) = 1;",
+                "let x = (a, b,);",
+                "def f(a=1, b): end",
+                "def f(*a, *b): end",
+                "def f(**a, b): end",
+                "let {1: a->b = 2 .5} = 3;",
+                "let x = a::self:: 1;",
+                "x;\nf(a::self::b);",
+                "if x: else: else: end",
+                "case x end",
+                "case x else: end",
+                "case x when 1: else: when 2: end",
+                "a .f. b .g. c;",
+                "end",
+                "x $ y;",
+                "let x = [1,",
+                "f(a, b:1",
+                ):
+            with self.subTest(text):
+                self.assertEqual(
+                    self.outcome(descent_parse, text),
+                    self.outcome(lambda text: Parser(__file__, text).parse(Lexer(__file__).tokenize(text)), text))
+
+    def test_compile(self):
+        self.assertEqual(
+            compile(test_backend.SOURCE, "<stdin>", parser="descent").co_code,
+            compile(test_backend.SOURCE, "<stdin>").co_code)
+        with self.assertRaises(ValueError):
+            compile("let x = 1;", "<stdin>", parser="earley")
+
+
+run_descent = partial(test_lang.run, parser="descent")
+
+
+class DescentFileTest(test_lang.FileTest):
+    # the same programs, read by the descent parser
+
+    def setUp(self):
+        patcher = mock.patch.object(test_lang, "run", run_descent)
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -0,0 +1,47 @@
+import unittest
+from functools import partial
+from unittest import mock
+from .. import compile
+from . import test_lang, test_backend
+
+
+run = partial(test_lang.run, backend="pyast")
+
+
+class PyastFileTest(test_lang.FileTest):
+    # the same programs, lowered to python ast
+
+    def setUp(self):
+        patcher = mock.patch.object(test_lang, "run", run)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class PyastTest(unittest.TestCase):
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            compile("let x = 1;", "<stdin>", backend="llvm")
+
+    def test_backend_source(self):
+        d = run(test_backend.SOURCE)
+        self.assertEqual(d["t"], (1, 2, 3, 4))
+        self.assertEqual(d["l"], [1, 2])
+        self.assertEqual(d["s"], {1, 2})
+        self.assertEqual(d["m"], 5)
+        self.assertEqual(d["d"], {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(d["c"], (1, 2))
+        self.assertEqual(d["total"], 1000)
+        self.assertEqual(d["p"], [1, 4])
+
+    def test_global_hidden_by_argument(self):
+        f = run("let g = 2; def f(g, h=g): return (g, h); end")["f"]
+        self.assertEqual(f(2), (2, 2))
+        with self.assertRaises(test_lang.MatchException):
+            f(3)
+
+    def test_nested_pattern(self):
+        d = run("let (a, [b, *c], 3) = (1, [2], 3); let (x, x) = (4, 4);")
+        self.assertEqual([d[k] for k in "abcx"], [1, 2, [], 4])
+        with self.assertRaises(test_lang.MatchException):
+            run("let (x, x) = (4, 5);")
@@ -0,0 +1,76 @@
+import unittest
+from ..compile.visit import Visitor, each
+
+
+class Node:
+    pass
+
+class Leaf(Node):
+    pass
+
+class Base(Visitor):
+
+    @_(Node)
+    def visit(self, node):
+        return "node"
+
+    @_(int)
+    def visit(self, node):
+        return "int"
+
+class Derived(Base):
+
+    @_(Leaf)
+    def visit(self, node):
+        return "leaf"
+
+class Pair:
+    def __init__(self, *items):
+        self.items = items
+
+class Depth(Visitor):
+
+    @_(int)
+    def visit(self, node):
+        return 0
+
+    @_(Pair)
+    def visit(self, node):
+        if node.items == (-1,):
+            raise ValueError(node.items[0])
+        return 1 + max((yield from each(map(self.visit, node.items))))
+
+
+class VisitorTest(unittest.TestCase):
+
+    def test_subclass_of_node(self):
+        v = Base("<stdin>", "")
+        self.assertEqual(v.visit(Leaf()), "node")
+        self.assertEqual(v.visit(True), "int")
+        with self.assertRaises(KeyError):
+            v.visit("")
+
+    def test_inherited(self):
+        v = Derived("<stdin>", "")
+        self.assertEqual([v.visit(Leaf()), v.visit(Node()), v.visit(1)], ["leaf", "node", "int"])
+        self.assertEqual(Base("<stdin>", "").visit(Leaf()), "node")
+
+    def test_bound_once(self):
+        v = Base("<stdin>", "")
+        self.assertIs(v.visit, v.visit)
+
+    def test_walk_deep(self):
+        node = 0
+        for i in range(100000):
+            node = Pair(i, node)
+        self.assertEqual(Depth("<stdin>", "").visit(node), 100000)
+
+    def test_walk_error(self):
+        node = Pair(-1)
+        for i in range(10000):
+            node = Pair(node)
+        v = Depth("<stdin>", "")
+        with self.assertRaises(ValueError):
+            v.visit(node)
+        # not left walking after the error
+        self.assertEqual(v.visit(Pair(1, Pair(2))), 2)